@@ -0,0 +1,100 @@
+from fastapi import APIRouter, Response
+
+from ..db import pool_stats
+from ..metrics import Counter, Gauge, registry
+from ..security import password_pool
+from ..services import auth_cache
+from ..services.audit import audit_writer
+from ..services.email import email_dispatcher
+from ..services.evidence_store import dedup_metrics
+from ..services.revocation import revocations
+
+router = APIRouter()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _component(name: str, documentation: str, labelnames: tuple[str, ...], samples: list, counters: set[str]) -> list[Gauge | Counter]:
+    """Split a component's samples into `<name>_total` (monotonic fields, so `rate()` works) and a `<name>` gauge.
+
+    The last label of each sample is the field name.
+    """
+    metrics = []
+    for kind, suffix, monotonic in ((Gauge, "", False), (Counter, "_total", True)):
+        family = [(labels, value) for labels, value in samples if (labels[-1] in counters) is monotonic]
+        if family:
+            metric = kind(name + suffix, documentation, labelnames)
+            for labels, value in family:
+                metric.inc(*labels, amount=value)
+            metrics.append(metric)
+    return metrics
+
+
+def _fields(stats: dict) -> list:
+    return [((k,), v) for k, v in stats.items() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+
+
+def _component_metrics() -> list[Gauge | Counter]:
+    """Read the counters each component already keeps; built per scrape, nothing on the request path."""
+    hashing = password_pool.stats()
+    caches = auth_cache.stats()
+    return [
+        *_component(
+            "verifylk_password_pool",
+            "Password hashing pool state and counters",
+            ("field",),
+            [((k,), hashing[k]) for k in ("in_flight", "calls", "rejected", "workers", "queue_limit")],
+            {"calls", "rejected"},
+        ),
+        *_component(
+            "verifylk_auth_cache",
+            "Auth cache hits, misses and size",
+            ("cache", "field"),
+            [((cache, k), caches[cache][k]) for cache in caches for k in ("hits", "misses", "size")],
+            {"hits", "misses"},
+        ),
+        *_component(
+            "verifylk_db_pool",
+            "Connection pool checkouts, timeouts and occupancy",
+            ("field",),
+            _fields(pool_stats()),
+            {"checkouts", "checkout_timeouts"},
+        ),
+        *_component(
+            "verifylk_token_revocation",
+            "Refresh-token revocations, expired-row prunes and rejected replays",
+            ("field",),
+            _fields(revocations.stats()),
+            {"prunes", "revoked", "reuse_rejected"},
+        ),
+        *_component(
+            "verifylk_audit_writer",
+            "Audit writer queue and write counters",
+            ("field",),
+            _fields(audit_writer.stats()),
+            {"written", "dropped", "failed"},
+        ),
+        *_component(
+            "verifylk_email_dispatcher",
+            "Email dispatcher delivery counters",
+            ("field",),
+            [(("sent",), email_dispatcher.sent), (("retried",), email_dispatcher.retried), (("failed",), email_dispatcher.failed)],
+            {"sent", "retried", "failed"},
+        ),
+        *_component(
+            "verifylk_evidence_dedup",
+            "Evidence deduplication hits and bytes never transferred",
+            ("field",),
+            [
+                (("handshake_hits",), dedup_metrics.handshake_hits),
+                (("upload_hits",), dedup_metrics.upload_hits),
+                (("bytes_not_transferred",), dedup_metrics.bytes_not_transferred),
+            ],
+            {"handshake_hits", "upload_hits", "bytes_not_transferred"},
+        ),
+    ]
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(registry.render(_component_metrics()), media_type=CONTENT_TYPE)
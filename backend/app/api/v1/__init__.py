@@ -1,10 +1,14 @@
 from fastapi import APIRouter
 
-from .endpoints import auth, claims, health, reports, verifications
+from .endpoints import admin, auth, candidates, claims, evidence, health, reports, search, verifications
 
 router = APIRouter()
 router.include_router(health.router, prefix="/health", tags=["health"])
 router.include_router(auth.router, prefix="/auth", tags=["auth"])
 router.include_router(claims.router, prefix="/claims", tags=["claims"])
+router.include_router(evidence.router, prefix="/claims", tags=["evidence"])
 router.include_router(verifications.router, prefix="/verifications", tags=["verifications"])
+router.include_router(candidates.router, prefix="/candidates", tags=["candidates"])
+router.include_router(search.router, prefix="/search", tags=["search"])
 router.include_router(reports.router, prefix="/reports", tags=["reports"])
+router.include_router(admin.router, prefix="/admin", tags=["admin"])
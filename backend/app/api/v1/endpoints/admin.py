@@ -1,9 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ....dependencies import require_role
-from ....db import get_db
+from ....db import SessionLocal, get_db, pool_stats
 from ....models import Dispute, DisputeStatus, Organization, OrgStatus, User, UserRole
+from ....pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from ....repositories.audit import iter_audit_rows, recent_audit_logs
+from ....repositories.duplicates import recent_duplicate_flags
+from ....schemas.models import DuplicateFlagOut, RescoreReport
+from ....security import password_pool
+from ....services import auth_cache
+from ....services.audit import audit_writer, record_event
+from ....services.email import email_dispatcher
+from ....services.evidence_store import storage_stats
+from ....services.rescoring import DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE, last_rescore_report, rescore_lock, rescore_verified_claims
 
 router = APIRouter()
 
@@ -28,6 +42,7 @@ def verify_org(
     db.add(org)
     db.commit()
     db.refresh(org)
+    record_event("org.verification", "organization", org.id, actor_id=current_user.id, details={"status": org.verified_status.value})
     return {"id": org.id, "status": org.verified_status.value}
 
 
@@ -62,23 +77,153 @@ def decide_dispute(
     db.add(dispute)
     db.commit()
     db.refresh(dispute)
+    record_event(
+        "dispute.decision",
+        "dispute",
+        dispute.id,
+        actor_id=current_user.id,
+        details={"status": dispute.status.value, "claim_id": dispute.claim_id},
+    )
     return {"id": dispute.id, "status": dispute.status.value, "resolution_notes": dispute.resolution_notes}
 
 
-@router.get("/audit", response_model=list[dict], summary="List audit log entries (recent)")
-def list_audit(current_user: User = Depends(require_role(UserRole.admin)), db: Session = Depends(get_db)):
-    from ....models import AuditLog
+def _audit_entry(log) -> dict:
+    return {
+        "id": log.id,
+        "action": log.action,
+        "actor_id": log.actor_id,
+        "entity_type": log.entity_type,
+        "entity_id": log.entity_id,
+        "metadata": log.details,
+        "created_at": log.created_at,
+    }
 
-    logs = db.query(AuditLog).order_by(AuditLog.created_at.desc()).limit(50).all()
-    return [
-        {
-            "id": log.id,
-            "action": log.action,
-            "actor_id": log.actor_id,
-            "entity_type": log.entity_type,
-            "entity_id": log.entity_id,
-            "metadata": log.details,
-            "created_at": log.created_at,
-        }
-        for log in logs
-    ]
+
+def _audit_filters(
+    actor_id: str | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> dict:
+    return {"actor_id": actor_id, "entity_type": entity_type, "entity_id": entity_id, "since": since, "until": until}
+
+
+@router.get("/audit", response_model=list[dict], summary="List audit log entries, newest first (keyset-paginated)")
+def list_audit(
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    filters: dict = Depends(_audit_filters),
+    current_user: User = Depends(require_role(UserRole.admin)),
+    db: Session = Depends(get_db),
+):
+    try:
+        before = None
+        if cursor:
+            created_at, log_id = decode_cursor(cursor)
+            before = (created_at, int(log_id))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    logs = recent_audit_logs(db, limit=limit + 1, before=before, **filters)
+    if len(logs) > limit:
+        logs = logs[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(logs[-1].created_at, logs[-1].id)
+    return [_audit_entry(log) for log in logs]
+
+
+@router.get("/audit/export", summary="Stream audit log entries as NDJSON, oldest first")
+def export_audit(filters: dict = Depends(_audit_filters), current_user: User = Depends(require_role(UserRole.admin))):
+    def rows():
+        # The request-scoped session is closed before streaming starts, so the export owns its own.
+        db = SessionLocal()
+        try:
+            for row in iter_audit_rows(db, **filters):
+                yield json.dumps(_audit_entry(row), default=str) + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+@router.get("/duplicates", response_model=list[DuplicateFlagOut], summary="List near-duplicate claim flags, newest first")
+def list_duplicate_flags(
+    response: Response,
+    claim_id: str | None = None,
+    candidate_id: str | None = None,
+    min_similarity: float | None = Query(None, ge=0, le=1),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    current_user: User = Depends(require_role(UserRole.admin)),
+    db: Session = Depends(get_db),
+):
+    try:
+        before = None
+        if cursor:
+            created_at, flag_id = decode_cursor(cursor)
+            before = (created_at, int(flag_id))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    found = recent_duplicate_flags(
+        db, limit=limit + 1, before=before, claim_id=claim_id, candidate_id=candidate_id, min_similarity=min_similarity
+    )
+    if len(found) > limit:
+        found = found[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(found[-1].created_at, found[-1].id)
+    return found
+
+
+def _run_rescore(chunk_size: int):
+    db = SessionLocal()
+    try:
+        rescore_verified_claims(db, chunk_size=chunk_size)
+    finally:
+        db.close()
+        rescore_lock.release()
+
+
+@router.post("/rescore", status_code=status.HTTP_202_ACCEPTED, summary="Recompute scores for all verified claims")
+def trigger_rescore(
+    background_tasks: BackgroundTasks,
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE),
+    current_user: User = Depends(require_role(UserRole.admin)),
+):
+    if not rescore_lock.acquire(blocking=False):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A rescore is already running")
+    background_tasks.add_task(_run_rescore, chunk_size)
+    return {"status": "accepted"}
+
+
+@router.get("/rescore", response_model=RescoreReport | None, summary="Throughput report of the last rescore run")
+def get_rescore_report(current_user: User = Depends(require_role(UserRole.admin))):
+    return last_rescore_report()
+
+
+@router.get("/hashing", response_model=dict, summary="Password hashing pool capacity and latency")
+def hashing_stats(current_user: User = Depends(require_role(UserRole.admin))):
+    return password_pool.stats()
+
+
+@router.get("/auth-cache", response_model=dict, summary="Token and user cache hit/miss counters")
+def auth_cache_stats(current_user: User = Depends(require_role(UserRole.admin))):
+    return auth_cache.stats()
+
+
+@router.get("/audit/writer", response_model=dict, summary="Audit writer queue depth and write counters")
+def audit_writer_stats(current_user: User = Depends(require_role(UserRole.admin))):
+    return audit_writer.stats()
+
+
+@router.get("/db-pool", response_model=dict, summary="Connection pool saturation and checkout wait times")
+def db_pool_stats(current_user: User = Depends(require_role(UserRole.admin))):
+    return pool_stats()
+
+
+@router.get("/email/outbox", response_model=dict, summary="Email outbox backlog by status and delivery counters")
+def email_outbox_stats(current_user: User = Depends(require_role(UserRole.admin))):
+    return email_dispatcher.stats()
+
+
+@router.get("/evidence/storage", response_model=dict, summary="Evidence blob storage and deduplication savings")
+def evidence_storage_stats(current_user: User = Depends(require_role(UserRole.admin)), db: Session = Depends(get_db)):
+    return storage_stats(db)
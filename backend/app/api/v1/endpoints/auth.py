@@ -1,31 +1,66 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ....config import get_settings
-from ....db import get_db
+from ....db import get_async_db, get_db
 from ....models import User, UserRole
-from ....repositories.users import create_user, get_by_email
-from ....schemas.models import TokenResponse, UserCreate, UserOut
-from ....security import create_access_token, create_refresh_token, verify_password
+from ....repositories.users import add_user, get_by_email
+from ....schemas.models import RefreshRequest, TokenResponse, UserCreate, UserOut
+from ....security import (
+    HashingPoolFull,
+    create_access_token,
+    create_refresh_token,
+    decode_refresh_token,
+    get_password_hash_pooled,
+    verify_password_pooled,
+)
+from ....services.auth_cache import load_user_async
+from ....services.revocation import revocations
 from ....dependencies import get_current_user
 
 router = APIRouter()
 settings = get_settings()
 
+# Handlers are async so bcrypt waits on the dedicated hashing pool instead of holding
+# a Starlette threadpool slot; blocking DB calls are pushed to the threadpool explicitly.
+_busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Authentication is busy, retry shortly",
+    headers={"Retry-After": "1"},
+)
+_invalid_refresh = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or revoked refresh token")
+
+
+def _issue_tokens(user: User) -> TokenResponse:
+    access_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    refresh_expires = timedelta(minutes=settings.refresh_token_expire_minutes)
+    return TokenResponse(
+        access_token=create_access_token(user.id, user.role.value, access_expires),
+        refresh_token=create_refresh_token(user.id, user.role.value, refresh_expires),
+        role=user.role.value,
+    )
+
 
 @router.post("/register", response_model=UserOut, summary="Register new user")
-def register_user(payload: UserCreate, db: Session = Depends(get_db)):
-    existing = get_by_email(db, payload.email)
+async def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+    existing = await run_in_threadpool(get_by_email, db, payload.email)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
-    user = create_user(
+    try:
+        password_hash = await get_password_hash_pooled(payload.password)
+    except HashingPoolFull:
+        raise _busy_exception
+    user = await run_in_threadpool(
+        add_user,
         db,
         email=payload.email,
-        password=payload.password,
+        password_hash=password_hash,
         full_name=payload.full_name,
         role=payload.role,
         org_id=None,
@@ -34,18 +69,39 @@ def register_user(payload: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse, summary="Login")
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = get_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.password_hash):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    user = await run_in_threadpool(get_by_email, db, form_data.username)
+    try:
+        valid = user is not None and await verify_password_pooled(form_data.password, user.password_hash)
+    except HashingPoolFull:
+        raise _busy_exception
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password")
+    return _issue_tokens(user)
 
-    access_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    refresh_expires = timedelta(minutes=settings.refresh_token_expire_minutes)
-    return TokenResponse(
-        access_token=create_access_token(user.id, user.role.value, access_expires),
-        refresh_token=create_refresh_token(user.id, user.role.value, refresh_expires),
-        role=user.role.value,
-    )
+
+@router.post("/refresh", response_model=TokenResponse, summary="Rotate refresh token")
+async def refresh(payload: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    # No bcrypt: the old refresh token is revoked and a new pair issued. Rotation has to write the jti
+    # anyway, so the insert's primary-key conflict alone rejects a replayed token.
+    claims = decode_refresh_token(payload.refresh_token)
+    if claims is None:
+        raise _invalid_refresh
+    if not await revocations.revoke(db, claims["jti"], claims["sub"], claims["exp"]):
+        raise _invalid_refresh
+    user = await load_user_async(db, claims["sub"])
+    if user is None:
+        raise _invalid_refresh
+    return _issue_tokens(user)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, summary="Revoke refresh token")
+async def logout(payload: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    """Revoke the refresh token. Access tokens already issued stay valid until they expire (`ACCESS_TOKEN_EXPIRE_MINUTES`)."""
+    claims = decode_refresh_token(payload.refresh_token)
+    if claims is not None:
+        await revocations.revoke(db, claims["jti"], claims["sub"], claims["exp"])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/me", response_model=UserOut, summary="Current user")
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....db import get_async_db
+from ....dependencies import get_current_user_async
+from ....models import CandidateProfile, User, UserRole
+from ....schemas.models import CandidateProfileOut
+
+router = APIRouter()
+
+
+@router.get("/{candidate_id}/profile", response_model=CandidateProfileOut, summary="Candidate credibility summary")
+async def candidate_profile(
+    candidate_id: str,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if current_user.role == UserRole.candidate and current_user.id != candidate_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
+    # Maintained incrementally by services.profiles: one primary-key lookup, no claim scan
+    profile = await db.get(CandidateProfile, candidate_id)
+    if profile is None:
+        return CandidateProfileOut(candidate_id=candidate_id, credibility_score=0.0, verified_claims=0, verified_months=0, verifying_organizations=0)
+    return CandidateProfileOut(
+        candidate_id=candidate_id,
+        credibility_score=round(profile.score_total / profile.verified_claims, 2) if profile.verified_claims else 0.0,
+        verified_claims=profile.verified_claims,
+        verified_months=profile.verified_months,
+        verifying_organizations=profile.verifying_organizations,
+        latest_verified_at=profile.latest_verified_at,
+    )
@@ -1,20 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ....dependencies import get_current_user, require_role
-from ....db import get_db
+from ....config import get_settings
+from ....dependencies import get_current_user, require_role, require_role_async
+from ....db import get_async_db, get_db
 from ....models import ClaimStatus, ExperienceClaim, User, UserRole
-from ....repositories.claims import create_claim, get_claim, get_claims_for_candidate, update_claim
-from ....schemas.models import ExperienceClaimCreate, ExperienceClaimOut, ExperienceClaimUpdate
+from ....repositories.claims import claim_text, create_claim, get_claim, get_claims_for_candidate_async, update_claim
+from ....schemas.models import (
+    ClaimImportReport,
+    ExperienceClaimCreate,
+    ExperienceClaimOut,
+    ExperienceClaimUpdate,
+    ReportLinkOut,
+)
+from ....security import create_report_token
+from ....services.claim_import import DEFAULT_CHUNK_SIZE, import_claims, iter_csv_rows, iter_ndjson_rows
+from ....services.duplicates import flag_near_duplicates
+from ....services.email import email_dispatcher, send_verification_request_email
 
 router = APIRouter()
+settings = get_settings()
 
 
 @router.get("", response_model=list[ExperienceClaimOut], summary="List my claims")
-def list_claims(
-    current_user: User = Depends(require_role(UserRole.candidate)), db: Session = Depends(get_db)
+async def list_claims(
+    current_user: User = Depends(require_role_async(UserRole.candidate)), db: AsyncSession = Depends(get_async_db)
 ):
-    return get_claims_for_candidate(db, current_user.id)
+    return await get_claims_for_candidate_async(db, current_user.id)
 
 
 @router.post("", response_model=ExperienceClaimOut, status_code=status.HTTP_201_CREATED, summary="Create claim")
@@ -26,6 +39,25 @@ def create_new_claim(
     return create_claim(db, current_user.id, payload)
 
 
+@router.post("/import", response_model=ClaimImportReport, summary="Bulk import draft claims from CSV or NDJSON")
+def import_claim_file(
+    file: UploadFile = File(...),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    current_user: User = Depends(require_role(UserRole.verifier, UserRole.admin)),
+    db: Session = Depends(get_db),
+):
+    organization_name = None
+    if current_user.role != UserRole.admin:
+        if current_user.organization is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only verifiers linked to an organization can import claims")
+        organization_name = current_user.organization.name
+    # Uploads are spooled to disk by Starlette; rows are parsed lazily from the file handle.
+    name = (file.filename or "").lower()
+    is_ndjson = name.endswith((".ndjson", ".jsonl")) or file.content_type in ("application/x-ndjson", "application/jsonl")
+    rows = iter_ndjson_rows(file.file) if is_ndjson else iter_csv_rows(file.file)
+    return import_claims(db, rows, chunk_size=max(1, min(chunk_size, 10_000)), organization_name=organization_name)
+
+
 def _ensure_owner(claim: ExperienceClaim, user: User):
     if claim.candidate_id != user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your claim")
@@ -71,9 +103,39 @@ def request_verification(
     if not claim:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
     _ensure_owner(claim, current_user)
+    if claim.status == ClaimStatus.pending:
+        # Already requested: the supervisor has been emailed once, repeat calls change nothing
+        return claim
+    if claim.status not in (ClaimStatus.draft, ClaimStatus.rejected):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Only draft or rejected claims can be submitted for verification"
+        )
     claim.status = ClaimStatus.pending
     db.add(claim)
+    # Only does work if the draft's text was edited: claims written since were flagged against it already
+    flag_near_duplicates(db.connection(), [claim_text(claim)])
+    queued = "@" in claim.supervisor_contact
+    if queued:
+        link = f"{settings.frontend_url}/?claim={claim.id}"
+        send_verification_request_email(db, claim.supervisor_contact.strip(), claim.id, current_user.full_name, link)
     db.commit()
     db.refresh(claim)
-    # Email dispatch stub lives in services; wired later
+    if queued:
+        email_dispatcher.wake()
     return claim
+
+
+@router.post("/{claim_id}/report-link", response_model=ReportLinkOut, summary="Issue a signed public report link")
+def create_report_link(
+    claim_id: str,
+    current_user: User = Depends(require_role(UserRole.candidate)),
+    db: Session = Depends(get_db),
+):
+    claim = get_claim(db, claim_id)
+    if not claim:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+    _ensure_owner(claim, current_user)
+    if claim.status != ClaimStatus.verified:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Only verified claims can be shared")
+    token, expires_at = create_report_token(claim.id)
+    return ReportLinkOut(token=token, expires_at=expires_at)
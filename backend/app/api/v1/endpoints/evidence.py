@@ -0,0 +1,166 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+
+from ....config import get_settings
+from ....db import get_async_db
+from ....dependencies import require_role_async
+from ....models import ClaimStatus, EvidenceFile, EvidenceUpload, User, UserRole
+from ....repositories.claims import get_claim_async
+from ....repositories.evidence import delete_evidence_async, get_upload_async
+from ....schemas.models import EvidenceFileOut, EvidenceUploadCreate, EvidenceUploadOut
+from ....services.evidence_store import attach_existing, settle_upload, store_upload
+from ....services.evidence_upload import UploadError, discard_upload, receive_chunks, upload_offset
+
+router = APIRouter()
+settings = get_settings()
+
+OFFSET_HEADER = "Upload-Offset"
+
+
+def _upload_out(upload: EvidenceUpload, offset: int, evidence: EvidenceFile | None = None) -> EvidenceUploadOut:
+    return EvidenceUploadOut(
+        id=upload.id,
+        claim_id=upload.claim_id,
+        file_name=upload.file_name,
+        mime_type=upload.mime_type,
+        size_bytes=upload.size_bytes,
+        offset=offset,
+        evidence=EvidenceFileOut.model_validate(evidence) if evidence else None,
+    )
+
+
+async def _editable_claim(db: AsyncSession, claim_id: str, user: User):
+    claim = await get_claim_async(db, claim_id, options=())
+    if not claim:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+    if claim.candidate_id != user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your claim")
+    if claim.status not in (ClaimStatus.draft, ClaimStatus.pending):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Evidence can only be changed on draft/pending claims")
+    return claim
+
+
+async def _owned_upload(db: AsyncSession, claim_id: str, upload_id: str, user: User) -> EvidenceUpload:
+    upload = await get_upload_async(db, upload_id, claim_id, user.id)
+    if not upload:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return upload
+
+
+@router.post(
+    "/{claim_id}/evidence/uploads",
+    response_model=EvidenceUploadOut,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start a resumable evidence upload",
+)
+async def start_upload(
+    claim_id: str,
+    payload: EvidenceUploadCreate,
+    response: Response,
+    current_user: User = Depends(require_role_async(UserRole.candidate)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    claim = await _editable_claim(db, claim_id, current_user)
+    if payload.mime_type not in settings.evidence_mime_types:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="File type not allowed")
+    if payload.size_bytes > settings.evidence_max_bytes:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large")
+    upload = EvidenceUpload(claim_id=claim.id, owner_id=current_user.id, **payload.model_dump())
+    db.add(upload)
+    evidence = await attach_existing(db, upload) if payload.sha256 else None
+    if evidence is not None:
+        db.add(evidence)
+        await db.flush()
+        upload.evidence_id = evidence.id
+    await db.commit()
+    offset = upload.size_bytes if evidence else 0
+    response.headers[OFFSET_HEADER] = str(offset)
+    return _upload_out(upload, offset, evidence)
+
+
+@router.get("/{claim_id}/evidence/uploads/{upload_id}", response_model=EvidenceUploadOut, summary="Resume point of an upload")
+async def get_upload(
+    claim_id: str,
+    upload_id: str,
+    response: Response,
+    current_user: User = Depends(require_role_async(UserRole.candidate)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    upload = await _owned_upload(db, claim_id, upload_id, current_user)
+    offset = await run_in_threadpool(upload_offset, upload)
+    response.headers[OFFSET_HEADER] = str(offset)
+    evidence = await db.get(EvidenceFile, upload.evidence_id) if upload.evidence_id else None
+    return _upload_out(upload, offset, evidence)
+
+
+@router.patch("/{claim_id}/evidence/uploads/{upload_id}", response_model=EvidenceUploadOut, summary="Append bytes at Upload-Offset")
+async def append_upload(
+    claim_id: str,
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset_header: int = Header(alias=OFFSET_HEADER, ge=0),
+    current_user: User = Depends(require_role_async(UserRole.candidate)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    upload = await _owned_upload(db, claim_id, upload_id, current_user)
+    try:
+        offset, sha256 = await receive_chunks(upload, upload_offset_header, request.stream())
+        evidence = await store_upload(db, upload, sha256) if sha256 else None
+    except UploadError as exc:
+        if exc.status_code in (status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, status.HTTP_422_UNPROCESSABLE_ENTITY):
+            await run_in_threadpool(discard_upload, upload)
+            await db.delete(upload)
+            await db.commit()
+        headers = {OFFSET_HEADER: str(exc.offset)} if exc.offset is not None else None
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail, headers=headers)
+    except ClientDisconnect:
+        # Received bytes stay staged; the client resumes from GET's Upload-Offset.
+        return Response(status_code=status.HTTP_400_BAD_REQUEST)
+    if evidence is None:
+        upload.received_bytes = offset
+    else:
+        db.add(evidence)
+        await db.flush()
+        upload.evidence_id = evidence.id
+    await db.commit()
+    if evidence is not None:
+        # Only now that the evidence (and a new blob's row) is durable
+        await run_in_threadpool(settle_upload, upload, evidence)
+    response.headers[OFFSET_HEADER] = str(offset)
+    return _upload_out(upload, offset, evidence)
+
+
+@router.delete("/{claim_id}/evidence/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Abort an upload")
+async def abort_upload(
+    claim_id: str,
+    upload_id: str,
+    current_user: User = Depends(require_role_async(UserRole.candidate)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    upload = await _owned_upload(db, claim_id, upload_id, current_user)
+    if upload.completed_at:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Upload already complete")
+    await run_in_threadpool(discard_upload, upload)
+    await db.delete(upload)
+    await db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.delete("/{claim_id}/evidence/{evidence_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Remove evidence from a claim")
+async def delete_evidence_file(
+    claim_id: str,
+    evidence_id: str,
+    current_user: User = Depends(require_role_async(UserRole.candidate)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    await _editable_claim(db, claim_id, current_user)
+    evidence = await db.get(EvidenceFile, evidence_id)
+    if not evidence or evidence.claim_id != claim_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Evidence not found")
+    # The blob's bytes stay until `gc-evidence` collects it after the grace period
+    await delete_evidence_async(db, evidence)
+    await db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
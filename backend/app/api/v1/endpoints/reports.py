@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....db import get_db
-from ....models import ClaimStatus
-from ....repositories.claims import get_claim
+from ....db import get_async_db
 from ....schemas.models import ExperienceClaimOut
+from ....security import decode_report_token
+from ....services.reports import etag_matches, render_report_async
 
 router = APIRouter()
 
 
 @router.get("/{token}", response_model=ExperienceClaimOut, summary="Public verification report")
-def view_report(token: str, db: Session = Depends(get_db)):
-    # MVP stub: token equals claim_id; replace with signed token validation
-    claim = get_claim(db, token)
-    if not claim or claim.status != ClaimStatus.verified:
-        raise HTTPException(status_code=404, detail="Report not found or not verified")
-    return claim
+async def view_report(token: str, if_none_match: str | None = Header(default=None), db: AsyncSession = Depends(get_async_db)):
+    not_found = HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found or not verified")
+    claim_id = decode_report_token(token)
+    if claim_id is None:
+        raise not_found
+    rendered = await render_report_async(db, claim_id)
+    if rendered is None:
+        raise not_found
+    etag, body = rendered
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
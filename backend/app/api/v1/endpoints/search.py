@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....config import get_settings
+from ....db import get_async_db
+from ....dependencies import require_role_async
+from ....models import ClaimStatus, User, UserRole
+from ....pagination import NEXT_CURSOR_HEADER, decode_id_cursor, decode_rank_cursor, encode_id_cursor, encode_rank_cursor
+from ....repositories.search import claims_with_skill_async, search_claims_async, search_terms, skill_facets_async
+from ....schemas.models import ClaimSearchResultOut, SkillFacetOut
+from ....services.skill_tags import normalize_tag
+
+router = APIRouter()
+settings = get_settings()
+searchers = require_role_async(UserRole.employer, UserRole.verifier, UserRole.admin)
+
+
+@router.get("/claims", response_model=list[ClaimSearchResultOut], summary="Full-text search over claims, best matches first")
+async def search_claims(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to match; each matches as a prefix"),
+    claim_status: list[ClaimStatus] = Query([ClaimStatus.verified], alias="status"),
+    min_score: float | None = Query(None, ge=0, le=100),
+    max_score: float | None = Query(None, ge=0, le=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    current_user: User = Depends(searchers),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if not search_terms(q):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Query has no searchable words")
+    # Claims that are not yet verified are only searchable by admins
+    if current_user.role != UserRole.admin and set(claim_status) != {ClaimStatus.verified}:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only verified claims are searchable")
+    try:
+        after = decode_rank_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    rows = await search_claims_async(
+        db,
+        q,
+        statuses=claim_status,
+        min_score=min_score,
+        max_score=max_score,
+        limit=limit + 1,
+        after=after,
+        max_candidates=settings.search_max_candidates,
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last, rank = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_rank_cursor(rank, last.id)
+    return [claim for claim, _ in rows]
+
+
+@router.get("/skills", response_model=list[SkillFacetOut], summary="Skill tags with their verified-claim counts")
+async def skill_facets(
+    prefix: str | None = Query(None, max_length=64, description="Only tags starting with this (normalized) text"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(searchers),
+    db: AsyncSession = Depends(get_async_db),
+):
+    facets = await skill_facets_async(db, prefix=normalize_tag(prefix) if prefix else None, limit=limit)
+    return [SkillFacetOut(tag=tag, verified_claims=count) for tag, count in facets]
+
+
+@router.get("/skills/{tag}/claims", response_model=list[ClaimSearchResultOut], summary="Verified claims with a skill tag")
+async def skill_claims(
+    tag: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    current_user: User = Depends(searchers),
+    db: AsyncSession = Depends(get_async_db),
+):
+    normalized = normalize_tag(tag)
+    if normalized is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Empty skill tag")
+    try:
+        after = decode_id_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    claims = await claims_with_skill_async(db, normalized, limit=limit + 1, after=after)
+    if len(claims) > limit:
+        claims = claims[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_id_cursor(claims[-1].id)
+    return claims
@@ -1,20 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ....dependencies import require_role
-from ....db import get_db
-from ....models import ExperienceClaim, User, UserRole
+from ....dependencies import require_role, require_role_async
+from ....db import get_async_db, get_db
+from ....models import ClaimStatus, ExperienceClaim, User, UserRole
+from ....pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from ....repositories.claims import get_claim
-from ....repositories.verifications import create_verification, get_for_claim, inbox_for_verifier
-from ....schemas.models import ExperienceClaimOut, VerificationDecision, VerificationRecordOut
+from ....repositories.verifications import create_verification, get_for_claim, inbox_for_verifier_async, may_decide
+from ....schemas.models import (
+    BulkDecisionResult,
+    BulkVerificationDecision,
+    ExperienceClaimOut,
+    VerificationDecision,
+    VerificationRecordOut,
+)
+from ....services.audit import record_event
+from ....services.decisions import decide_bulk
 from ....services.scoring import calculate_score
 
 router = APIRouter()
 
 
 @router.get("/inbox", response_model=list[ExperienceClaimOut], summary="Pending claims to verify")
-def list_inbox(current_user: User = Depends(require_role(UserRole.verifier)), db: Session = Depends(get_db)):
-    return inbox_for_verifier(db, current_user.id)
+async def list_inbox(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    claim_type: str | None = None,
+    created_from: date | None = None,
+    created_to: date | None = None,
+    current_user: User = Depends(require_role_async(UserRole.verifier)),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    claims = await inbox_for_verifier_async(
+        db,
+        current_user,
+        limit=limit + 1,
+        after=after,
+        claim_type=claim_type,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if len(claims) > limit:
+        claims = claims[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(claims[-1].created_at, claims[-1].id)
+    return claims
+
+
+@router.post("/decisions", response_model=list[BulkDecisionResult], summary="Approve or reject many claims at once")
+def decide_many(
+    decisions: list[BulkVerificationDecision] = Body(..., max_length=500),
+    current_user: User = Depends(require_role(UserRole.verifier)),
+    db: Session = Depends(get_db),
+):
+    return decide_bulk(db, current_user, decisions)
 
 
 @router.post("/{claim_id}/decision", response_model=VerificationRecordOut, summary="Approve or reject a claim")
@@ -25,10 +71,15 @@ def decide(
     db: Session = Depends(get_db),
 ):
     claim = get_claim(db, claim_id)
-    if not claim:
+    # Claims outside the verifier's inbox are reported as missing, as in the bulk endpoint
+    if not claim or not may_decide(current_user, claim):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Claim not found")
+    if claim.status != ClaimStatus.pending:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Claim is not pending")
 
-    record = create_verification(db, claim, verifier_id=current_user.id, decision=decision)
+    record = create_verification(
+        db, claim, verifier_id=current_user.id, decision=decision, organization_id=current_user.org_id
+    )
 
     verifications = get_for_claim(db, claim.id)
     score, breakdown = calculate_score(claim, verifications)
@@ -37,4 +88,11 @@ def decide(
     db.add(claim)
     db.commit()
     db.refresh(record)
+    record_event(
+        "verification.decision",
+        "claim",
+        claim.id,
+        actor_id=current_user.id,
+        details={"outcome": record.outcome.value, "verification_id": record.id, "score": score},
+    )
     return record
@@ -0,0 +1,59 @@
+"""One-time database bootstrap: tables, migrations and seed data.
+
+Run once per deploy (`python -m app.cli bootstrap`) rather than in every worker; the app's
+lifespan only checks that it has been run.
+"""
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .db import Base
+from .migrations import MIGRATIONS, migrate, schema_migrations
+from .models import Organization, OrgStatus, UserRole
+from .repositories.users import create_user, get_by_email
+
+BOOTSTRAP_HINT = "run `python -m app.cli bootstrap` before starting the API"
+
+
+def seed_admin(db: Session, email: str, password: str) -> bool:
+    if get_by_email(db, email):
+        return False
+    create_user(db=db, email=email, password=password, full_name="Admin", role=UserRole.admin, org_id=None)
+    return True
+
+
+def seed_orgs(db: Session) -> bool:
+    if db.query(Organization).count():
+        return False
+    db.add_all(
+        [
+            Organization(name="Community Bridge", verified_status=OrgStatus.pending, contact_email="org@community.lk"),
+            Organization(name="TechWorks Jaffna", verified_status=OrgStatus.verified, contact_email="hello@techworks.lk"),
+            Organization(name="GreenHands", verified_status=OrgStatus.pending, contact_email="team@greenhands.lk"),
+        ]
+    )
+    db.commit()
+    return True
+
+
+def bootstrap(engine: Engine, admin_email: str, admin_password: str, seed: bool = True) -> list[int]:
+    """Create missing tables, apply migrations and (optionally) seed; safe to re-run. Returns migrations applied."""
+    Base.metadata.create_all(bind=engine)
+    applied = migrate(engine)
+    if seed:
+        with Session(engine) as db:
+            seed_admin(db, admin_email, admin_password)
+            seed_orgs(db)
+    return applied
+
+
+def check_schema(engine: Engine) -> None:
+    """Cheap startup check: the database is reachable and fully migrated. Raises RuntimeError otherwise."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        if not inspect(conn).has_table(schema_migrations.name):
+            raise RuntimeError(f"Database is not initialised; {BOOTSTRAP_HINT}")
+        done = set(conn.execute(select(schema_migrations.c.version)).scalars())
+    pending = [version for version, _, _ in MIGRATIONS if version not in done]
+    if pending:
+        raise RuntimeError(f"Database has pending migrations {pending}; {BOOTSTRAP_HINT}")
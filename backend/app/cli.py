@@ -0,0 +1,131 @@
+import argparse
+from datetime import timedelta
+
+from .bootstrap import bootstrap as run_bootstrap
+from .config import get_settings
+from .db import Base, SessionLocal, engine
+from .migrations import migrate as run_migrations
+from .repositories.search import rebuild_search_index
+from .services.duplicates import DEFAULT_CHUNK_SIZE as DUPLICATE_CHUNK_SIZE, index_corpus
+from .services.evidence_store import collect_garbage
+from .services.profiles import DEFAULT_CHUNK_SIZE as PROFILE_CHUNK_SIZE, install_listener as install_profile_listener
+from .services.profiles import rebuild_profiles as run_rebuild_profiles
+from .services.rescoring import DEFAULT_CHUNK_SIZE, rescore_verified_claims
+from .services.skill_tags import DEFAULT_CHUNK_SIZE as TAG_CHUNK_SIZE, install_listener as install_skill_tag_listener
+from .services.skill_tags import rebuild_skill_tags as run_rebuild_skill_tags
+
+settings = get_settings()
+
+
+def rescore(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        report = rescore_verified_claims(db, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    print(
+        f"Rescored {report.scanned} verified claims ({report.updated} updated) "
+        f"in {report.elapsed_seconds}s — {report.claims_per_second} claims/s"
+    )
+
+
+def migrate(args: argparse.Namespace) -> None:
+    Base.metadata.create_all(bind=engine)
+    applied = run_migrations(engine)
+    print(f"Applied migrations: {applied}" if applied else "Schema up to date")
+
+
+def rebuild_profiles(args: argparse.Namespace) -> None:
+    with engine.begin() as conn:
+        scanned = run_rebuild_profiles(conn, chunk_size=args.chunk_size)
+    print(f"Rebuilt candidate profiles from {scanned} verified claims")
+
+
+def rebuild_skill_tags(args: argparse.Namespace) -> None:
+    with engine.begin() as conn:
+        scanned = run_rebuild_skill_tags(conn, chunk_size=args.chunk_size)
+    print(f"Rebuilt skill tag links and counts from {scanned} claims")
+
+
+def index_duplicates(args: argparse.Namespace) -> None:
+    with engine.begin() as conn:
+        report = index_corpus(conn, chunk_size=args.chunk_size)
+    print(f"Indexed {report.indexed} of {report.scanned} claims and raised {report.flagged} duplicate flags in {report.elapsed_seconds}s")
+
+
+def reindex_search(args: argparse.Namespace) -> None:
+    with engine.begin() as conn:
+        rebuild_search_index(conn)
+    print("Rebuilt the claim search index")
+
+
+def bootstrap(args: argparse.Namespace) -> None:
+    applied = run_bootstrap(
+        engine, admin_email=args.admin_email, admin_password=settings.bootstrap_admin_password, seed=not args.no_seed
+    )
+    print(f"Bootstrapped database; applied migrations: {applied}" if applied else "Bootstrapped database; schema up to date")
+
+
+def gc_evidence(args: argparse.Namespace) -> None:
+    db = SessionLocal()
+    try:
+        report = collect_garbage(
+            db, grace=timedelta(hours=args.grace_hours), upload_ttl=timedelta(hours=args.upload_ttl_hours)
+        )
+    finally:
+        db.close()
+    print(
+        f"Deleted {report.blobs_deleted} unreferenced blobs ({report.bytes_freed} bytes) "
+        f"and {report.uploads_expired} abandoned uploads"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="VerifyLK maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rescore_parser = commands.add_parser("rescore", help="Recompute credibility scores for all verified claims")
+    rescore_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    rescore_parser.set_defaults(func=rescore)
+
+    profiles_parser = commands.add_parser("rebuild-profiles", help="Recompute every materialized candidate profile")
+    profiles_parser.add_argument("--chunk-size", type=int, default=PROFILE_CHUNK_SIZE)
+    profiles_parser.set_defaults(func=rebuild_profiles)
+
+    tags_parser = commands.add_parser("rebuild-skill-tags", help="Re-link normalized skill tags and recount verified claims")
+    tags_parser.add_argument("--chunk-size", type=int, default=TAG_CHUNK_SIZE)
+    tags_parser.set_defaults(func=rebuild_skill_tags)
+
+    duplicates_parser = commands.add_parser(
+        "index-duplicates", help="Rebuild the near-duplicate index over all claims and recompute every flag"
+    )
+    duplicates_parser.add_argument("--chunk-size", type=int, default=DUPLICATE_CHUNK_SIZE)
+    duplicates_parser.set_defaults(func=index_duplicates)
+
+    search_parser = commands.add_parser("reindex-search", help="Rebuild the full-text claim search index")
+    search_parser.set_defaults(func=reindex_search)
+
+    migrate_parser = commands.add_parser("migrate", help="Create missing tables and apply schema migrations")
+    migrate_parser.set_defaults(func=migrate)
+
+    bootstrap_parser = commands.add_parser(
+        "bootstrap", help="One-time setup: create tables, apply migrations, seed the admin account and sample orgs"
+    )
+    bootstrap_parser.add_argument("--admin-email", default=settings.bootstrap_admin_email, help="Password from BOOTSTRAP_ADMIN_PASSWORD")
+    bootstrap_parser.add_argument("--no-seed", action="store_true", help="Schema only; skip the admin account and sample orgs")
+    bootstrap_parser.set_defaults(func=bootstrap)
+
+    gc_parser = commands.add_parser("gc-evidence", help="Delete unreferenced evidence blobs and abandoned uploads")
+    gc_parser.add_argument("--grace-hours", type=float, default=settings.evidence_gc_grace_hours)
+    gc_parser.add_argument("--upload-ttl-hours", type=float, default=settings.evidence_upload_ttl_hours)
+    gc_parser.set_defaults(func=gc_evidence)
+
+    args = parser.parse_args(argv)
+    # ORM writes from commands keep the materialized aggregates current, as in the app
+    install_profile_listener()
+    install_skill_tag_listener()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,67 @@ class Settings(BaseSettings):
     secret_key: str = Field(default="dev-secret-change", description="Use strong secret in production")
     access_token_expire_minutes: int = 30
     refresh_token_expire_minutes: int = 60 * 24 * 7
+    revocation_prune_hours: float = Field(default=24.0, description="How often expired revoked jtis are deleted")
     algorithm: str = "HS256"
     database_url: str = Field(default="sqlite:///./verifylk.db")
+    bootstrap_admin_email: str = "admin@gmail.com"
+    bootstrap_admin_password: str = Field(default="1234", description="Seeded by `python -m app.cli bootstrap` only")
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = Field(default=1800, description="Recycle connections older than this; -1 disables")
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = Field(default=0, description="Postgres statement_timeout; 0 disables")
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    evidence_storage_dir: str = "./storage"
+    evidence_max_bytes: int = 20 * 1024 * 1024
+    evidence_mime_types: list[str] = ["application/pdf", "image/png", "image/jpeg", "image/webp"]
+    evidence_gc_grace_hours: float = Field(default=24.0, description="Keep unreferenced blobs this long before collecting")
+    evidence_upload_ttl_hours: float = Field(default=48.0, description="Abandoned partial uploads are collected after this")
     s3_bucket: str | None = None
     s3_region: str | None = None
     email_from: str | None = None
+    frontend_url: str = "http://localhost:5173"
+    smtp_host: str | None = Field(default=None, description="Unset logs outgoing mail instead of sending it")
+    smtp_port: int = 587
+    smtp_username: str | None = None
+    smtp_password: str | None = None
+    smtp_starttls: bool = True
+    smtp_timeout_seconds: float = 10.0
+    email_batch_size: int = 50
+    email_poll_interval_seconds: float = 2.0
+    email_max_attempts: int = 8
+    email_backoff_base_seconds: float = 30.0
+    email_backoff_max_seconds: float = 3600.0
+    email_lease_seconds: float = Field(default=300.0, description="Claimed rows return to the queue if not settled in time")
+    password_hash_workers: int = Field(default=4, description="Dedicated threads for bcrypt hashing")
+    password_hash_queue_limit: int = Field(default=32, description="Queued hash jobs before login/register return 503")
+    auth_cache_size: int = Field(default=10_000, description="Entries per auth cache (tokens, users); 0 disables")
+    auth_cache_ttl_seconds: float = 60.0
+    search_max_candidates: int = Field(default=1000, description="Most recent filter-passing matches ranked per search query")
+    duplicate_detection_enabled: bool = Field(default=True, description="Flag near-duplicate claims on create and submit")
+    duplicate_similarity_threshold: float = Field(default=0.8, description="Estimated Jaccard similarity that raises a flag")
+    duplicate_max_candidates: int = Field(default=200, description="Most recent LSH colliders compared per claim")
+    duplicate_max_flags_per_claim: int = 20
+    report_token_expire_days: int = 30
+    report_cache_size: int = 5_000
+    report_cache_ttl_seconds: float = 300.0
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = Field(default="memory", description="memory (per worker) or redis (shared)")
+    rate_limit_redis_url: str | None = None
+    rate_limit_max_keys: int = Field(default=100_000, description="In-memory buckets kept per worker before evicting")
+    rate_limit_auth_per_minute: float = Field(default=20, description="login/register/refresh, per client IP")
+    rate_limit_auth_burst: int = 10
+    rate_limit_reports_per_minute: float = Field(default=300, description="Public report views, per client IP")
+    rate_limit_reports_burst: int = 60
+    rate_limit_user_per_minute: float = Field(default=600, description="Other /api requests, per authenticated user (else per client IP)")
+    rate_limit_user_burst: int = 120
+    metrics_enabled: bool = Field(default=False, description="Serve Prometheus metrics at /metrics (unauthenticated)")
+    audit_queue_size: int = 10_000
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+    audit_enqueue_timeout_seconds: float = Field(default=0.5, description="Backpressure wait before dropping an event")
 
     class Config:
         env_file = ".env"
@@ -1,15 +1,191 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from .config import get_settings
+from .config import Settings, get_settings
+from .metrics import observe_statement
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class PoolMetrics:
+    """Checkout wait time and timeout counters, shared by every InstrumentedQueuePool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def observe(self, wait: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_seconds": self.total_wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        self.max_overflow = max_overflow
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            # Connect failures (DB down, bad credentials) are not pool exhaustion
+            pool_metrics.observe(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.observe(time.perf_counter() - start, timed_out=False)
+        return conn
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and (make_url(url).database in (None, "", ":memory:") or "mode=memory" in url)
+
+
+def _install_sqlite_pragmas(target: Engine, settings: Settings, url: str) -> None:
+    @event.listens_for(target, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if not _is_memory_sqlite(url):
+            # WAL lets readers proceed while one writer commits; NORMAL is durable across app crashes in WAL mode
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.close()
+
+
+def _install_query_metrics(target: Engine) -> None:
+    # The start time lives on the per-statement execution context, so a failed statement leaves nothing behind.
+    @event.listens_for(target, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        context.query_started = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        observe_statement(time.perf_counter() - context.query_started)
+
+
+def _engine_options(settings: Settings, url: str, poolclass) -> dict:
+    kwargs: dict = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not _is_memory_sqlite(url):
+        kwargs.update(
+            poolclass=poolclass,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+        )
+    return kwargs
+
+
+def build_engine(settings: Settings) -> Engine:
+    url = settings.database_url
+    connect_args: dict = {}
+    if _is_sqlite(url):
+        connect_args["check_same_thread"] = False
+    elif settings.db_statement_timeout_ms and url.startswith("postgresql"):
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    new_engine = create_engine(url, connect_args=connect_args, **_engine_options(settings, url, InstrumentedQueuePool))
+    if _is_sqlite(url):
+        _install_sqlite_pragmas(new_engine, settings, url)
+    _install_query_metrics(new_engine)
+    return new_engine
+
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its async driver (aiosqlite / asyncpg) unless one is already given."""
+    parsed = make_url(url)
+    if parsed.drivername in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=ASYNC_DRIVERS[parsed.drivername])
+    elif parsed.drivername.startswith("postgresql+"):
+        parsed = parsed.set(drivername=ASYNC_DRIVERS["postgresql"])
+    return parsed.render_as_string(hide_password=False)
+
+
+def build_async_engine(settings: Settings) -> AsyncEngine:
+    url = async_database_url(settings.database_url)
+    connect_args: dict = {}
+    if settings.db_statement_timeout_ms and url.startswith("postgresql+asyncpg"):
+        connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    new_engine = create_async_engine(url, connect_args=connect_args, **_engine_options(settings, url, AsyncAdaptedQueuePool))
+    if _is_sqlite(url):
+        _install_sqlite_pragmas(new_engine.sync_engine, settings, url)
+    _install_query_metrics(new_engine.sync_engine)
+    return new_engine
+
+
+def dialect_insert(conn: Connection):
+    """The dialect's `insert` construct, which carries `on_conflict_do_update` / `on_conflict_do_nothing`."""
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif conn.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:  # pragma: no cover
+        raise NotImplementedError(f"No upsert support for {conn.dialect.name}")
+    return insert
+
+
+def pool_stats(target: Engine | None = None) -> dict:
+    pool = (target or engine).pool
+    stats: dict = {"pool": type(pool).__name__}
+    if isinstance(pool, InstrumentedQueuePool):
+        capacity = pool.size() + pool.max_overflow
+        checked_out = pool.checkedout()
+        stats.update(
+            size=pool.size(),
+            max_overflow=pool.max_overflow,
+            checked_out=checked_out,
+            overflow=max(0, pool.overflow()),
+            saturation=round(checked_out / capacity, 4) if capacity > 0 else 0.0,
+        )
+    metrics = pool_metrics.snapshot()
+    checkouts = metrics["checkouts"]
+    stats.update(
+        checkouts=checkouts,
+        checkout_timeouts=metrics["timeouts"],
+        avg_checkout_wait_ms=round(metrics["total_wait_seconds"] / checkouts * 1000, 3) if checkouts else 0.0,
+        max_checkout_wait_ms=round(metrics["max_wait_seconds"] * 1000, 3),
+    )
+    return stats
+
+
 settings = get_settings()
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {})
+engine = build_engine(settings)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -19,3 +195,24 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    # Built on first use so processes that never touch the async path don't need its driver installed
+    return build_async_engine(settings)
+
+
+@lru_cache()
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False, autoflush=False)
+
+
+async def dispose_async_engine() -> None:
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -1,39 +1,63 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .config import get_settings
-from .db import get_db
+from .db import get_async_db, get_db
 from .models import User, UserRole
 from .schemas.models import TokenPayload
+from .services.auth_cache import decode_token, load_user, load_user_async
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
-settings = get_settings()
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _token_subject(token: str) -> str:
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        token_data = TokenPayload(**payload)
-        if token_data.sub is None:
-            raise credentials_exception
+        token_data = TokenPayload(**decode_token(token))
     except JWTError:
-        raise credentials_exception
-    user = db.query(User).filter(User.id == token_data.sub).first()
+        raise _credentials_exception()
+    # Only access tokens carry no type; refresh/report tokens are not bearer credentials
+    if token_data.sub is None or token_data.type is not None:
+        raise _credentials_exception()
+    return token_data.sub
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    user = load_user(db, _token_subject(token))
+    if user is None:
+        raise _credentials_exception()
+    return user
+
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    """Same as get_current_user, bound to the request's AsyncSession for `async def` endpoints."""
+    user = await load_user_async(db, _token_subject(token))
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
-def require_role(required: UserRole):
+def require_role(*allowed: UserRole):
     def dependency(user: User = Depends(get_current_user)) -> User:
-        if user.role != required:
+        if user.role not in allowed:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
+        return user
+
+    return dependency
+
+
+def require_role_async(*allowed: UserRole):
+    async def dependency(user: User = Depends(get_current_user_async)) -> User:
+        if user.role not in allowed:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
         return user
 
@@ -1,54 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api.routes import router as api_router
+from .bootstrap import check_schema
 from .config import get_settings
-from .db import Base, engine
-from .db import SessionLocal
+from .db import dispose_async_engine, engine
 from .middleware.audit import audit_middleware
-from .repositories.users import get_by_email, create_user
-from .models import Organization, OrgStatus, UserRole
-
+from .middleware.ratelimit import RateLimitMiddleware
+from .pagination import NEXT_CURSOR_HEADER
+from .services.audit import audit_writer
+from .services.email import email_dispatcher
+from .services.profiles import install_listener as install_profile_listener
+from .services.ratelimit import build_backend, default_rules
+from .services.skill_tags import install_listener as install_skill_tag_listener
 
-def create_app() -> FastAPI:
-    settings = get_settings()
-    app = FastAPI(title=settings.project_name)
-    Base.metadata.create_all(bind=engine)
 
-    def seed_admin():
-        db = SessionLocal()
-        try:
-            admin_email = "admin@gmail.com"
-            existing = get_by_email(db, admin_email)
-            if not existing:
-                create_user(
-                    db=db,
-                    email=admin_email,
-                    password="1234",
-                    full_name="Admin",
-                    role=UserRole.admin,
-                    org_id=None,
-                )
-        finally:
-            db.close()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DDL and seeding live in `python -m app.cli bootstrap`; workers only verify it ran
+    check_schema(engine)
+    audit_writer.start()
+    email_dispatcher.start()
+    yield
+    email_dispatcher.stop()
+    audit_writer.stop()
+    await dispose_async_engine()
 
-    def seed_orgs():
-        db = SessionLocal()
-        try:
-            existing = db.query(Organization).count()
-            if existing == 0:
-                samples = [
-                    Organization(name="Community Bridge", verified_status=OrgStatus.pending, contact_email="org@community.lk"),
-                    Organization(name="TechWorks Jaffna", verified_status=OrgStatus.verified, contact_email="hello@techworks.lk"),
-                    Organization(name="GreenHands", verified_status=OrgStatus.pending, contact_email="team@greenhands.lk"),
-                ]
-                db.add_all(samples)
-                db.commit()
-        finally:
-            db.close()
 
-    seed_admin()
-    seed_orgs()
+def create_app() -> FastAPI:
+    settings = get_settings()
+    install_profile_listener()
+    install_skill_tag_listener()
+    app = FastAPI(title=settings.project_name, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -56,9 +41,20 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     app.middleware("http")(audit_middleware)
+    if settings.rate_limit_enabled:
+        # Outside the audit middleware: shed requests are neither audited nor routed
+        app.add_middleware(RateLimitMiddleware, rules=default_rules(settings), backend=build_backend(settings))
+    if settings.metrics_enabled:
+        from .api.metrics import router as metrics_router
+        from .middleware.metrics import MetricsMiddleware
+
+        # Added last so it wraps every other middleware
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
 
     @app.get("/", summary="Root")
     def root():
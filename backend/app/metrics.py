@@ -0,0 +1,168 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Deliberately dependency-free and cheap on the hot path: updating a metric is a dict lookup on a
+label tuple plus a few additions under a lock. Values are rendered only when `/metrics` is scraped.
+"""
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Iterable
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple, float] = {}
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_labels(self.labelnames, key)} {_number(v)}" for key, v in items]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labelvalues, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labelvalues, amount: float = 1.0) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._bounds = tuple(f'le="{_number(b)}"' for b in self.buckets) + ('le="+Inf"',)
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labelvalues) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                # [per-bucket counts..., +Inf count, sum]
+                series = self._series[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *labelvalues) -> int:
+        series = self._series.get(labelvalues)
+        return sum(series[:-1]) if series else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+        lines = self.header()
+        for key, series in items:
+            cumulative = 0
+            for bound, hits in zip(self._bounds, series[:-1]):
+                cumulative += hits
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, bound)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, extra: Iterable[_Metric] = ()) -> str:
+        lines: list[str] = []
+        for metric in [*self._metrics, *extra]:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(
+    Histogram(
+        "verifylk_http_request_duration_seconds",
+        "HTTP request latency by route template, method and status",
+        ("route", "method", "status"),
+    )
+)
+http_in_flight = registry.register(Gauge("verifylk_http_requests_in_flight", "HTTP requests being served", ("method",)))
+request_db_statements = registry.register(
+    Histogram(
+        "verifylk_http_request_db_statements",
+        "SQL statements executed per HTTP request",
+        ("route", "method"),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+request_db_seconds = registry.register(
+    Histogram("verifylk_http_request_db_seconds", "Total SQL execution time per HTTP request", ("route", "method"))
+)
+db_statements = registry.register(Counter("verifylk_db_statements_total", "SQL statements executed"))
+db_seconds = registry.register(Counter("verifylk_db_seconds_total", "Time spent executing SQL statements"))
+scoring_calls = registry.register(Counter("verifylk_scoring_calls_total", "Credibility score computations"))
+bcrypt_operations = registry.register(
+    Counter("verifylk_bcrypt_operations_total", "bcrypt password hash/verify operations", ("operation",))
+)
+rate_limited = registry.register(Counter("verifylk_rate_limited_total", "Requests rejected with 429 by policy", ("policy",)))
+
+
+class RequestQueryStats:
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# Set by the metrics middleware for the duration of a request. Threadpool calls (sync endpoints and
+# dependencies) run in a copy of the request's context, so they update the same object.
+current_query_stats: ContextVar[RequestQueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def observe_statement(seconds: float) -> None:
+    db_statements.inc()
+    db_seconds.inc(amount=seconds)
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += seconds
@@ -3,22 +3,39 @@ import time
 from typing import Callable
 
 from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from jose import JWTError
+
+from ..services.audit import audit_event, audit_writer
+from ..services.auth_cache import decode_token
 
 logger = logging.getLogger("verifylk.audit")
 
 
+def _actor_id(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_token(token).get("sub")
+    except JWTError:
+        return None
+
+
 async def audit_middleware(request: Request, call_next: Callable):
     start = time.time()
     response = await call_next(request)
     duration = round((time.time() - start) * 1000, 2)
-    logger.info(
-        "request",
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-            "status": response.status_code,
-            "duration_ms": duration,
-            "client": request.client.host if request.client else None,
-        },
-    )
+    details = {
+        "path": request.url.path,
+        "method": request.method,
+        "status": response.status_code,
+        "duration_ms": duration,
+        "client": request.client.host if request.client else None,
+    }
+    logger.info("request", extra=details)
+    event = audit_event("http.request", "route", request.url.path, actor_id=_actor_id(request), details=details)
+    if not audit_writer.try_emit(event):
+        # Queue is full: wait for room off the event loop rather than blocking it
+        await run_in_threadpool(audit_writer.emit, event)
     return response
@@ -0,0 +1,54 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..metrics import (
+    RequestQueryStats,
+    current_query_stats,
+    http_in_flight,
+    http_requests,
+    request_db_seconds,
+    request_db_statements,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Per-route latency, in-flight and per-request SQL metrics.
+
+    Plain ASGI rather than `app.middleware("http")` so it adds no extra task or response wrapping.
+    Routes are labelled by their template (`/api/v1/claims/{claim_id}`), never the raw path.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+        http_in_flight.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight.dec(method)
+            current_query_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+            http_requests.observe(elapsed, path, method, status_code)
+            request_db_statements.observe(stats.statements, path, method)
+            request_db_seconds.observe(stats.seconds, path, method)
@@ -0,0 +1,77 @@
+import json
+import math
+
+from jose import JWTError
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..metrics import rate_limited
+from ..services.auth_cache import decode_token
+from ..services.ratelimit import MemoryBuckets, RateRule, RedisBuckets
+
+_BODY = json.dumps({"detail": "Too many requests"}).encode()
+
+
+def _bearer_subject(scope: Scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                return decode_token(token).get("sub")
+            except JWTError:
+                return None
+    return None
+
+
+class RateLimitMiddleware:
+    """Rejects over-limit requests with 429 before routing, so they never reach bcrypt or the DB.
+
+    The first matching rule applies. "user" policies key on the bearer token's subject (decoded via the
+    auth cache); anonymous requests and invalid tokens fall back to a per-IP bucket of the same policy, so
+    they cannot bypass it. "ip" policies key on the client address (run uvicorn with `--proxy-headers`
+    behind a proxy).
+    """
+
+    def __init__(self, app: ASGIApp, rules: list[RateRule], backend: MemoryBuckets | RedisBuckets):
+        self.app = app
+        self.rules = rules
+        self.backend = backend
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method, path = scope["method"], scope["path"]
+        for rule in self.rules:
+            if rule.matches(method, path):
+                break
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        policy = rule.policy
+        subject = _bearer_subject(scope) if policy.per == "user" else None
+        if subject:
+            identity = f"user:{subject}"
+        else:
+            client = scope.get("client")
+            identity = f"ip:{client[0] if client else 'unknown'}"
+        wait = await self.backend.take(f"{policy.name}:{identity}", policy)
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+
+        rate_limited.inc(policy.name)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_BODY)).encode()),
+                    (b"retry-after", str(math.ceil(wait)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": _BODY})
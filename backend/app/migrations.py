@@ -0,0 +1,122 @@
+"""Minimal forward-only schema migrations.
+
+`Base.metadata.create_all` creates missing tables (with their indexes) but never alters
+existing ones. Changes to tables that already exist in deployed databases are added here
+as numbered steps; applied versions are recorded in `schema_migrations`.
+"""
+from datetime import datetime
+from logging import getLogger
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, inspect, select
+from sqlalchemy.engine import Connection, Engine
+
+from .db import Base
+
+logger = getLogger(__name__)
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _meta,
+    Column("version", Integer, primary_key=True),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+
+def _ensure_declared_indexes(conn: Connection, only: set[str] | None = None) -> None:
+    """Create declared indexes missing from existing tables (all of them, or just the `only` names)."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in present and (only is None or index.name in only):
+                logger.info("Creating index", extra={"index": index.name, "table": table.name})
+                index.create(conn)
+
+
+def _create_audit_filter_indexes(conn: Connection) -> None:
+    # Databases that applied version 1 before these indexes were declared still need them
+    _ensure_declared_indexes(conn, only={"ix_audit_logs_actor_created", "ix_audit_logs_entity_created"})
+
+
+def _add_declared_columns(conn: Connection) -> None:
+    """Add nullable columns declared on models but missing from existing tables."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present:
+                continue
+            if not column.nullable:
+                raise RuntimeError(f"Cannot add NOT NULL column {table.name}.{column.name} automatically")
+            logger.info("Adding column", extra={"table": table.name, "column": column.name})
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+
+
+def _create_declared_tables(conn: Connection) -> None:
+    """Create tables declared on models but missing from the database (new tables need no ALTERs)."""
+    Base.metadata.create_all(bind=conn)
+
+
+def _build_candidate_profiles(conn: Connection) -> None:
+    from .services.profiles import rebuild_profiles
+
+    _create_declared_tables(conn)
+    rebuild_profiles(conn)
+
+
+def _build_search_index(conn: Connection) -> None:
+    from .repositories.search import rebuild_search_index
+
+    rebuild_search_index(conn)
+
+
+def _build_skill_tags(conn: Connection) -> None:
+    from .services.skill_tags import rebuild_skill_tags
+
+    _create_declared_tables(conn)
+    rebuild_skill_tags(conn)
+
+
+def _build_duplicate_index(conn: Connection) -> None:
+    from .services.duplicates import index_corpus
+
+    _create_declared_tables(conn)
+    index_corpus(conn)
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "hot foreign key, status and audit indexes", _ensure_declared_indexes),
+    (2, "audit log actor/entity filter indexes", _create_audit_filter_indexes),
+    (3, "evidence content hash and size", _add_declared_columns),
+    (4, "declared content hash on evidence uploads", _add_declared_columns),
+    (5, "refresh token revocation list", _create_declared_tables),
+    (6, "materialized candidate profiles", _build_candidate_profiles),
+    (7, "full-text claim search index", _build_search_index),
+    (8, "normalized skill tags with verified-claim counts", _build_skill_tags),
+    (9, "near-duplicate claim signatures and flags", _build_duplicate_index),
+]
+
+
+def migrate(engine: Engine) -> list[int]:
+    """Apply pending migrations in order; returns the versions applied."""
+    applied: list[int] = []
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        done = set(conn.execute(select(schema_migrations.c.version)).scalars())
+        for version, description, step in MIGRATIONS:
+            if version in done:
+                continue
+            logger.info("Applying migration", extra={"version": version, "description": description})
+            step(conn)
+            conn.execute(schema_migrations.insert().values(version=version))
+            applied.append(version)
+    return applied
@@ -1,13 +1,25 @@
 from .entities import (
     AuditLog,
+    CandidateProfile,
+    CandidateProfileOrg,
+    ClaimLshBucket,
+    ClaimSignature,
+    ClaimSkillTag,
     ClaimStatus,
     Dispute,
     DisputeStatus,
+    DuplicateFlag,
+    EmailOutbox,
+    EmailStatus,
+    EvidenceBlob,
     EvidenceFile,
+    EvidenceUpload,
     EvidenceVisibility,
     ExperienceClaim,
     OrgStatus,
     Organization,
+    RevokedToken,
+    SkillTag,
     User,
     UserRole,
     VerificationOutcome,
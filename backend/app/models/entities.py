@@ -2,7 +2,24 @@ import enum
 from datetime import datetime, date
 from typing import List
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, JSON, Numeric, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    LargeBinary,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import uuid4
@@ -46,6 +63,13 @@ class VerificationOutcome(str, enum.Enum):
     rejected = "rejected"
 
 
+class EmailStatus(str, enum.Enum):
+    pending = "pending"
+    sending = "sending"
+    sent = "sent"
+    failed = "failed"
+
+
 class DisputeStatus(str, enum.Enum):
     open = "open"
     under_review = "under_review"
@@ -87,21 +111,26 @@ class Organization(Base):
 
 class ExperienceClaim(Base):
     __tablename__ = "experience_claims"
+    __table_args__ = (
+        # Verifier inbox: status filter + keyset order, optionally narrowed to one organization
+        Index("ix_experience_claims_status_created", "status", "created_at", "id"),
+        Index("ix_experience_claims_org_status_created", "organization_name", "status", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
-    candidate_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
+    candidate_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
     title: Mapped[str] = mapped_column(String)
     claim_type: Mapped[str] = mapped_column(String)
-    organization_name: Mapped[str] = mapped_column(String)
+    organization_name: Mapped[str] = mapped_column(String, active_history=True)
     supervisor_name: Mapped[str] = mapped_column(String)
     supervisor_contact: Mapped[str] = mapped_column(String)
-    start_date: Mapped[date] = mapped_column(Date)
-    end_date: Mapped[date] = mapped_column(Date)
+    start_date: Mapped[date] = mapped_column(Date, active_history=True)
+    end_date: Mapped[date] = mapped_column(Date, active_history=True)
     description: Mapped[str] = mapped_column(Text)
     skill_tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
-    status: Mapped[ClaimStatus] = mapped_column(Enum(ClaimStatus), default=ClaimStatus.draft)
+    status: Mapped[ClaimStatus] = mapped_column(Enum(ClaimStatus), default=ClaimStatus.draft, active_history=True)
     evidence_visibility: Mapped[EvidenceVisibility] = mapped_column(Enum(EvidenceVisibility), default=EvidenceVisibility.verifier_only)
-    credibility_score: Mapped[float | None] = mapped_column(Numeric, nullable=True)
+    credibility_score: Mapped[float | None] = mapped_column(Numeric, nullable=True, active_history=True)
     credibility_breakdown: Mapped[list | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -114,22 +143,57 @@ class EvidenceFile(Base):
     __tablename__ = "evidence_files"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
-    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"))
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), index=True)
     file_name: Mapped[str] = mapped_column(String)
     mime_type: Mapped[str] = mapped_column(String)
     storage_path: Mapped[str] = mapped_column(String)
     is_public: Mapped[bool] = mapped_column(Boolean, default=False)
+    sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     claim: Mapped[ExperienceClaim] = relationship(back_populates="evidence")
 
 
+class EvidenceBlob(Base):
+    """Content-addressed evidence bytes shared by every `EvidenceFile` with the same hash and size."""
+
+    __tablename__ = "evidence_blobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
+    sha256: Mapped[str] = mapped_column(String(64), index=True)
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    storage_key: Mapped[str] = mapped_column(String, unique=True)
+    ref_count: Mapped[int] = mapped_column(Integer, default=0)
+    unreferenced_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class EvidenceUpload(Base):
+    """A resumable upload in progress; bytes are staged in storage until `size_bytes` have arrived."""
+
+    __tablename__ = "evidence_uploads"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), index=True)
+    owner_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
+    file_name: Mapped[str] = mapped_column(String)
+    mime_type: Mapped[str] = mapped_column(String)
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    is_public: Mapped[bool] = mapped_column(Boolean, default=False)
+    received_bytes: Mapped[int] = mapped_column(Integer, default=0)
+    evidence_id: Mapped[str | None] = mapped_column(String, ForeignKey("evidence_files.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
 class VerificationRecord(Base):
     __tablename__ = "verification_records"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
-    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"))
-    verifier_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), index=True)
+    verifier_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), index=True)
     organization_id: Mapped[str | None] = mapped_column(String, ForeignKey("organizations.id"), nullable=True)
     outcome: Mapped[VerificationOutcome] = mapped_column(Enum(VerificationOutcome))
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -147,7 +211,7 @@ class Dispute(Base):
     __tablename__ = "disputes"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
-    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"))
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), index=True)
     raised_by: Mapped[str] = mapped_column(String, ForeignKey("users.id"))
     status: Mapped[DisputeStatus] = mapped_column(Enum(DisputeStatus), default=DisputeStatus.open)
     reason: Mapped[str] = mapped_column(Text)
@@ -158,6 +222,11 @@ class Dispute(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_created", "created_at", "id"),
+        Index("ix_audit_logs_actor_created", "actor_id", "created_at", "id"),
+        Index("ix_audit_logs_entity_created", "entity_type", "entity_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     actor_id: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -166,3 +235,122 @@ class AuditLog(Base):
     entity_id: Mapped[str] = mapped_column(String)
     details: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Dispatcher claim query: due rows by status, oldest due first
+        Index("ix_email_outbox_status_due", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=uuid_default)
+    to_email: Mapped[str] = mapped_column(String)
+    subject: Mapped[str] = mapped_column(String)
+    body: Mapped[str] = mapped_column(Text)
+    status: Mapped[EmailStatus] = mapped_column(Enum(EmailStatus), default=EmailStatus.pending)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    lease_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class RevokedToken(Base):
+    """Refresh-token jtis that may not be used again; rows are pruned once the token has expired."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[str] = mapped_column(String, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class CandidateProfile(Base):
+    """Per-candidate aggregates over verified claims, maintained incrementally (see services/profiles.py)."""
+
+    __tablename__ = "candidate_profiles"
+
+    candidate_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), primary_key=True)
+    verified_claims: Mapped[int] = mapped_column(Integer, default=0)
+    score_total: Mapped[float] = mapped_column(Float, default=0.0)
+    verified_months: Mapped[int] = mapped_column(Integer, default=0)
+    verifying_organizations: Mapped[int] = mapped_column(Integer, default=0)
+    latest_verified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class CandidateProfileOrg(Base):
+    """Verified claims per (candidate, organization); backs the distinct `verifying_organizations` count."""
+
+    __tablename__ = "candidate_profile_orgs"
+
+    candidate_id: Mapped[str] = mapped_column(String, primary_key=True)
+    organization_name: Mapped[str] = mapped_column(String, primary_key=True)
+    verified_claims: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class SkillTag(Base):
+    """Normalized skill tag dictionary with a maintained count of verified claims (see services/skill_tags.py)."""
+
+    __tablename__ = "skill_tags"
+    __table_args__ = (Index("ix_skill_tags_verified_claims", "verified_claims", "name"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(64), unique=True)
+    verified_claims: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ClaimSkillTag(Base):
+    __tablename__ = "claim_skill_tags"
+    # Claims with a given tag: walk (tag_id, claim_id) instead of scanning skill_tags JSON
+    __table_args__ = (Index("ix_claim_skill_tags_tag_claim", "tag_id", "claim_id"),)
+
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), primary_key=True)
+    tag_id: Mapped[int] = mapped_column(Integer, ForeignKey("skill_tags.id"), primary_key=True)
+
+
+class ClaimSignature(Base):
+    """MinHash signature of a claim's text (see services/duplicates.py); the int id keeps bucket rows small."""
+
+    __tablename__ = "claim_signatures"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"), unique=True)
+    candidate_id: Mapped[str] = mapped_column(String)
+    contact_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    signature: Mapped[bytes] = mapped_column(LargeBinary)
+
+
+class ClaimLshBucket(Base):
+    __tablename__ = "claim_lsh_buckets"
+    # Collisions for a bucket: walk (bucket, signature_id); re-indexing a claim deletes by signature_id
+    __table_args__ = (Index("ix_claim_lsh_buckets_signature", "signature_id"),)
+
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    signature_id: Mapped[int] = mapped_column(Integer, ForeignKey("claim_signatures.id"), primary_key=True)
+
+
+class DuplicateFlag(Base):
+    """`claim_id` looks like a near-copy of another candidate's `duplicate_of_claim_id`."""
+
+    __tablename__ = "duplicate_flags"
+    __table_args__ = (
+        UniqueConstraint("claim_id", "duplicate_of_claim_id", name="uq_duplicate_flags_pair"),
+        Index("ix_duplicate_flags_created", "created_at", "id"),
+        Index("ix_duplicate_flags_candidate_created", "candidate_id", "created_at", "id"),
+        Index("ix_duplicate_flags_duplicate_of", "duplicate_of_claim_id"),
+        Index("ix_duplicate_flags_duplicate_of_candidate", "duplicate_of_candidate_id", "created_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"))
+    candidate_id: Mapped[str] = mapped_column(String)
+    duplicate_of_claim_id: Mapped[str] = mapped_column(String, ForeignKey("experience_claims.id"))
+    duplicate_of_candidate_id: Mapped[str] = mapped_column(String)
+    similarity: Mapped[float] = mapped_column(Float)
+    shared_contact: Mapped[bool] = mapped_column(Boolean, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..models import AuditLog
+
+EXPORT_COLUMNS = (
+    AuditLog.id,
+    AuditLog.action,
+    AuditLog.actor_id,
+    AuditLog.entity_type,
+    AuditLog.entity_id,
+    AuditLog.details,
+    AuditLog.created_at,
+)
+
+
+def _filtered(
+    stmt: Select,
+    actor_id: str | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Select:
+    if actor_id:
+        stmt = stmt.where(AuditLog.actor_id == actor_id)
+    if entity_type:
+        stmt = stmt.where(AuditLog.entity_type == entity_type)
+    if entity_id:
+        stmt = stmt.where(AuditLog.entity_id == entity_id)
+    if since:
+        stmt = stmt.where(AuditLog.created_at >= since)
+    if until:
+        stmt = stmt.where(AuditLog.created_at < until)
+    return stmt
+
+
+def recent_audit_logs(
+    db: Session, limit: int = 50, before: tuple[datetime, int] | None = None, **filters
+) -> list[AuditLog]:
+    """Newest-first page of audit entries, starting strictly before the given (created_at, id) position."""
+    stmt = _filtered(select(AuditLog), **filters)
+    if before:
+        stmt = stmt.where(tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*before))
+    stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit)
+    return list(db.scalars(stmt))
+
+
+def iter_audit_rows(db: Session, batch_size: int = 1000, **filters) -> Iterator:
+    """Oldest-first rows (not ORM objects) fetched through a server-side cursor in batches of `batch_size`."""
+    stmt = _filtered(select(*EXPORT_COLUMNS), **filters).order_by(AuditLog.created_at, AuditLog.id)
+    yield from db.execute(stmt.execution_options(yield_per=batch_size))
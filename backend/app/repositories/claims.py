@@ -1,7 +1,25 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from ..models import ClaimStatus, ExperienceClaim
+from ..models.entities import uuid_default
 from ..schemas.models import ExperienceClaimCreate, ExperienceClaimUpdate
+from ..services.duplicates import ClaimText, flag_near_duplicates
+from ..services.skill_tags import set_claim_tags
+
+# Loader options for callers that serialize relationships; each adds one batched SELECT
+# (IN over the parent ids) instead of one lazy load per claim.
+WITH_EVIDENCE: tuple[ExecutableOption, ...] = (selectinload(ExperienceClaim.evidence),)
+WITH_VERIFICATIONS: tuple[ExecutableOption, ...] = (selectinload(ExperienceClaim.verifications),)
+
+
+def claim_text(claim: ExperienceClaim) -> ClaimText:
+    return ClaimText(claim.id, claim.candidate_id, claim.title, claim.description, claim.supervisor_contact)
 
 
 def create_claim(db: Session, candidate_id: str, payload: ExperienceClaimCreate) -> ExperienceClaim:
@@ -20,22 +38,75 @@ def create_claim(db: Session, candidate_id: str, payload: ExperienceClaimCreate)
         status=ClaimStatus.draft,
     )
     db.add(claim)
+    db.flush()
+    set_claim_tags(db.connection(), [(claim.id, claim.skill_tags, False)])
+    flag_near_duplicates(db.connection(), [claim_text(claim)])
     db.commit()
     db.refresh(claim)
     return claim
 
 
-def get_claims_for_candidate(db: Session, candidate_id: str) -> list[ExperienceClaim]:
-    return db.query(ExperienceClaim).filter(ExperienceClaim.candidate_id == candidate_id).all()
+def bulk_create_claims(db: Session, claims: Sequence[tuple[str, ExperienceClaimCreate]]) -> list[str]:
+    """Insert draft claims for (candidate_id, payload) pairs in one executemany; the caller commits."""
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid_default(),
+            "candidate_id": candidate_id,
+            **payload.model_dump(include=set(ExperienceClaimCreate.model_fields)),
+            "skill_tags": payload.skill_tags or [],
+            "status": ClaimStatus.draft,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for candidate_id, payload in claims
+    ]
+    if rows:
+        db.execute(insert(ExperienceClaim), rows)
+        set_claim_tags(db.connection(), [(row["id"], row["skill_tags"], False) for row in rows])
+        flag_near_duplicates(
+            db.connection(),
+            [ClaimText(row["id"], row["candidate_id"], row["title"], row["description"], row["supervisor_contact"]) for row in rows],
+        )
+    return [row["id"] for row in rows]
+
+
+def _candidate_claims_stmt(candidate_id: str, options: Sequence[ExecutableOption]) -> Select:
+    return select(ExperienceClaim).options(*options).where(ExperienceClaim.candidate_id == candidate_id)
+
+
+def _claim_stmt(claim_id: str, options: Sequence[ExecutableOption]) -> Select:
+    return select(ExperienceClaim).options(*options).where(ExperienceClaim.id == claim_id)
+
+
+def get_claims_for_candidate(
+    db: Session, candidate_id: str, options: Sequence[ExecutableOption] = WITH_EVIDENCE
+) -> list[ExperienceClaim]:
+    return list(db.scalars(_candidate_claims_stmt(candidate_id, options)))
+
+
+async def get_claims_for_candidate_async(
+    db: AsyncSession, candidate_id: str, options: Sequence[ExecutableOption] = WITH_EVIDENCE
+) -> list[ExperienceClaim]:
+    return list(await db.scalars(_candidate_claims_stmt(candidate_id, options)))
+
+
+def get_claim(db: Session, claim_id: str, options: Sequence[ExecutableOption] = ()) -> ExperienceClaim | None:
+    return db.scalars(_claim_stmt(claim_id, options)).first()
 
 
-def get_claim(db: Session, claim_id: str) -> ExperienceClaim | None:
-    return db.query(ExperienceClaim).filter(ExperienceClaim.id == claim_id).first()
+async def get_claim_async(db: AsyncSession, claim_id: str, options: Sequence[ExecutableOption] = WITH_EVIDENCE) -> ExperienceClaim | None:
+    # Async sessions cannot lazy-load, so relationships the caller serializes must be loaded here
+    return (await db.scalars(_claim_stmt(claim_id, options))).first()
 
 
 def update_claim(db: Session, claim: ExperienceClaim, payload: ExperienceClaimUpdate) -> ExperienceClaim:
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    changes = payload.model_dump(exclude_unset=True)
+    for field, value in changes.items():
         setattr(claim, field, value)
+    if "skill_tags" in changes:
+        db.flush()
+        set_claim_tags(db.connection(), [(claim.id, claim.skill_tags, claim.status == ClaimStatus.verified)])
     db.commit()
     db.refresh(claim)
     return claim
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..models import DuplicateFlag
+
+
+def recent_duplicate_flags(
+    db: Session,
+    limit: int = 50,
+    before: tuple[datetime, int] | None = None,
+    claim_id: str | None = None,
+    candidate_id: str | None = None,
+    min_similarity: float | None = None,
+) -> list[DuplicateFlag]:
+    """Newest-first page of flags; `claim_id` and `candidate_id` match either side of a flagged pair."""
+    stmt = select(DuplicateFlag)
+    if claim_id:
+        stmt = stmt.where(or_(DuplicateFlag.claim_id == claim_id, DuplicateFlag.duplicate_of_claim_id == claim_id))
+    if candidate_id:
+        stmt = stmt.where(
+            or_(DuplicateFlag.candidate_id == candidate_id, DuplicateFlag.duplicate_of_candidate_id == candidate_id)
+        )
+    if min_similarity is not None:
+        stmt = stmt.where(DuplicateFlag.similarity >= min_similarity)
+    if before:
+        stmt = stmt.where(tuple_(DuplicateFlag.created_at, DuplicateFlag.id) < tuple_(*before))
+    stmt = stmt.order_by(DuplicateFlag.created_at.desc(), DuplicateFlag.id.desc()).limit(limit)
+    return list(db.scalars(stmt))
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models import EvidenceBlob, EvidenceFile, EvidenceUpload
+
+
+async def get_upload_async(db: AsyncSession, upload_id: str, claim_id: str, owner_id: str) -> EvidenceUpload | None:
+    stmt = select(EvidenceUpload).where(
+        EvidenceUpload.id == upload_id, EvidenceUpload.claim_id == claim_id, EvidenceUpload.owner_id == owner_id
+    )
+    return (await db.scalars(stmt)).first()
+
+
+def _release_stmts(evidence: EvidenceFile) -> list:
+    stmts = [
+        update(EvidenceUpload)
+        .where(EvidenceUpload.evidence_id == evidence.id)
+        .values(evidence_id=None)
+        .execution_options(synchronize_session=False)
+    ]
+    if evidence.sha256:
+        stmts.append(
+            update(EvidenceBlob)
+            .where(EvidenceBlob.storage_key == evidence.storage_path, EvidenceBlob.ref_count > 0)
+            .values(ref_count=EvidenceBlob.ref_count - 1, unreferenced_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    return stmts
+
+
+def delete_evidence(db: Session, evidence: EvidenceFile) -> None:
+    """Delete an evidence file, detaching the upload that produced it and releasing its blob reference."""
+    for stmt in _release_stmts(evidence):
+        db.execute(stmt)
+    db.delete(evidence)
+
+
+async def delete_evidence_async(db: AsyncSession, evidence: EvidenceFile) -> None:
+    for stmt in _release_stmts(evidence):
+        await db.execute(stmt)
+    await db.delete(evidence)
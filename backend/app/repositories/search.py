@@ -0,0 +1,267 @@
+"""Ranked full-text search over claims: SQLite FTS5 locally, Postgres tsvector/GIN in production.
+
+The index is maintained by the database itself, so every write path (ORM, executemany imports,
+bulk decisions, datagen) keeps it current with no application hooks:
+
+- SQLite: an FTS5 table keyed by `claim_search_ids` (an INTEGER PRIMARY KEY alias, stable across
+  VACUUM, mapped to the claim id) and kept in sync by triggers on `experience_claims`.
+- Postgres: a stored generated `search_vector` column on `experience_claims` with a GIN index.
+
+Title weighs most, then organization and skill tags, then description. Every query term is
+matched as a prefix, and results are ordered by (rank, id) so pages can be keyset-paginated.
+Ranks depend on corpus statistics, so a page boundary can shift slightly while claims are written.
+
+Skill facets and per-tag listings read the normalized tag tables kept by services/skill_tags.py.
+"""
+import unicodedata
+from typing import Sequence
+
+from sqlalchemy import Integer, Select, String, column, event, func, literal_column, select, table, tuple_
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
+
+from ..db import Base
+from ..models import ClaimSkillTag, ClaimStatus, ExperienceClaim, SkillTag
+
+MAX_TERMS = 8
+DEFAULT_MAX_CANDIDATES = 1000
+
+_search_fts = table("claim_search", column("rowid", Integer))
+_search_ids = table("claim_search_ids", column("rowid", Integer), column("claim_id", String))
+
+_SQLITE_DDL = [
+    """CREATE TABLE IF NOT EXISTS claim_search_ids (
+        rowid INTEGER PRIMARY KEY,
+        claim_id VARCHAR NOT NULL UNIQUE
+    )""",
+    # Marks (M*) and format characters (Cf: the zero-width joiners in Sinhala conjuncts) are token
+    # characters, so Sinhala/Tamil words are not split at vowel signs. Prefix indexes let "pyth"*
+    # stream one doclist instead of merging every token that starts with it.
+    """CREATE VIRTUAL TABLE IF NOT EXISTS claim_search USING fts5(
+        title, organization_name, skill_tags, description,
+        tokenize="unicode61 remove_diacritics 2 categories 'L* N* Co Cf M*'",
+        prefix='2 3 4 5 6'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS claim_search_insert AFTER INSERT ON experience_claims BEGIN
+        INSERT INTO claim_search_ids (claim_id) VALUES (new.id);
+        INSERT INTO claim_search (rowid, title, organization_name, skill_tags, description)
+        VALUES (last_insert_rowid(), new.title, new.organization_name, new.skill_tags, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS claim_search_update
+    AFTER UPDATE OF title, organization_name, skill_tags, description ON experience_claims BEGIN
+        UPDATE claim_search
+        SET title = new.title, organization_name = new.organization_name,
+            skill_tags = new.skill_tags, description = new.description
+        WHERE rowid = (SELECT rowid FROM claim_search_ids WHERE claim_id = new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS claim_search_delete AFTER DELETE ON experience_claims BEGIN
+        DELETE FROM claim_search WHERE rowid = (SELECT rowid FROM claim_search_ids WHERE claim_id = old.id);
+        DELETE FROM claim_search_ids WHERE claim_id = old.id;
+    END""",
+]
+
+_POSTGRES_DDL = [
+    """ALTER TABLE experience_claims ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(organization_name, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(skill_tags::text, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_experience_claims_search ON experience_claims USING GIN (search_vector)",
+]
+
+
+def ensure_search_index(conn: Connection) -> None:
+    """Create the index structures if missing (idempotent)."""
+    statements = {"sqlite": _SQLITE_DDL, "postgresql": _POSTGRES_DDL}.get(conn.dialect.name, [])
+    for statement in statements:
+        conn.exec_driver_sql(statement)
+
+
+def rebuild_search_index(conn: Connection) -> None:
+    """Re-index every claim (SQLite; Postgres generated columns never drift)."""
+    ensure_search_index(conn)
+    if conn.dialect.name != "sqlite":
+        return
+    conn.exec_driver_sql("DELETE FROM claim_search")
+    conn.exec_driver_sql("DELETE FROM claim_search_ids")
+    # Index rowids follow creation order, which is what the candidate window ranks ("most recent")
+    conn.exec_driver_sql("INSERT INTO claim_search_ids (claim_id) SELECT id FROM experience_claims ORDER BY created_at, id")
+    conn.exec_driver_sql(
+        """INSERT INTO claim_search (rowid, title, organization_name, skill_tags, description)
+        SELECT i.rowid, c.title, c.organization_name, c.skill_tags, c.description
+        FROM claim_search_ids i JOIN experience_claims c ON c.id = i.claim_id"""
+    )
+    conn.exec_driver_sql("INSERT INTO claim_search (claim_search) VALUES ('optimize')")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(target, connection: Connection, **kw) -> None:
+    ensure_search_index(connection)
+
+
+def search_terms(query: str) -> list[str]:
+    """Lower-cased word tokens split the way the SQLite tokenizer splits them, at most MAX_TERMS."""
+    terms, current = [], []
+    for ch in query.lower():
+        if ch.isalnum() or unicodedata.category(ch) == "Cf" or unicodedata.category(ch).startswith("M"):
+            current.append(ch)
+        elif current:
+            terms.append("".join(current))
+            current = []
+    if current:
+        terms.append("".join(current))
+    return terms[:MAX_TERMS]
+
+
+def _claim_filters(statuses: Sequence[ClaimStatus], min_score: float | None, max_score: float | None) -> list:
+    filters = [ExperienceClaim.status.in_(statuses)]
+    if min_score is not None:
+        filters.append(ExperienceClaim.credibility_score >= min_score)
+    if max_score is not None:
+        filters.append(ExperienceClaim.credibility_score <= max_score)
+    return filters
+
+
+def _matches(dialect: str, terms: Sequence[str], filters: Sequence, max_candidates: int):
+    """Subquery of (claim_id, rank) for claims matching every term as a prefix; lower rank is better.
+
+    Only the `max_candidates` most recently indexed matches that pass `filters` are ranked: scoring
+    is linear in the number of matches, so this bounds the cost of broad terms ("field", "py") on
+    large tables. Filtering before the cut keeps ineligible claims from crowding out eligible ones.
+    """
+    if dialect == "sqlite":
+        # bm25 weights follow the FTS column order: title, organization_name, skill_tags, description.
+        # Auxiliary functions are evaluated per returned row, so the LIMIT also bounds bm25 calls.
+        index = literal_column("claim_search")
+        return (
+            select(_search_ids.c.claim_id, func.bm25(index, 10.0, 4.0, 4.0, 1.0).label("rank"))
+            .select_from(
+                _search_fts.join(_search_ids, _search_ids.c.rowid == _search_fts.c.rowid).join(
+                    ExperienceClaim, ExperienceClaim.id == _search_ids.c.claim_id
+                )
+            )
+            .where(index.op("MATCH")(" ".join(f'"{term}"*' for term in terms)), *filters)
+            .order_by(_search_fts.c.rowid.desc())
+            .limit(max_candidates)
+            .subquery("matches")
+        )
+    if dialect == "postgresql":
+        vector = literal_column("experience_claims.search_vector")
+        query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        candidates = (
+            select(ExperienceClaim.id, vector.label("search_vector"))
+            .where(vector.op("@@")(query), *filters)
+            .order_by(ExperienceClaim.created_at.desc())
+            .limit(max_candidates)
+            .subquery("candidates")
+        )
+        return select(
+            candidates.c.id.label("claim_id"), (-func.ts_rank_cd(candidates.c.search_vector, query)).label("rank")
+        ).subquery("matches")
+    raise NotImplementedError(f"Claim search needs a full-text index for {dialect}")
+
+
+def _search_stmt(
+    dialect: str,
+    terms: Sequence[str],
+    statuses: Sequence[ClaimStatus],
+    min_score: float | None,
+    max_score: float | None,
+    limit: int,
+    after: tuple[float, str] | None,
+    options: Sequence[ExecutableOption],
+    max_candidates: int,
+) -> Select:
+    matches = _matches(dialect, terms, _claim_filters(statuses, min_score, max_score), max_candidates)
+    stmt = select(ExperienceClaim, matches.c.rank).join(matches, matches.c.claim_id == ExperienceClaim.id).options(*options)
+    if after:
+        stmt = stmt.where(tuple_(matches.c.rank, ExperienceClaim.id) > tuple_(*after))
+    return stmt.order_by(matches.c.rank, ExperienceClaim.id).limit(limit)
+
+
+def search_claims(
+    db: Session,
+    query: str,
+    statuses: Sequence[ClaimStatus] = (ClaimStatus.verified,),
+    min_score: float | None = None,
+    max_score: float | None = None,
+    limit: int = 20,
+    after: tuple[float, str] | None = None,
+    options: Sequence[ExecutableOption] = (),
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+) -> list[tuple[ExperienceClaim, float]]:
+    """Best matches first as (claim, rank); `after` is the (rank, id) of the previous page's last row."""
+    terms = search_terms(query)
+    if not terms:
+        return []
+    stmt = _search_stmt(db.get_bind().dialect.name, terms, statuses, min_score, max_score, limit, after, options, max_candidates)
+    return [(claim, rank) for claim, rank in db.execute(stmt).all()]
+
+
+async def search_claims_async(
+    db: AsyncSession,
+    query: str,
+    statuses: Sequence[ClaimStatus] = (ClaimStatus.verified,),
+    min_score: float | None = None,
+    max_score: float | None = None,
+    limit: int = 20,
+    after: tuple[float, str] | None = None,
+    options: Sequence[ExecutableOption] = (),
+    max_candidates: int = DEFAULT_MAX_CANDIDATES,
+) -> list[tuple[ExperienceClaim, float]]:
+    terms = search_terms(query)
+    if not terms:
+        return []
+    stmt = _search_stmt(db.get_bind().dialect.name, terms, statuses, min_score, max_score, limit, after, options, max_candidates)
+    return [(claim, rank) for claim, rank in (await db.execute(stmt)).all()]
+
+
+def _skill_facets_stmt(prefix: str | None, limit: int) -> Select:
+    # Reads the maintained counters; ix_skill_tags_verified_claims serves the order
+    stmt = select(SkillTag.name, SkillTag.verified_claims).where(SkillTag.verified_claims > 0)
+    if prefix:
+        stmt = stmt.where(SkillTag.name.startswith(prefix, autoescape=True))
+    return stmt.order_by(SkillTag.verified_claims.desc(), SkillTag.name).limit(limit)
+
+
+async def skill_facets_async(db: AsyncSession, prefix: str | None = None, limit: int = 50) -> list[tuple[str, int]]:
+    """(normalized tag, verified claims) pairs, most common first."""
+    return [(name, count) for name, count in (await db.execute(_skill_facets_stmt(prefix, limit))).all()]
+
+
+def _tagged_claims_stmt(tag: str, limit: int, after: str | None, options: Sequence[ExecutableOption]) -> Select:
+    stmt = (
+        select(ExperienceClaim)
+        .join(ClaimSkillTag, ClaimSkillTag.claim_id == ExperienceClaim.id)
+        .join(SkillTag, SkillTag.id == ClaimSkillTag.tag_id)
+        .options(*options)
+        .where(SkillTag.name == tag, ExperienceClaim.status == ClaimStatus.verified)
+    )
+    if after:
+        stmt = stmt.where(ClaimSkillTag.claim_id > after)
+    # Ordered by claim id so pages walk ix_claim_skill_tags_tag_claim instead of sorting every tagged claim
+    return stmt.order_by(ClaimSkillTag.claim_id).limit(limit)
+
+
+def claims_with_skill(
+    db: Session,
+    tag: str,
+    limit: int = 50,
+    after: str | None = None,
+    options: Sequence[ExecutableOption] = (),
+) -> list[ExperienceClaim]:
+    """Verified claims linked to the normalized `tag`; `after` is the previous page's last claim id."""
+    return list(db.scalars(_tagged_claims_stmt(tag, limit, after, options)))
+
+
+async def claims_with_skill_async(
+    db: AsyncSession,
+    tag: str,
+    limit: int = 50,
+    after: str | None = None,
+    options: Sequence[ExecutableOption] = (),
+) -> list[ExperienceClaim]:
+    return list(await db.scalars(_tagged_claims_stmt(tag, limit, after, options)))
@@ -1,3 +1,5 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..models import User, UserRole
@@ -5,12 +7,34 @@ from ..security import get_password_hash
 
 
 def get_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+    return db.scalars(select(User).where(User.email == email)).first()
+
+
+async def get_by_email_async(db: AsyncSession, email: str) -> User | None:
+    return (await db.scalars(select(User).where(User.email == email))).first()
+
+
+async def get_user_async(db: AsyncSession, user_id: str) -> User | None:
+    return await db.get(User, user_id)
 
 
 def create_user(db: Session, email: str, password: str, full_name: str, role: UserRole, org_id: str | None = None) -> User:
-    user = User(email=email, password_hash=get_password_hash(password), full_name=full_name, role=role, org_id=org_id)
+    return add_user(db, email, get_password_hash(password), full_name, role, org_id)
+
+
+def add_user(db: Session, email: str, password_hash: str, full_name: str, role: UserRole, org_id: str | None = None) -> User:
+    user = User(email=email, password_hash=password_hash, full_name=full_name, role=role, org_id=org_id)
     db.add(user)
     db.commit()
     db.refresh(user)
     return user
+
+
+async def add_user_async(
+    db: AsyncSession, email: str, password_hash: str, full_name: str, role: UserRole, org_id: str | None = None
+) -> User:
+    user = User(email=email, password_hash=password_hash, full_name=full_name, role=role, org_id=org_id)
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
@@ -1,7 +1,14 @@
+from datetime import date, datetime, time, timedelta
+from typing import Sequence
+
+from sqlalchemy import Select, case, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
 
-from ..models import ClaimStatus, ExperienceClaim, VerificationOutcome, VerificationRecord
+from ..models import ClaimStatus, ExperienceClaim, Organization, User, VerificationOutcome, VerificationRecord
 from ..schemas.models import VerificationDecision
+from .claims import WITH_EVIDENCE
 
 
 def create_verification(db: Session, claim: ExperienceClaim, verifier_id: str, decision: VerificationDecision, organization_id: str | None = None) -> VerificationRecord:
@@ -27,10 +34,87 @@ def create_verification(db: Session, claim: ExperienceClaim, verifier_id: str, d
     return record
 
 
+def verifier_org_name(verifier: User) -> str | None:
+    """The organization whose claims the verifier may decide; None lets an unaffiliated verifier decide any."""
+    return verifier.organization.name if verifier.organization is not None else None
+
+
+def may_decide(verifier: User, claim: ExperienceClaim) -> bool:
+    org_name = verifier_org_name(verifier)
+    return org_name is None or claim.organization_name == org_name
+
+
 def get_for_claim(db: Session, claim_id: str) -> list[VerificationRecord]:
-    return db.query(VerificationRecord).filter(VerificationRecord.claim_id == claim_id).all()
+    return list(db.scalars(select(VerificationRecord).where(VerificationRecord.claim_id == claim_id)))
+
+
+async def get_for_claim_async(db: AsyncSession, claim_id: str) -> list[VerificationRecord]:
+    return list(await db.scalars(select(VerificationRecord).where(VerificationRecord.claim_id == claim_id)))
+
+
+def verification_stats(db: Session, claim_ids: list[str], today: date) -> dict[str, tuple[int, bool]]:
+    """claim_id -> (verification count, any validity expired before `today`), in one grouped query."""
+    expired = func.max(case((VerificationRecord.valid_until < today, 1), else_=0))
+    rows = db.execute(
+        select(VerificationRecord.claim_id, func.count(VerificationRecord.id), expired)
+        .where(VerificationRecord.claim_id.in_(claim_ids))
+        .group_by(VerificationRecord.claim_id)
+    )
+    return {claim_id: (count, bool(has_expired)) for claim_id, count, has_expired in rows}
+
+
+def _inbox_stmt(
+    org_name: str | None,
+    limit: int,
+    after: tuple[datetime, str] | None,
+    claim_type: str | None,
+    created_from: date | None,
+    created_to: date | None,
+    options: Sequence[ExecutableOption],
+) -> Select:
+    stmt = select(ExperienceClaim).options(*options).where(ExperienceClaim.status == ClaimStatus.pending)
+    if org_name is not None:
+        stmt = stmt.where(ExperienceClaim.organization_name == org_name)
+    if claim_type:
+        stmt = stmt.where(ExperienceClaim.claim_type == claim_type)
+    if created_from:
+        stmt = stmt.where(ExperienceClaim.created_at >= datetime.combine(created_from, time.min))
+    if created_to:
+        stmt = stmt.where(ExperienceClaim.created_at < datetime.combine(created_to + timedelta(days=1), time.min))
+    if after:
+        stmt = stmt.where(tuple_(ExperienceClaim.created_at, ExperienceClaim.id) > tuple_(*after))
+    return stmt.order_by(ExperienceClaim.created_at, ExperienceClaim.id).limit(limit)
+
+
+def inbox_for_verifier(
+    db: Session,
+    verifier: User,
+    limit: int = 50,
+    after: tuple[datetime, str] | None = None,
+    claim_type: str | None = None,
+    created_from: date | None = None,
+    created_to: date | None = None,
+    options: Sequence[ExecutableOption] = WITH_EVIDENCE,
+) -> list[ExperienceClaim]:
+    """Pending claims ordered by (created_at, id), starting after the given keyset position.
+
+    Verifiers linked to an organization only see claims naming that organization;
+    unaffiliated verifiers still see every pending claim.
+    """
+    return list(db.scalars(_inbox_stmt(verifier_org_name(verifier), limit, after, claim_type, created_from, created_to, options)))
 
 
-def inbox_for_verifier(db: Session, verifier_id: str) -> list[ExperienceClaim]:
-    # Simplified: all pending claims for now; org linkage can refine later
-    return db.query(ExperienceClaim).filter(ExperienceClaim.status == ClaimStatus.pending).all()
+async def inbox_for_verifier_async(
+    db: AsyncSession,
+    verifier: User,
+    limit: int = 50,
+    after: tuple[datetime, str] | None = None,
+    claim_type: str | None = None,
+    created_from: date | None = None,
+    created_to: date | None = None,
+    options: Sequence[ExecutableOption] = WITH_EVIDENCE,
+) -> list[ExperienceClaim]:
+    org_name = None
+    if verifier.org_id is not None:
+        org_name = await db.scalar(select(Organization.name).where(Organization.id == verifier.org_id))
+    return list(await db.scalars(_inbox_stmt(org_name, limit, after, claim_type, created_from, created_to, options)))
@@ -21,10 +21,15 @@ class TokenResponse(Token):
     role: str
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class TokenPayload(BaseModel):
     sub: str | None = None
     role: UserRole | None = None
     exp: int | None = None
+    type: str | None = None
 
 
 class UserBase(BaseModel):
@@ -53,12 +58,31 @@ class EvidenceFileOut(BaseModel):
     file_name: str
     mime_type: str
     is_public: bool
+    size_bytes: int | None = None
     created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+class EvidenceUploadCreate(BaseModel):
+    file_name: str = Field(min_length=1, max_length=255)
+    mime_type: str
+    size_bytes: int = Field(gt=0)
+    sha256: str | None = Field(default=None, pattern="^[0-9a-f]{64}$", description="If already stored, no bytes are transferred")
+    is_public: bool = False
+
+
+class EvidenceUploadOut(BaseModel):
+    id: str
+    claim_id: str
+    file_name: str
+    mime_type: str
+    size_bytes: int
+    offset: int
+    evidence: EvidenceFileOut | None = None
+
+
 class ClaimBase(BaseModel):
     title: str
     claim_type: str
@@ -79,6 +103,19 @@ class ExperienceClaimCreate(ClaimBase):
     pass
 
 
+class ClaimImportError(BaseModel):
+    row: int
+    error: str
+
+
+class ClaimImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ClaimImportError]
+    errors_truncated: bool = False
+    elapsed_seconds: float
+
+
 class ExperienceClaimUpdate(BaseModel):
     title: Optional[str] = None
     claim_type: Optional[str] = None
@@ -111,6 +148,30 @@ class ExperienceClaimOut(ClaimBase):
         from_attributes = True
 
 
+class ClaimSearchResultOut(BaseModel):
+    """A claim as listed to searchers: no supervisor contact details and no evidence."""
+
+    id: str
+    title: str
+    claim_type: str
+    organization_name: str
+    start_date: date
+    end_date: date
+    description: str
+    skill_tags: List[str] | None = None
+    status: ClaimStatus
+    credibility_score: float | None = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ReportLinkOut(BaseModel):
+    token: str
+    expires_at: datetime
+
+
 class VerificationDecision(BaseModel):
     outcome: VerificationOutcome
     notes: str | None = None
@@ -123,6 +184,10 @@ class VerificationDecision(BaseModel):
         use_enum_values = True
 
 
+class BulkVerificationDecision(VerificationDecision):
+    claim_id: str
+
+
 class VerificationRecordOut(BaseModel):
     id: str
     outcome: VerificationOutcome
@@ -137,6 +202,14 @@ class VerificationRecordOut(BaseModel):
         from_attributes = True
 
 
+class BulkDecisionResult(BaseModel):
+    claim_id: str
+    ok: bool
+    error: str | None = None
+    verification: VerificationRecordOut | None = None
+    credibility_score: float | None = None
+
+
 class DisputeOut(BaseModel):
     id: str
     status: DisputeStatus
@@ -147,3 +220,52 @@ class DisputeOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class EvidenceGcReport(BaseModel):
+    blobs_deleted: int
+    bytes_freed: int
+    uploads_expired: int
+
+
+class RescoreReport(BaseModel):
+    scanned: int
+    updated: int
+    elapsed_seconds: float
+    claims_per_second: float
+    started_at: datetime
+
+
+class DuplicateIndexReport(BaseModel):
+    scanned: int
+    indexed: int = Field(description="Claims with a signature (some text to shingle)")
+    flagged: int
+    elapsed_seconds: float
+
+
+class DuplicateFlagOut(BaseModel):
+    id: int
+    claim_id: str
+    candidate_id: str
+    duplicate_of_claim_id: str
+    duplicate_of_candidate_id: str
+    similarity: float = Field(description="Estimated Jaccard similarity of the two claims' shingle sets")
+    shared_contact: bool = Field(description="Both claims name the same supervisor contact")
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CandidateProfileOut(BaseModel):
+    candidate_id: str
+    credibility_score: float = Field(description="Mean credibility score of the candidate's verified claims")
+    verified_claims: int
+    verified_months: int = Field(description="Sum of verified claim durations; overlapping claims count twice")
+    verifying_organizations: int
+    latest_verified_at: datetime | None = None
+
+
+class SkillFacetOut(BaseModel):
+    tag: str
+    verified_claims: int
@@ -1,23 +1,120 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+from uuid import uuid4
 
-from jose import jwt
+from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from .config import get_settings
+from .metrics import bcrypt_operations
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 settings = get_settings()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    bcrypt_operations.inc("verify")
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
+    bcrypt_operations.inc("hash")
     return pwd_context.hash(password)
 
 
+class HashingPoolFull(Exception):
+    """Raised when the password hashing queue is at capacity."""
+
+
+class PasswordHashingPool:
+    """Dedicated bcrypt executor with a bounded queue, kept apart from the request threadpool."""
+
+    def __init__(self, workers: int, queue_limit: int, sample_size: int = 1024):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._lock = threading.Lock()
+        self._durations: deque[float] = deque(maxlen=sample_size)
+        self._in_flight = 0
+        self.calls = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.total_wait_seconds = 0.0
+        self.max_seconds = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HashingPoolFull()
+        with self._lock:
+            self._in_flight += 1
+        submitted = time.perf_counter()
+
+        def timed() -> Any:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._record(started - submitted, time.perf_counter() - started)
+
+        try:
+            future = self._executor.submit(timed)
+        except RuntimeError:
+            self._release()
+            raise
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def _record(self, wait: float, duration: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.total_wait_seconds += wait
+            self.total_seconds += duration
+            self.max_seconds = max(self.max_seconds, duration)
+            self._durations.append(duration)
+        self._release()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._durations)
+            calls = self.calls
+            snapshot = {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._in_flight,
+                "calls": calls,
+                "rejected": self.rejected,
+                "avg_ms": round(self.total_seconds / calls * 1000, 2) if calls else 0.0,
+                "avg_wait_ms": round(self.total_wait_seconds / calls * 1000, 2) if calls else 0.0,
+                "max_ms": round(self.max_seconds * 1000, 2),
+            }
+        for label, q in (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            snapshot[label] = round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 2) if samples else 0.0
+        return snapshot
+
+
+password_pool = PasswordHashingPool(settings.password_hash_workers, settings.password_hash_queue_limit)
+
+
+async def verify_password_pooled(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_pooled(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
+
+
 def create_access_token(subject: str, role: str, expires_delta: Optional[timedelta] = None) -> str:
     to_encode: dict[str, Any] = {"sub": str(subject), "role": role}
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
@@ -26,7 +123,36 @@ def create_access_token(subject: str, role: str, expires_delta: Optional[timedel
 
 
 def create_refresh_token(subject: str, role: str, expires_delta: Optional[timedelta] = None) -> str:
-    to_encode: dict[str, Any] = {"sub": str(subject), "role": role, "type": "refresh"}
+    # jti identifies the token in the revocation store; each one can be rotated exactly once
+    to_encode: dict[str, Any] = {"sub": str(subject), "role": role, "type": "refresh", "jti": uuid4().hex}
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.refresh_token_expire_minutes))
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+
+
+def decode_refresh_token(token: str) -> dict[str, Any] | None:
+    """Return the payload of a well-formed, unexpired refresh token, else None. Revocation is checked separately."""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError:
+        return None
+    if payload.get("type") != "refresh" or not payload.get("jti") or not payload.get("sub"):
+        return None
+    return payload
+
+
+def create_report_token(claim_id: str, expires_delta: Optional[timedelta] = None) -> tuple[str, datetime]:
+    expire = datetime.utcnow() + (expires_delta or timedelta(days=settings.report_token_expire_days))
+    to_encode: dict[str, Any] = {"sub": str(claim_id), "type": "report", "exp": expire}
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm), expire
+
+
+def decode_report_token(token: str) -> str | None:
+    """Return the claim id of a valid, unexpired report token, else None. No DB access."""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    except JWTError:
+        return None
+    if payload.get("type") != "report":
+        return None
+    return payload.get("sub")
@@ -0,0 +1,138 @@
+import queue
+import threading
+import time
+from datetime import datetime
+from logging import getLogger
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from ..config import get_settings
+from ..db import engine
+from ..models import AuditLog
+
+logger = getLogger(__name__)
+settings = get_settings()
+
+_STOP = object()
+
+
+class AuditWriter:
+    """Bounded in-process queue of audit events, drained to `audit_logs` in batched INSERTs by a worker thread."""
+
+    def __init__(self, engine: Engine, maxsize: int, batch_size: int, flush_interval: float, enqueue_timeout: float):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+        # Counters are bumped by request threads (drops) and the worker (writes); read together in stats()
+        self._counter_lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush everything queued so far and stop the worker."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def try_emit(self, event: dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            return False
+
+    def emit(self, event: dict[str, Any]) -> None:
+        """Enqueue, blocking up to `enqueue_timeout` when the queue is full before dropping the event."""
+        try:
+            self._queue.put(event, timeout=self.enqueue_timeout)
+        except queue.Full:
+            with self._counter_lock:
+                self.dropped += 1
+            logger.warning("Audit queue full; event dropped", extra={"action": event.get("action")})
+
+    def stats(self) -> dict[str, int]:
+        with self._counter_lock:
+            return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped, "failed": self.failed}
+
+    def _run(self) -> None:
+        batch: list[dict[str, Any]] = []
+        deadline = None
+        stopping = False
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                    deadline = deadline or time.monotonic() + self.flush_interval
+            except queue.Empty:
+                pass
+            if batch and (stopping or len(batch) >= self.batch_size or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+                deadline = None
+        # Drain anything enqueued concurrently with the stop request
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(AuditLog), batch)
+            with self._counter_lock:
+                self.written += len(batch)
+        except Exception:
+            with self._counter_lock:
+                self.failed += len(batch)
+            logger.exception("Failed to write audit batch", extra={"size": len(batch)})
+
+
+audit_writer = AuditWriter(
+    engine,
+    maxsize=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    enqueue_timeout=settings.audit_enqueue_timeout_seconds,
+)
+
+
+def audit_event(
+    action: str, entity_type: str, entity_id: str, actor_id: str | None = None, details: dict | None = None
+) -> dict[str, Any]:
+    return {
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "actor_id": actor_id,
+        "details": details,
+        "created_at": datetime.utcnow(),
+    }
+
+
+def record_event(
+    action: str, entity_type: str, entity_id: str, actor_id: str | None = None, details: dict | None = None
+) -> None:
+    """Queue a domain audit event; safe to call from sync request handlers."""
+    audit_writer.emit(audit_event(action, entity_type, entity_id, actor_id, details))
@@ -0,0 +1,74 @@
+import hashlib
+import time
+
+from jose import jwt
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..cache import TTLCache
+from ..config import get_settings
+from ..models import User
+
+settings = get_settings()
+
+# Decoded access tokens keyed on a digest of the whole JWT; entries never outlive the token's exp.
+token_cache = TTLCache(settings.auth_cache_size, settings.auth_cache_ttl_seconds)
+# Detached User snapshots keyed on user id; merged into the request session without a SELECT.
+user_cache = TTLCache(settings.auth_cache_size, settings.auth_cache_ttl_seconds)
+
+_user_columns = [attr.key for attr in inspect(User).column_attrs]
+
+
+def decode_token(token: str) -> dict:
+    """Decode a JWT, reusing the cached claims for a previously verified token. Raises JWTError."""
+    # Keyed on header, payload and signature alike, so a hit is exactly the token that was verified
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    exp = payload.get("exp")
+    token_cache.set(key, payload, ttl=exp - time.time() if exp else None)
+    return payload
+
+
+def _remember(user: User) -> None:
+    snapshot = User(**{key: getattr(user, key) for key in _user_columns})
+    make_transient_to_detached(snapshot)
+    user_cache.set(user.id, snapshot)
+
+
+def load_user(db: Session, user_id: str) -> User | None:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return db.merge(cached, load=False)
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        _remember(user)
+    return user
+
+
+async def load_user_async(db: AsyncSession, user_id: str) -> User | None:
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return await db.merge(cached, load=False)
+    user = await db.get(User, user_id)
+    if user is not None:
+        _remember(user)
+    return user
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop a cached user, e.g. after its role or organization changes."""
+    user_cache.pop(user_id)
+
+
+def stats() -> dict:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
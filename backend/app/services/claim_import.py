@@ -0,0 +1,132 @@
+import csv
+import io
+import json
+import time
+from typing import IO, Iterator
+
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models import User, UserRole
+from ..repositories.claims import bulk_create_claims
+from ..schemas.models import ClaimImportError, ClaimImportReport, ExperienceClaimCreate
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+# Registration stores addresses as `EmailStr` normalizes them (domain lowercased), so lookups must too
+_candidate_email = TypeAdapter(EmailStr)
+
+
+def _unreadable(exc: Exception) -> str:
+    return f"File unreadable from here on ({type(exc).__name__}: {exc})"
+
+
+def iter_csv_rows(stream: IO[bytes]) -> Iterator[tuple[int, dict | str]]:
+    """Yield (row_number, fields) from a CSV file; `skill_tags` may be `;`-separated.
+
+    Undecodable bytes or malformed CSV end the file with one error entry at the row being read.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    number = 1
+    try:
+        for number, row in enumerate(reader, start=2):
+            row = {key: value for key, value in row.items() if key and value not in (None, "")}
+            if isinstance(row.get("skill_tags"), str):
+                row["skill_tags"] = [tag.strip() for tag in row["skill_tags"].split(";") if tag.strip()]
+            yield number, row
+    except (UnicodeDecodeError, csv.Error) as exc:
+        yield number + 1, _unreadable(exc)
+
+
+def iter_ndjson_rows(stream: IO[bytes]) -> Iterator[tuple[int, dict | str]]:
+    """Yield (line_number, object) from an NDJSON file; undecodable lines yield the error message."""
+    number = 0
+    try:
+        for number, line in enumerate(io.TextIOWrapper(stream, encoding="utf-8"), start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, f"Invalid JSON: {exc.msg}"
+    except UnicodeDecodeError as exc:
+        yield number + 1, _unreadable(exc)
+
+
+class _Report:
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[ClaimImportError] = []
+
+    def fail(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ClaimImportError(row=row, error=error))
+
+
+def _flush(db: Session, chunk: list[tuple[int, str, ExperienceClaimCreate]], report: _Report) -> None:
+    emails = {email for _, email, _ in chunk}
+    candidates = dict(
+        db.execute(select(User.email, User.id).where(User.email.in_(emails), User.role == UserRole.candidate)).all()
+    )
+    claims = []
+    for number, email, payload in chunk:
+        candidate_id = candidates.get(email)
+        if candidate_id is None:
+            report.fail(number, f"Unknown candidate {email}")
+            continue
+        claims.append((candidate_id, payload))
+    bulk_create_claims(db, claims)
+    db.commit()
+    report.imported += len(claims)
+
+
+def import_claims(
+    db: Session,
+    rows: Iterator[tuple[int, dict | str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    organization_name: str | None = None,
+) -> ClaimImportReport:
+    """Validate rows as they are read and insert them in chunk-sized transactions.
+
+    A given `organization_name` replaces the one in every row (verifiers import for their own
+    organization only). Memory is bounded by `chunk_size` plus at most MAX_REPORTED_ERRORS error entries.
+    """
+    start = time.perf_counter()
+    report = _Report()
+    chunk: list[tuple[int, str, ExperienceClaimCreate]] = []
+    for number, data in rows:
+        if isinstance(data, str):
+            report.fail(number, data)
+            continue
+        email = data.pop("candidate_email", None) if isinstance(data, dict) else None
+        if not isinstance(email, str) or not email.strip():
+            report.fail(number, "candidate_email: Field required")
+            continue
+        try:
+            email = _candidate_email.validate_python(email.strip())
+        except ValidationError:
+            report.fail(number, f"candidate_email: Invalid address {email.strip()}")
+            continue
+        if organization_name is not None:
+            data["organization_name"] = organization_name
+        try:
+            chunk.append((number, email, ExperienceClaimCreate.model_validate(data)))
+        except ValidationError as exc:
+            report.fail(number, "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()))
+            continue
+        if len(chunk) >= chunk_size:
+            _flush(db, chunk, report)
+            chunk = []
+    if chunk:
+        _flush(db, chunk, report)
+    return ClaimImportReport(
+        imported=report.imported,
+        failed=report.failed,
+        errors=report.errors,
+        errors_truncated=report.failed > len(report.errors),
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
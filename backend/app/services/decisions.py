@@ -0,0 +1,147 @@
+from datetime import date, datetime
+from typing import Sequence
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models import ClaimStatus, ExperienceClaim, User, VerificationOutcome, VerificationRecord
+from ..models.entities import uuid_default
+from ..repositories.verifications import may_decide, verification_stats, verifier_org_name
+from ..schemas.models import BulkDecisionResult, BulkVerificationDecision, VerificationRecordOut
+from .audit import record_event
+from .profiles import apply_claim_changes, contribution, record_verifications
+from .scoring import breakdown_json, score_factors
+from .skill_tags import apply_status_changes
+
+
+def decide_bulk(
+    db: Session, verifier: User, decisions: Sequence[BulkVerificationDecision], today: date | None = None
+) -> list[BulkDecisionResult]:
+    """Apply many verification decisions in one transaction.
+
+    Claims and their existing verification stats are loaded with one query each, scores are
+    computed in a single pass, and records/claims are written back with executemany statements.
+    Like the single decision, only pending claims in the verifier's inbox are decided; the others
+    are skipped and reported as failed results. The claim rows are locked while deciding, and the
+    update repeats the pending/organization filter.
+    """
+    today = today or date.today()
+    now = datetime.utcnow()
+    claim_ids = list({d.claim_id for d in decisions})
+    claims = {
+        row.id: row
+        for row in db.execute(
+            select(
+                ExperienceClaim.id,
+                ExperienceClaim.candidate_id,
+                ExperienceClaim.status,
+                ExperienceClaim.credibility_score,
+                ExperienceClaim.organization_name,
+                ExperienceClaim.start_date,
+                ExperienceClaim.end_date,
+                ExperienceClaim.evidence_visibility,
+            )
+            .where(ExperienceClaim.id.in_(claim_ids))
+            .with_for_update()
+        )
+    }
+    stats = verification_stats(db, list(claims), today)
+
+    results: list[BulkDecisionResult] = []
+    records: list[dict] = []
+    claim_updates: list[dict] = []
+    profile_changes = []
+    tag_changes: list[tuple[str, bool, bool]] = []
+    seen: set[str] = set()
+    for decision in decisions:
+        claim = claims.get(decision.claim_id)
+        if claim is None or not may_decide(verifier, claim):
+            results.append(BulkDecisionResult(claim_id=decision.claim_id, ok=False, error="Claim not found"))
+            continue
+        if decision.claim_id in seen:
+            results.append(BulkDecisionResult(claim_id=decision.claim_id, ok=False, error="Duplicate claim in batch"))
+            continue
+        if claim.status != ClaimStatus.pending:
+            results.append(BulkDecisionResult(claim_id=decision.claim_id, ok=False, error="Claim is not pending"))
+            continue
+        seen.add(decision.claim_id)
+
+        record = {
+            "id": uuid_default(),
+            "claim_id": claim.id,
+            "verifier_id": verifier.id,
+            "organization_id": verifier.org_id,
+            "outcome": VerificationOutcome(decision.outcome),
+            "notes": decision.notes,
+            "role_type": decision.role_type,
+            "verified_start_date": decision.verified_start_date,
+            "verified_end_date": decision.verified_end_date,
+            "valid_until": decision.valid_until,
+            "created_at": now,
+        }
+        records.append(record)
+
+        status = ClaimStatus.verified if record["outcome"] == VerificationOutcome.approved else ClaimStatus.rejected
+        count, expired = stats.get(claim.id, (0, False))
+        expired = expired or bool(decision.valid_until and decision.valid_until < today)
+        score, factors = score_factors(
+            status, claim.start_date, claim.end_date, claim.evidence_visibility, count + 1, expired, today
+        )
+        claim_updates.append(
+            {
+                "id": claim.id,
+                "status": status,
+                "credibility_score": score,
+                "credibility_breakdown": breakdown_json(factors),
+                "updated_at": now,
+            }
+        )
+        profile_changes.append(
+            (
+                claim.candidate_id,
+                contribution(claim.status, claim.credibility_score, claim.start_date, claim.end_date, claim.organization_name),
+                contribution(status, score, claim.start_date, claim.end_date, claim.organization_name),
+            )
+        )
+        tag_changes.append((claim.id, claim.status == ClaimStatus.verified, status == ClaimStatus.verified))
+        results.append(
+            BulkDecisionResult(
+                claim_id=claim.id,
+                ok=True,
+                verification=VerificationRecordOut.model_validate(record),
+                credibility_score=score,
+            )
+        )
+
+    if records:
+        db.execute(insert(VerificationRecord), records)
+        guard = update(ExperienceClaim).where(ExperienceClaim.status == ClaimStatus.pending)
+        org_name = verifier_org_name(verifier)
+        if org_name is not None:
+            guard = guard.where(ExperienceClaim.organization_name == org_name)
+        # Rows were loaded as tuples, so there are no persistent objects to synchronize
+        db.execute(guard.execution_options(synchronize_session=None), claim_updates)
+        # Executemany bypasses the ORM flush listeners, so profile and tag deltas are applied explicitly
+        conn = db.connection()
+        apply_claim_changes(conn, profile_changes)
+        apply_status_changes(conn, tag_changes)
+        record_verifications(
+            conn,
+            [(claims[r["claim_id"]].candidate_id, now) for r in records if r["outcome"] == VerificationOutcome.approved],
+        )
+    db.commit()
+
+    for record, claim_update in zip(records, claim_updates):
+        record_event(
+            "verification.decision",
+            "claim",
+            record["claim_id"],
+            actor_id=verifier.id,
+            details={
+                "outcome": record["outcome"].value,
+                "verification_id": record["id"],
+                "score": claim_update["credibility_score"],
+                "bulk": True,
+            },
+        )
+    return results
@@ -0,0 +1,394 @@
+"""Near-duplicate claim detection: MinHash signatures with LSH banding.
+
+Each claim is shingled (description word 3-grams, title words, the normalized supervisor contact)
+and reduced to a NUM_PERM x uint32 MinHash signature, stored packed in `claim_signatures`. The
+signature is cut into BANDS bands of ROWS values; each band hashes to one `claim_lsh_buckets` row,
+so claims that agree on any whole band collide and are compared (Jaccard estimated as the share of
+equal signature values). A claim is flagged against another candidate's claim at or above the
+similarity threshold; same-candidate pairs are ignored.
+
+`flag_near_duplicates` runs when claims are created and when a draft is submitted for verification;
+a claim whose signature is unchanged since it was indexed is skipped. It looks at no more than
+`max_candidates` most recently indexed colliders per claim. `index_corpus` rebuilds the index and
+every flag in one pass (`python -m app.cli index-duplicates`); it keeps all signatures in
+one contiguous array (NUM_PERM * 4 bytes per claim) while it walks the buckets in index order.
+"""
+import hashlib
+import time
+import unicodedata
+from array import array
+from operator import eq
+from typing import Iterable, NamedTuple, Sequence
+
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.engine import Connection
+
+from ..config import get_settings
+from ..db import dialect_insert
+from ..models import ClaimLshBucket, ClaimSignature, DuplicateFlag, ExperienceClaim
+from ..schemas.models import DuplicateIndexReport
+
+settings = get_settings()
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+DEFAULT_CHUNK_SIZE = 5000
+
+signatures = ClaimSignature.__table__
+buckets = ClaimLshBucket.__table__
+flags = DuplicateFlag.__table__
+
+# Two 64-byte digests give the 32 uint32 hash functions
+_SALTS = (b"verifylk-mh-0", b"verifylk-mh-1")
+_WORD_CATEGORIES = {"Mn", "Mc", "Me", "Cf"}
+
+
+class ClaimText(NamedTuple):
+    claim_id: str
+    candidate_id: str
+    title: str
+    description: str
+    supervisor_contact: str
+
+
+CLAIM_TEXT_COLUMNS = (
+    ExperienceClaim.id,
+    ExperienceClaim.candidate_id,
+    ExperienceClaim.title,
+    ExperienceClaim.description,
+    ExperienceClaim.supervisor_contact,
+)
+
+
+def _words(text: str) -> list[str]:
+    # Vowel signs and zero-width joiners stay inside Sinhala/Tamil words, as in the search tokenizer
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return "".join(
+        ch if ch.isalnum() or unicodedata.category(ch) in _WORD_CATEGORIES else " " for ch in text
+    ).split()
+
+
+def contact_key(contact: str | None) -> str | None:
+    """Supervisor contact in one canonical spelling: e-mails case-folded, phone numbers as local digits."""
+    text = "".join(unicodedata.normalize("NFKC", contact or "").casefold().split())
+    if not text:
+        return None
+    if "@" in text:
+        return text
+    digits = "".join(ch for ch in text if ch.isdigit())
+    if len(digits) >= 9:
+        return "0" + digits[2:] if digits.startswith("94") and len(digits) == 11 else digits
+    return text
+
+
+def shingles(title: str, description: str, supervisor_contact: str | None) -> set[str]:
+    words = _words(description)
+    result = {"d:" + " ".join(words[i : i + 3]) for i in range(max(len(words) - 2, 1))} if words else set()
+    result.update("t:" + word for word in _words(title))
+    contact = contact_key(supervisor_contact)
+    if contact:
+        # One shingle, so a shared supervisor alone (many interns, one manager) does not make claims similar
+        result.add("c:" + contact)
+    return result
+
+
+def _hashes(shingle: str) -> array:
+    data = shingle.encode()
+    values = array("I")
+    for salt in _SALTS:
+        values.frombytes(hashlib.blake2b(data, digest_size=64, salt=salt).digest())
+    return values
+
+
+def minhash(items: Iterable[str]) -> array | None:
+    """NUM_PERM-value signature of a shingle set, or None for an empty set."""
+    rows = [_hashes(item) for item in items]
+    if not rows:
+        return None
+    return array("I", map(min, zip(*rows)))
+
+
+def band_keys(signature: array) -> list[int]:
+    """One signed 64-bit bucket key per band (the band number is hashed in, so bands never share keys)."""
+    keys = []
+    for band in range(BANDS):
+        part = bytes([band]) + signature[band * ROWS : (band + 1) * ROWS].tobytes()
+        keys.append(int.from_bytes(hashlib.blake2b(part, digest_size=8).digest(), "big", signed=True))
+    return keys
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    return sum(map(eq, a, b)) / NUM_PERM
+
+
+def _signature(blob: bytes) -> array:
+    values = array("I")
+    values.frombytes(blob)
+    return values
+
+
+def _index(conn: Connection, claims: list[ClaimText]) -> dict[str, tuple[int, array, str | None]]:
+    """Write signatures and bucket rows for the `claims` whose signature changed (or is new).
+
+    Returns claim_id -> (signature id, signature, contact) for the claims written; unchanged claims
+    keep their index rows, and with them their place in "most recently indexed".
+    """
+    stored = {
+        row.claim_id: (row.signature, row.contact_key)
+        for row in conn.execute(
+            select(signatures.c.claim_id, signatures.c.signature, signatures.c.contact_key).where(
+                signatures.c.claim_id.in_([claim.claim_id for claim in claims])
+            )
+        )
+    }
+    computed, changed = {}, []
+    for claim in claims:
+        signature = minhash(shingles(claim.title, claim.description, claim.supervisor_contact))
+        contact = contact_key(claim.supervisor_contact)
+        if signature is not None and stored.get(claim.claim_id) == (signature.tobytes(), contact):
+            continue
+        changed.append(claim.claim_id)
+        if signature is not None:
+            computed[claim.claim_id] = (claim, signature, contact)
+    if not changed:
+        return {}
+    stale = select(signatures.c.id).where(signatures.c.claim_id.in_(changed))
+    conn.execute(delete(buckets).where(buckets.c.signature_id.in_(stale)))
+    conn.execute(delete(signatures).where(signatures.c.claim_id.in_(changed)))
+    if not computed:
+        return {}
+    conn.execute(
+        signatures.insert(),
+        [
+            {
+                "claim_id": claim.claim_id,
+                "candidate_id": claim.candidate_id,
+                "contact_key": contact,
+                "signature": signature.tobytes(),
+            }
+            for claim, signature, contact in computed.values()
+        ],
+    )
+    ids = dict(conn.execute(select(signatures.c.claim_id, signatures.c.id).where(signatures.c.claim_id.in_(list(computed)))).all())
+    conn.execute(
+        buckets.insert(),
+        [
+            {"bucket": key, "signature_id": ids[claim_id]}
+            for claim_id, (_, signature, _) in computed.items()
+            for key in set(band_keys(signature))
+        ],
+    )
+    return {claim_id: (ids[claim_id], signature, contact) for claim_id, (_, signature, contact) in computed.items()}
+
+
+def flag_near_duplicates(
+    conn: Connection,
+    claims: Iterable[ClaimText],
+    threshold: float | None = None,
+    max_candidates: int | None = None,
+    max_flags: int | None = None,
+) -> int:
+    """(Re-)index `claims` and flag them against colliding claims of other candidates; returns flags added.
+
+    Runs in the caller's transaction. Within one call, a pair of new claims is flagged once (the later
+    claim against the earlier). Claims whose signature is unchanged are skipped: they were flagged
+    when indexed, and claims indexed since were flagged against them. A no-op when
+    `duplicate_detection_enabled` is off.
+    """
+    if not settings.duplicate_detection_enabled:
+        return 0
+    threshold = settings.duplicate_similarity_threshold if threshold is None else threshold
+    max_candidates = max_candidates or settings.duplicate_max_candidates
+    max_flags = max_flags or settings.duplicate_max_flags_per_claim
+    claims = {claim.claim_id: claim for claim in claims}
+    indexed = _index(conn, list(claims.values()))
+    order = {signature_id: i for i, (signature_id, _, _) in enumerate(indexed.values())}
+
+    colliders: dict[str, list[int]] = {}
+    for claim_id, (signature_id, signature, _) in indexed.items():
+        colliders[claim_id] = list(
+            conn.execute(
+                select(buckets.c.signature_id)
+                .where(buckets.c.bucket.in_(band_keys(signature)), buckets.c.signature_id != signature_id)
+                .distinct()
+                .order_by(buckets.c.signature_id.desc())
+                .limit(max_candidates)
+            ).scalars()
+        )
+    wanted = {other for others in colliders.values() for other in others}
+    if not wanted:
+        return 0
+    others = {
+        row.id: row
+        for row in conn.execute(
+            select(signatures.c.id, signatures.c.claim_id, signatures.c.candidate_id, signatures.c.contact_key, signatures.c.signature)
+            .where(signatures.c.id.in_(list(wanted)))
+        )
+    }
+
+    # A claim submitted after being flagged against is not flagged back against the same claim
+    flagged_back = set(
+        conn.execute(
+            select(flags.c.claim_id, flags.c.duplicate_of_claim_id).where(
+                flags.c.claim_id.in_([row.claim_id for row in others.values()]), flags.c.duplicate_of_claim_id.in_(list(indexed))
+            )
+        ).all()
+    )
+    rows = []
+    for claim_id, (signature_id, signature, contact) in indexed.items():
+        claim = claims[claim_id]
+        matches = []
+        for other_id in colliders[claim_id]:
+            other = others.get(other_id)
+            if other is None or other.candidate_id == claim.candidate_id or order.get(other_id, -1) > order[signature_id]:
+                continue
+            score = similarity(signature, _signature(other.signature))
+            if score >= threshold and (other.claim_id, claim_id) not in flagged_back:
+                matches.append((score, other))
+        matches.sort(key=lambda match: match[0], reverse=True)
+        rows.extend(
+            {
+                "claim_id": claim_id,
+                "candidate_id": claim.candidate_id,
+                "duplicate_of_claim_id": other.claim_id,
+                "duplicate_of_candidate_id": other.candidate_id,
+                "similarity": score,
+                "shared_contact": contact is not None and contact == other.contact_key,
+            }
+            for score, other in matches[:max_flags]
+        )
+    return _insert_flags(conn, rows)
+
+
+def _insert_flags(conn: Connection, rows: list[dict]) -> int:
+    if not rows:
+        return 0
+    insert = dialect_insert(conn)
+    result = conn.execute(
+        insert(flags).on_conflict_do_nothing(index_elements=[flags.c.claim_id, flags.c.duplicate_of_claim_id]), rows
+    )
+    return max(result.rowcount, 0)
+
+
+def _shares_earlier_band(sigs: array, i: int, j: int, limit: int) -> bool:
+    """True if signatures i and j agree on a whole band before `limit` (the pair was compared there)."""
+    for band in range(limit):
+        start = band * ROWS
+        if sigs[i * NUM_PERM + start : i * NUM_PERM + start + ROWS] == sigs[j * NUM_PERM + start : j * NUM_PERM + start + ROWS]:
+            return True
+    return False
+
+
+def index_corpus(
+    conn: Connection,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    threshold: float | None = None,
+    max_candidates: int | None = None,
+    max_flags: int | None = None,
+) -> DuplicateIndexReport:
+    """Re-index every claim and recompute all flags in one keyset pass over claims (oldest first).
+
+    Signature ids are assigned in creation order, so "most recent colliders" means the same thing
+    here and in `flag_near_duplicates`. Each colliding pair is compared once, in its lowest shared band.
+    """
+    started = time.perf_counter()
+    threshold = settings.duplicate_similarity_threshold if threshold is None else threshold
+    max_candidates = max_candidates or settings.duplicate_max_candidates
+    max_flags = max_flags or settings.duplicate_max_flags_per_claim
+    conn.execute(delete(flags))
+    conn.execute(delete(buckets))
+    conn.execute(delete(signatures))
+
+    # Position n in these arrays is signature id n + 1
+    sigs, candidates, contacts = array("I"), array("I"), array("I")
+    candidate_ids: dict[str, int] = {}
+    contact_ids: dict[str, int] = {}
+    scanned = 0
+    after = None
+    while True:
+        stmt = select(*CLAIM_TEXT_COLUMNS, ExperienceClaim.created_at)
+        if after:
+            stmt = stmt.where(tuple_(ExperienceClaim.created_at, ExperienceClaim.id) > tuple_(*after))
+        rows = conn.execute(stmt.order_by(ExperienceClaim.created_at, ExperienceClaim.id).limit(chunk_size)).all()
+        if not rows:
+            break
+        after = (rows[-1].created_at, rows[-1].id)
+        scanned += len(rows)
+        signature_rows, bucket_rows = [], []
+        for row in rows:
+            claim = ClaimText(*row[:5])
+            signature = minhash(shingles(claim.title, claim.description, claim.supervisor_contact))
+            if signature is None:
+                continue
+            contact = contact_key(claim.supervisor_contact)
+            signature_id = len(candidates) + 1
+            sigs.extend(signature)
+            candidates.append(candidate_ids.setdefault(claim.candidate_id, len(candidate_ids)))
+            contacts.append(contact_ids.setdefault(contact, len(contact_ids) + 1) if contact else 0)
+            signature_rows.append(
+                {
+                    "id": signature_id,
+                    "claim_id": claim.claim_id,
+                    "candidate_id": claim.candidate_id,
+                    "contact_key": contact,
+                    "signature": signature.tobytes(),
+                }
+            )
+            bucket_rows.extend({"bucket": key, "signature_id": signature_id} for key in set(band_keys(signature)))
+        if signature_rows:
+            conn.execute(signatures.insert(), signature_rows)
+            conn.execute(buckets.insert(), bucket_rows)
+    if conn.dialect.name == "postgresql" and len(candidates):
+        conn.execute(text("SELECT setval(pg_get_serial_sequence('claim_signatures', 'id'), :last)"), {"last": len(candidates)})
+
+    pairs: list[tuple[int, int, float]] = []
+    flagged: dict[int, int] = {}
+    current, band, members = None, 0, []
+    walk = select(buckets.c.bucket, buckets.c.signature_id).order_by(buckets.c.bucket, buckets.c.signature_id)
+    for bucket, signature_id in conn.execution_options(yield_per=chunk_size).execute(walk):
+        i = signature_id - 1
+        if bucket != current:
+            current, members = bucket, [i]
+            continue
+        if len(members) == 1:
+            band = band_keys(sigs[members[0] * NUM_PERM : (members[0] + 1) * NUM_PERM]).index(bucket)
+        for j in members[-max_candidates:]:
+            if flagged.get(i, 0) >= max_flags:
+                break
+            if candidates[i] == candidates[j] or _shares_earlier_band(sigs, i, j, band):
+                continue
+            score = similarity(sigs[i * NUM_PERM : (i + 1) * NUM_PERM], sigs[j * NUM_PERM : (j + 1) * NUM_PERM])
+            if score >= threshold:
+                pairs.append((i, j, score))
+                flagged[i] = flagged.get(i, 0) + 1
+        members.append(i)
+
+    added = 0
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start : start + chunk_size]
+        ids = {n + 1 for i, j, _ in chunk for n in (i, j)}
+        owners = {
+            row.id: row
+            for row in conn.execute(
+                select(signatures.c.id, signatures.c.claim_id, signatures.c.candidate_id).where(signatures.c.id.in_(ids))
+            )
+        }
+        added += _insert_flags(
+            conn,
+            [
+                {
+                    "claim_id": owners[i + 1].claim_id,
+                    "candidate_id": owners[i + 1].candidate_id,
+                    "duplicate_of_claim_id": owners[j + 1].claim_id,
+                    "duplicate_of_candidate_id": owners[j + 1].candidate_id,
+                    "similarity": score,
+                    "shared_contact": contacts[i] != 0 and contacts[i] == contacts[j],
+                }
+                for i, j, score in chunk
+            ],
+        )
+    elapsed = time.perf_counter() - started
+    return DuplicateIndexReport(
+        scanned=scanned, indexed=len(candidates), flagged=added, elapsed_seconds=round(elapsed, 3)
+    )
@@ -1,8 +1,293 @@
+import smtplib
+import threading
+from datetime import datetime, timedelta
+from email.message import EmailMessage
 from logging import getLogger
+from uuid import uuid4
+
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..db import engine
+from ..models import EmailOutbox, EmailStatus
 
 logger = getLogger(__name__)
+settings = get_settings()
+
+
+def enqueue_email(db: Session, to_email: str, subject: str, body: str) -> EmailOutbox:
+    """Add a message to the outbox; it is sent only once the caller's transaction commits."""
+    message = EmailOutbox(to_email=to_email, subject=subject, body=body)
+    db.add(message)
+    return message
+
+
+def send_verification_request_email(db: Session, to_email: str, claim_id: str, candidate_name: str, link: str) -> EmailOutbox:
+    subject = f"{candidate_name} asked you to verify their experience"
+    body = (
+        f"{candidate_name} listed you as a supervisor on VerifyLK and asked you to confirm their experience.\n\n"
+        f"Review the claim: {link}\n\nClaim reference: {claim_id}\n"
+    )
+    return enqueue_email(db, to_email, subject, body)
+
+
+def backoff_delay(attempts: int, base: float, cap: float) -> float:
+    return min(cap, base * 2 ** max(0, attempts - 1))
+
+
+class LoggingTransport:
+    """Stands in for a provider when SMTP is not configured."""
+
+    def send(self, message: EmailMessage) -> None:
+        logger.info("Email (not sent, SMTP unset)", extra={"to": message["To"], "subject": message["Subject"]})
+
+    def close(self) -> None:
+        pass
+
+
+class SMTPTransport:
+    """One SMTP session reused across messages and batches; reconnects when the server drops it."""
+
+    def __init__(self, host: str, port: int, username: str | None, password: str | None, starttls: bool, timeout: float):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp: smtplib.SMTP | None = None
+        self.connections = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        self.connections += 1
+        return smtp
+
+    def send(self, message: EmailMessage) -> None:
+        if self._smtp is None:
+            self._smtp = self._connect()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self._smtp = self._connect()
+            self._smtp.send_message(message)
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
+
+def _is_permanent(exc: Exception) -> bool:
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    return isinstance(exc, smtplib.SMTPResponseException) and exc.smtp_code >= 500
+
+
+class EmailDispatcher:
+    """Background worker that claims due outbox rows in batches and delivers them over one transport.
+
+    Claiming is a single `UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)`, so concurrent
+    dispatchers on Postgres take disjoint batches. SQLite renders no FOR UPDATE but runs the statement
+    under its database write lock, which gives the same guarantee. Rows stuck in `sending` past their
+    lease (a crashed dispatcher) become claimable again.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        transport_factory,
+        sender: str,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+        lease_seconds: float,
+    ):
+        self.engine = engine
+        self.transport_factory = transport_factory
+        self.sender = sender
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self._transport = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="email-dispatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def wake(self) -> None:
+        """Skip the rest of the poll interval, e.g. right after a request enqueued mail."""
+        self._wake.set()
+
+    def stats(self) -> dict[str, int]:
+        with Session(self.engine) as db:
+            counts = dict(db.execute(select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)).all())
+        return {
+            **{f"outbox_{s.value}": counts.get(s, 0) for s in EmailStatus},
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        try:
+            while not self._stopping.is_set():
+                try:
+                    delivered = self.dispatch_once()
+                except Exception:
+                    logger.exception("Email dispatch cycle failed")
+                    delivered = 0
+                if delivered < self.batch_size:
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+        finally:
+            self._close_transport()
+
+    def claim_batch(self, now: datetime | None = None) -> list[EmailOutbox]:
+        now = now or datetime.utcnow()
+        lease_id = str(uuid4())
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                ((EmailOutbox.status == EmailStatus.pending) & (EmailOutbox.next_attempt_at <= now))
+                | ((EmailOutbox.status == EmailStatus.sending) & (EmailOutbox.locked_until < now))
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        with Session(self.engine, expire_on_commit=False) as db:
+            db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(due.scalar_subquery()))
+                .values(
+                    status=EmailStatus.sending,
+                    lease_id=lease_id,
+                    locked_until=now + timedelta(seconds=self.lease_seconds),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return list(db.scalars(select(EmailOutbox).where(EmailOutbox.lease_id == lease_id)))
+
+    def dispatch_once(self, now: datetime | None = None) -> int:
+        """Claim and deliver one batch; returns the number of messages sent."""
+        batch = self.claim_batch(now)
+        if not batch:
+            return 0
+        settled: list[dict] = []
+        sent = 0
+        for row in batch:
+            try:
+                self._transport_for_send().send(self._message(row))
+            except Exception as exc:
+                # Reply errors leave the SMTP session usable; anything else may have broken it mid-command.
+                if not isinstance(exc, (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException)):
+                    self._close_transport()
+                settled.append(self._failure(row, exc, now))
+                continue
+            sent += 1
+            settled.append({"id": row.id, "status": EmailStatus.sent, "sent_at": datetime.utcnow(), "last_error": None})
+        self._settle(batch[0].lease_id, settled)
+        self.sent += sent
+        return sent
+
+    def _settle(self, lease_id: str, settled: list[dict]) -> None:
+        # A row whose lease expired mid-send may have been claimed again; only its new holder settles it
+        with Session(self.engine) as db:
+            db.execute(
+                update(EmailOutbox).where(EmailOutbox.lease_id == lease_id).execution_options(synchronize_session=None),
+                [{**values, "lease_id": None, "locked_until": None} for values in settled],
+            )
+            db.commit()
+
+    def _failure(self, row: EmailOutbox, exc: Exception, now: datetime | None) -> dict:
+        attempts = row.attempts + 1
+        error = f"{type(exc).__name__}: {exc}"[:1000]
+        if _is_permanent(exc) or attempts >= self.max_attempts:
+            self.failed += 1
+            logger.warning("Email delivery failed permanently", extra={"email_id": row.id, "error": error})
+            return {"id": row.id, "status": EmailStatus.failed, "attempts": attempts, "last_error": error}
+        self.retried += 1
+        delay = backoff_delay(attempts, self.backoff_base, self.backoff_max)
+        return {
+            "id": row.id,
+            "status": EmailStatus.pending,
+            "attempts": attempts,
+            "last_error": error,
+            "next_attempt_at": (now or datetime.utcnow()) + timedelta(seconds=delay),
+        }
+
+    def _message(self, row: EmailOutbox) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = row.to_email
+        message["Subject"] = row.subject
+        message.set_content(row.body)
+        return message
+
+    def _transport_for_send(self):
+        if self._transport is None:
+            self._transport = self.transport_factory()
+        return self._transport
+
+    def _close_transport(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+def default_transport():
+    if not settings.smtp_host:
+        return LoggingTransport()
+    return SMTPTransport(
+        settings.smtp_host,
+        settings.smtp_port,
+        settings.smtp_username,
+        settings.smtp_password,
+        settings.smtp_starttls,
+        settings.smtp_timeout_seconds,
+    )
 
 
-def send_verification_request_email(to_email: str, claim_id: str, candidate_name: str, link: str) -> None:
-    """Stub for transactional email; logs until provider configured."""
-    logger.info("Send verification email", extra={"to": to_email, "claim_id": claim_id, "candidate": candidate_name, "link": link})
+email_dispatcher = EmailDispatcher(
+    engine,
+    default_transport,
+    sender=settings.email_from or "no-reply@verifylk.local",
+    batch_size=settings.email_batch_size,
+    poll_interval=settings.email_poll_interval_seconds,
+    max_attempts=settings.email_max_attempts,
+    backoff_base=settings.email_backoff_base_seconds,
+    backoff_max=settings.email_backoff_max_seconds,
+    lease_seconds=settings.email_lease_seconds,
+)
@@ -0,0 +1,202 @@
+"""Content-addressed evidence storage.
+
+Each distinct file is stored once as an `EvidenceBlob`; `EvidenceFile` rows point at it and hold a
+reference. Taking a reference is a conditional `UPDATE ... ref_count + 1` on an existing row, and the
+garbage collector deletes only rows still at `ref_count = 0`, so the two cannot interleave into a
+reference to a deleted blob. Every blob row gets its own storage key, so a collected blob's file
+can never be confused with a newer copy of the same content. Staged bytes are moved to a new blob's
+key only after the transaction creating the blob has committed (`settle_upload`), so a failed commit
+leaves no unreferenced file behind.
+"""
+import threading
+from datetime import datetime, timedelta
+from logging import getLogger
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models import EvidenceBlob, EvidenceFile, EvidenceUpload
+from ..models.entities import uuid_default
+from ..schemas.models import EvidenceGcReport
+from .evidence_upload import UploadError, discard_upload, staging_key
+from .storage import StorageBackend, storage
+
+logger = getLogger(__name__)
+
+
+class DedupMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.handshake_hits = 0
+        self.upload_hits = 0
+        self.bytes_not_transferred = 0
+
+    def observe(self, size: int, handshake: bool) -> None:
+        with self._lock:
+            if handshake:
+                self.handshake_hits += 1
+                self.bytes_not_transferred += size
+            else:
+                self.upload_hits += 1
+
+
+dedup_metrics = DedupMetrics()
+
+
+def blob_key(sha256: str, blob_id: str) -> str:
+    return f"blobs/{sha256[:2]}/{sha256}-{blob_id}"
+
+
+async def _acquire(db: AsyncSession, sha256: str, size_bytes: int, owner_id: str | None = None) -> EvidenceBlob | None:
+    """Take a reference on a stored blob with this content, if one exists (and `owner_id` already references it)."""
+    stmt = select(EvidenceBlob).where(EvidenceBlob.sha256 == sha256, EvidenceBlob.size_bytes == size_bytes).limit(1)
+    if owner_id is not None:
+        stmt = stmt.where(
+            select(EvidenceFile.id)
+            .join(EvidenceUpload, EvidenceUpload.evidence_id == EvidenceFile.id)
+            .where(EvidenceUpload.owner_id == owner_id, EvidenceFile.storage_path == EvidenceBlob.storage_key)
+            .exists()
+        )
+    blob = (await db.scalars(stmt)).first()
+    if blob is None:
+        return None
+    result = await db.execute(
+        update(EvidenceBlob)
+        .where(EvidenceBlob.id == blob.id)
+        .values(ref_count=EvidenceBlob.ref_count + 1, unreferenced_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    return blob if result.rowcount == 1 else None
+
+
+def _attach(upload: EvidenceUpload, blob: EvidenceBlob) -> EvidenceFile:
+    upload.received_bytes = upload.size_bytes
+    upload.completed_at = datetime.utcnow()
+    return EvidenceFile(
+        claim_id=upload.claim_id,
+        file_name=upload.file_name,
+        mime_type=upload.mime_type,
+        storage_path=blob.storage_key,
+        is_public=upload.is_public,
+        sha256=blob.sha256,
+        size_bytes=blob.size_bytes,
+    )
+
+
+async def attach_existing(db: AsyncSession, upload: EvidenceUpload) -> EvidenceFile | None:
+    """Hash-first handshake: reference a blob matching the upload's declared sha256 and size.
+
+    Only blobs the uploader already references qualify, so a hash alone never proves possession of
+    someone else's document; other duplicates are still collapsed by `store_upload` once the bytes arrive.
+    """
+    blob = await _acquire(db, upload.sha256, upload.size_bytes, owner_id=upload.owner_id)
+    if blob is None:
+        return None
+    dedup_metrics.observe(upload.size_bytes, handshake=True)
+    return _attach(upload, blob)
+
+
+async def store_upload(db: AsyncSession, upload: EvidenceUpload, sha256: str) -> EvidenceFile:
+    """Turn a fully received upload into an `EvidenceFile`, creating a blob only if the content is new.
+
+    The staged bytes are left in place; the caller hands them to `settle_upload` once the transaction
+    has committed, so a failed commit leaves the upload resumable.
+    """
+    if upload.sha256 and upload.sha256 != sha256:
+        raise UploadError(422, "Uploaded bytes do not match the declared sha256")
+    blob = await _acquire(db, sha256, upload.size_bytes)
+    if blob is not None:
+        dedup_metrics.observe(upload.size_bytes, handshake=False)
+    else:
+        blob_id = uuid_default()
+        blob = EvidenceBlob(
+            id=blob_id, sha256=sha256, size_bytes=upload.size_bytes, storage_key=blob_key(sha256, blob_id), ref_count=1
+        )
+        db.add(blob)
+    upload.sha256 = sha256
+    return _attach(upload, blob)
+
+
+def settle_upload(upload: EvidenceUpload, evidence: EvidenceFile, backend: StorageBackend = storage) -> None:
+    """After the commit: move the staged bytes to the evidence's blob key unless that content is already stored."""
+    if backend.size(evidence.storage_path) != evidence.size_bytes:
+        # The bytes were verified against the blob's sha256, so any upload of it may fill the key
+        backend.promote(staging_key(upload.id), evidence.storage_path)
+    discard_upload(upload, backend)
+
+
+def storage_stats(db: Session) -> dict[str, int | float]:
+    blobs, stored, logical = db.execute(
+        select(
+            func.count(EvidenceBlob.id),
+            func.coalesce(func.sum(EvidenceBlob.size_bytes), 0),
+            func.coalesce(func.sum(EvidenceBlob.size_bytes * EvidenceBlob.ref_count), 0),
+        )
+    ).one()
+    return {
+        "blobs": blobs,
+        "stored_bytes": stored,
+        "referenced_bytes": logical,
+        "bytes_saved": max(0, logical - stored),
+        "handshake_hits": dedup_metrics.handshake_hits,
+        "upload_dedup_hits": dedup_metrics.upload_hits,
+        "bytes_not_transferred": dedup_metrics.bytes_not_transferred,
+    }
+
+
+def collect_garbage(
+    db: Session,
+    grace: timedelta,
+    upload_ttl: timedelta,
+    backend: StorageBackend = storage,
+    now: datetime | None = None,
+    batch_size: int = 500,
+) -> EvidenceGcReport:
+    """Delete blobs unreferenced for longer than `grace` and partial uploads older than `upload_ttl`."""
+    now = now or datetime.utcnow()
+    blobs_deleted = bytes_freed = uploads_expired = 0
+
+    while True:
+        candidates = db.execute(
+            select(EvidenceBlob.id, EvidenceBlob.storage_key, EvidenceBlob.size_bytes)
+            .where(EvidenceBlob.ref_count == 0, EvidenceBlob.unreferenced_at < now - grace)
+            .limit(batch_size)
+        ).all()
+        if not candidates:
+            break
+        deleted = []
+        for blob_id, key, size in candidates:
+            # Re-checked per row: a reference taken since the SELECT keeps the blob.
+            result = db.execute(delete(EvidenceBlob).where(EvidenceBlob.id == blob_id, EvidenceBlob.ref_count == 0))
+            if result.rowcount:
+                deleted.append((key, size))
+        db.commit()
+        for key, size in deleted:
+            backend.delete(key)
+            blobs_deleted += 1
+            bytes_freed += size
+        if len(candidates) < batch_size:
+            break
+
+    while True:
+        stale = list(
+            db.scalars(
+                select(EvidenceUpload)
+                .where(EvidenceUpload.completed_at.is_(None), EvidenceUpload.created_at < now - upload_ttl)
+                .limit(batch_size)
+            )
+        )
+        for upload in stale:
+            discard_upload(upload, backend)
+            db.delete(upload)
+        db.commit()
+        uploads_expired += len(stale)
+        if len(stale) < batch_size:
+            break
+
+    logger.info(
+        "Evidence GC finished",
+        extra={"blobs_deleted": blobs_deleted, "bytes_freed": bytes_freed, "uploads_expired": uploads_expired},
+    )
+    return EvidenceGcReport(blobs_deleted=blobs_deleted, bytes_freed=bytes_freed, uploads_expired=uploads_expired)
@@ -0,0 +1,139 @@
+import hashlib
+import threading
+from typing import AsyncIterator, BinaryIO
+
+from starlette.concurrency import run_in_threadpool
+
+from ..cache import TTLCache
+from ..config import get_settings
+from ..models import EvidenceUpload
+from .storage import StorageBackend, storage
+
+settings = get_settings()
+
+SNIFF_BYTES = 16
+MAX_CACHED_HASHERS = 1024
+
+_SIGNATURES: dict[str, tuple[bytes, ...]] = {
+    "application/pdf": (b"%PDF-",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/jpeg": (b"\xff\xd8\xff",),
+}
+
+
+class UploadError(Exception):
+    def __init__(self, status_code: int, detail: str, offset: int | None = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.offset = offset
+
+
+def content_matches(mime_type: str, head: bytes) -> bool:
+    """Check the leading bytes against the declared type; types without a known signature pass."""
+    if mime_type == "image/webp":
+        return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+    signatures = _SIGNATURES.get(mime_type)
+    return signatures is None or head.startswith(signatures)
+
+
+def staging_key(upload_id: str) -> str:
+    return f"uploads/{upload_id}.part"
+
+
+# SHA-256 state per in-flight upload, so each resumed request hashes only its new bytes. A request
+# landing on another worker (or after a restart, or after its entry was evicted) rebuilds the state
+# from the staged file. Abandoned uploads age out with the upload TTL; the LRU cap bounds the rest.
+_hashers = TTLCache(MAX_CACHED_HASHERS, settings.evidence_upload_ttl_hours * 3600)
+_active: set[str] = set()
+_lock = threading.Lock()
+
+
+def _hasher_at(backend: StorageBackend, key: str, upload_id: str, offset: int):
+    cached = _hashers.get(upload_id)
+    _hashers.pop(upload_id)
+    if cached and cached[1] == offset:
+        return cached[0]
+    hasher = hashlib.sha256()
+    if offset:
+        remaining = offset
+        for chunk in backend.read(key):
+            hasher.update(chunk[:remaining])
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+    return hasher
+
+
+def _head(backend: StorageBackend, key: str, offset: int) -> bytes:
+    if offset == 0:
+        return b""
+    return next(backend.read(key), b"")[: min(offset, SNIFF_BYTES)]
+
+
+def _write(handle: BinaryIO, hasher, chunk: bytes) -> None:
+    handle.write(chunk)
+    hasher.update(chunk)
+
+
+def upload_offset(upload: EvidenceUpload, backend: StorageBackend = storage) -> int:
+    return upload.size_bytes if upload.completed_at else backend.size(staging_key(upload.id))
+
+
+async def receive_chunks(
+    upload: EvidenceUpload, offset: int, chunks: AsyncIterator[bytes], backend: StorageBackend = storage
+) -> tuple[int, str | None]:
+    """Append streamed bytes to the staged upload at `offset`.
+
+    Bytes go to storage as they arrive and are hashed incrementally; the declared size and content type
+    are enforced before anything past them is written. Returns the new offset and, once all bytes are
+    in, the SHA-256 of the file. A dropped connection keeps everything received so far.
+    """
+    if upload.completed_at:
+        raise UploadError(409, "Upload already complete", upload.size_bytes)
+    key = staging_key(upload.id)
+    current = await run_in_threadpool(backend.size, key)
+    if offset != current:
+        raise UploadError(409, "Offset does not match received bytes", current)
+    with _lock:
+        if upload.id in _active:
+            raise UploadError(409, "Upload already in progress", current)
+        _active.add(upload.id)
+    hasher = None
+    try:
+        hasher = await run_in_threadpool(_hasher_at, backend, key, upload.id, offset)
+        head = await run_in_threadpool(_head, backend, key, offset)
+        handle = await run_in_threadpool(backend.open_append, key, offset)
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                if offset + len(chunk) > upload.size_bytes:
+                    raise UploadError(413, "Upload exceeds its declared size", offset)
+                if len(head) < SNIFF_BYTES:
+                    head += chunk[: SNIFF_BYTES - len(head)]
+                    if len(head) >= SNIFF_BYTES and not content_matches(upload.mime_type, head):
+                        raise UploadError(415, "File content does not match its declared type", offset)
+                await run_in_threadpool(_write, handle, hasher, chunk)
+                offset += len(chunk)
+        finally:
+            await run_in_threadpool(handle.close)
+        if offset < upload.size_bytes:
+            _hashers.set(upload.id, (hasher, offset))
+            return offset, None
+        if not content_matches(upload.mime_type, head):
+            raise UploadError(415, "File content does not match its declared type", offset)
+        return offset, hasher.hexdigest()
+    except BaseException:
+        # Keep the hash state for a resume only if it provably covers exactly the bytes on disk.
+        if hasher is not None and backend.size(key) == offset:
+            _hashers.set(upload.id, (hasher, offset))
+        raise
+    finally:
+        with _lock:
+            _active.discard(upload.id)
+
+
+def discard_upload(upload: EvidenceUpload, backend: StorageBackend = storage) -> None:
+    _hashers.pop(upload.id)
+    backend.delete(staging_key(upload.id))
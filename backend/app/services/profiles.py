@@ -0,0 +1,275 @@
+"""Materialized candidate profiles: aggregates over each candidate's verified claims.
+
+A verified claim contributes (1 claim, its score, its months, its organization); any other status
+contributes nothing. Every change is applied as a delta inside the transaction that made it:
+ORM flushes are picked up by the `after_flush` listener that `install_listener` registers at app
+setup, and the executemany paths (bulk decisions, rescoring) call `apply_claim_changes` themselves.
+`latest_verified_at` is the newest approval of a still-verified claim. `rebuild_profiles`
+recomputes everything from scratch (`python -m app.cli rebuild-profiles`).
+"""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import case, delete, event, func, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..db import dialect_insert
+from ..models import (
+    CandidateProfile,
+    CandidateProfileOrg,
+    ClaimStatus,
+    ExperienceClaim,
+    VerificationOutcome,
+    VerificationRecord,
+)
+from .scoring import months_between
+
+DEFAULT_CHUNK_SIZE = 5000
+
+profiles = CandidateProfile.__table__
+profile_orgs = CandidateProfileOrg.__table__
+
+
+class Contribution(NamedTuple):
+    score: float
+    months: int
+    organization_name: str
+
+
+def contribution(status: ClaimStatus, score, start_date: date, end_date: date, organization_name: str) -> Contribution | None:
+    if status != ClaimStatus.verified:
+        return None
+    return Contribution(float(score or 0), months_between(start_date, end_date), organization_name)
+
+
+class _Delta:
+    __slots__ = ("claims", "score", "months", "orgs")
+
+    def __init__(self):
+        self.claims = 0
+        self.score = 0.0
+        self.months = 0
+        self.orgs: dict[str, int] = defaultdict(int)
+
+    def add(self, part: Contribution | None, sign: int) -> None:
+        if part is not None:
+            self.claims += sign
+            self.score += sign * part.score
+            self.months += sign * part.months
+            self.orgs[part.organization_name] += sign
+
+
+def apply_claim_changes(
+    conn: Connection, changes: Iterable[tuple[str, Contribution | None, Contribution | None]]
+) -> None:
+    """Apply (candidate_id, old contribution, new contribution) deltas in the caller's transaction."""
+    deltas: dict[str, _Delta] = defaultdict(_Delta)
+    withdrawn: set[str] = set()
+    for candidate_id, old, new in changes:
+        if old != new:
+            deltas[candidate_id].add(old, -1)
+            deltas[candidate_id].add(new, 1)
+            if new is None:
+                withdrawn.add(candidate_id)
+    deltas = {c: d for c, d in deltas.items() if d.claims or d.score or d.months or any(d.orgs.values())}
+    if not deltas:
+        return
+    insert = dialect_insert(conn)
+    now = datetime.utcnow()
+
+    stmt = insert(profiles)
+    conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[profiles.c.candidate_id],
+            set_={
+                "verified_claims": profiles.c.verified_claims + stmt.excluded.verified_claims,
+                "score_total": profiles.c.score_total + stmt.excluded.score_total,
+                "verified_months": profiles.c.verified_months + stmt.excluded.verified_months,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ),
+        [
+            {
+                "candidate_id": candidate_id,
+                "verified_claims": d.claims,
+                "score_total": d.score,
+                "verified_months": d.months,
+                "verifying_organizations": 0,
+                "updated_at": now,
+            }
+            for candidate_id, d in deltas.items()
+        ],
+    )
+
+    org_rows = [
+        {"candidate_id": candidate_id, "organization_name": org, "verified_claims": n}
+        for candidate_id, d in deltas.items()
+        for org, n in d.orgs.items()
+        if n
+    ]
+    if org_rows:
+        stmt = insert(profile_orgs)
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[profile_orgs.c.candidate_id, profile_orgs.c.organization_name],
+                set_={"verified_claims": profile_orgs.c.verified_claims + stmt.excluded.verified_claims},
+            ),
+            org_rows,
+        )
+        touched = list({row["candidate_id"] for row in org_rows})
+        distinct_orgs = (
+            select(func.count())
+            .where(profile_orgs.c.candidate_id == profiles.c.candidate_id, profile_orgs.c.verified_claims > 0)
+            .scalar_subquery()
+        )
+        conn.execute(update(profiles).where(profiles.c.candidate_id.in_(touched)).values(verifying_organizations=distinct_orgs))
+
+    # A claim leaving the verified state may have carried the latest approval: recompute it from what is still verified
+    if withdrawn:
+        conn.execute(update(profiles).where(profiles.c.candidate_id.in_(list(withdrawn))).values(latest_verified_at=_latest_approval()))
+
+
+def _latest_approval():
+    return (
+        select(func.max(VerificationRecord.created_at))
+        .join(ExperienceClaim, VerificationRecord.claim_id == ExperienceClaim.id)
+        .where(
+            ExperienceClaim.candidate_id == profiles.c.candidate_id,
+            ExperienceClaim.status == ClaimStatus.verified,
+            VerificationRecord.outcome == VerificationOutcome.approved,
+        )
+        .scalar_subquery()
+    )
+
+
+def record_verifications(conn: Connection, approvals: Iterable[tuple[str, datetime]]) -> None:
+    """Advance `latest_verified_at` for (candidate_id, approved at) pairs."""
+    latest: dict[str, datetime] = {}
+    for candidate_id, at in approvals:
+        if candidate_id not in latest or at > latest[candidate_id]:
+            latest[candidate_id] = at
+    if not latest:
+        return
+    stmt = dialect_insert(conn)(profiles)
+    conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[profiles.c.candidate_id],
+            set_={
+                "latest_verified_at": case(
+                    (
+                        (profiles.c.latest_verified_at.is_(None)) | (profiles.c.latest_verified_at < stmt.excluded.latest_verified_at),
+                        stmt.excluded.latest_verified_at,
+                    ),
+                    else_=profiles.c.latest_verified_at,
+                ),
+            },
+        ),
+        [
+            {
+                "candidate_id": candidate_id,
+                "verified_claims": 0,
+                "score_total": 0.0,
+                "verified_months": 0,
+                "verifying_organizations": 0,
+                "latest_verified_at": at,
+                "updated_at": datetime.utcnow(),
+            }
+            for candidate_id, at in latest.items()
+        ],
+    )
+
+
+# Declared with active_history on ExperienceClaim, so the pre-change value is always in the history
+_TRACKED = ("status", "credibility_score", "start_date", "end_date", "organization_name")
+
+
+def _state(claim: ExperienceClaim, previous: bool) -> Contribution | None:
+    values = []
+    attrs = inspect(claim).attrs
+    for name in _TRACKED:
+        history = attrs[name].history
+        if previous and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(claim, name))
+    return contribution(*values)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    changes = []
+    approved_claims: list[tuple[str, datetime]] = []
+    for obj in session.new:
+        if isinstance(obj, ExperienceClaim):
+            changes.append((obj.candidate_id, None, _state(obj, previous=False)))
+        elif isinstance(obj, VerificationRecord) and obj.outcome == VerificationOutcome.approved:
+            approved_claims.append((obj.claim_id, obj.created_at or datetime.utcnow()))
+    for obj in session.dirty:
+        if isinstance(obj, ExperienceClaim) and session.is_modified(obj):
+            changes.append((obj.candidate_id, _state(obj, previous=True), _state(obj, previous=False)))
+    for obj in session.deleted:
+        if isinstance(obj, ExperienceClaim):
+            changes.append((obj.candidate_id, _state(obj, previous=True), None))
+    if not changes and not approved_claims:
+        return
+    conn = session.connection()
+    apply_claim_changes(conn, changes)
+    if approved_claims:
+        candidates = dict(
+            conn.execute(
+                select(ExperienceClaim.id, ExperienceClaim.candidate_id).where(
+                    ExperienceClaim.id.in_([claim_id for claim_id, _ in approved_claims])
+                )
+            ).all()
+        )
+        record_verifications(conn, [(candidates[claim_id], at) for claim_id, at in approved_claims if claim_id in candidates])
+
+
+def install_listener() -> None:
+    """Apply ORM flushes of every `Session` (async sessions included) to the profiles; idempotent."""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+
+
+def rebuild_profiles(conn: Connection, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Recompute every profile from claims and verification records; returns verified claims scanned."""
+    conn.execute(delete(profile_orgs))
+    conn.execute(delete(profiles))
+    scanned = 0
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            select(
+                ExperienceClaim.id,
+                ExperienceClaim.candidate_id,
+                ExperienceClaim.credibility_score,
+                ExperienceClaim.start_date,
+                ExperienceClaim.end_date,
+                ExperienceClaim.organization_name,
+            )
+            .where(ExperienceClaim.status == ClaimStatus.verified, ExperienceClaim.id > last_id)
+            .order_by(ExperienceClaim.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+        apply_claim_changes(
+            conn,
+            [
+                (candidate_id, None, contribution(ClaimStatus.verified, score, start, end, org))
+                for _, candidate_id, score, start, end, org in rows
+            ],
+        )
+    record_verifications(
+        conn,
+        conn.execute(
+            select(ExperienceClaim.candidate_id, func.max(VerificationRecord.created_at))
+            .join(VerificationRecord, VerificationRecord.claim_id == ExperienceClaim.id)
+            .where(VerificationRecord.outcome == VerificationOutcome.approved, ExperienceClaim.status == ClaimStatus.verified)
+            .group_by(ExperienceClaim.candidate_id)
+        ).all(),
+    )
+    return scanned
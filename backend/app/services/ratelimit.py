@@ -0,0 +1,154 @@
+"""Token-bucket rate limits keyed by client IP or authenticated user.
+
+Buckets live in a sharded in-memory store by default: each shard has its own lock and an
+LRU-ordered dict. Least recently used buckets are evicted from the front once they have refilled
+(a full bucket and a missing one behave the same) or when the shard is at capacity, so every
+request does O(1) amortised eviction work. `RATE_LIMIT_BACKEND=redis` shares buckets across
+workers (requires the `redis` package).
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    name: str
+    per_minute: float
+    burst: int
+    per: str = "ip"  # "ip" or "user"
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60.0
+
+
+@dataclass(frozen=True)
+class RateRule:
+    method: str | None
+    path: str
+    policy: RatePolicy
+    prefix: bool = False
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.method is not None and self.method != method:
+            return False
+        return path.startswith(self.path) if self.prefix else path == self.path
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> [tokens, updated_at, full_at], least recently used first
+        self.buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+
+class MemoryBuckets:
+    def __init__(self, shards: int = 16, max_keys: int = 100_000):
+        self._shards = [_Shard() for _ in range(shards)]
+        self._max_per_shard = max(1, max_keys // shards)
+        self.evicted = 0
+
+    async def take(self, key: str, policy: RatePolicy) -> float:
+        return self.take_now(key, policy, time.monotonic())
+
+    def take_now(self, key: str, policy: RatePolicy, now: float) -> float:
+        """Spend one token; returns 0 if allowed, else seconds until a token is available."""
+        rate, burst = policy.rate, policy.burst
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.lock:
+            buckets = shard.buckets
+            bucket = buckets.get(key)
+            if bucket is None:
+                self._evict(buckets, now)
+                tokens = burst
+            else:
+                buckets.move_to_end(key)
+                tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate
+            if not wait:
+                tokens -= 1
+            full_at = now + (burst - tokens) / rate
+            if bucket is None:
+                buckets[key] = [tokens, now, full_at]
+            else:
+                bucket[0], bucket[1], bucket[2] = tokens, now, full_at
+        return wait
+
+    def _evict(self, buckets: OrderedDict, now: float) -> None:
+        # Refilled buckets at the LRU end go first; at capacity the oldest goes even if not refilled,
+        # restarting with a full bucket (erring on the lenient side).
+        while buckets and (len(buckets) >= self._max_per_shard or next(iter(buckets.values()))[2] <= now):
+            buckets.popitem(last=False)
+            self.evicted += 1
+
+    def size(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+
+_REDIS_TAKE = """
+local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = burst
+if state[1] then tokens = math.min(burst, tonumber(state[1]) + math.max(0, now - tonumber(state[2])) * rate) end
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 't', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisBuckets:
+    """Buckets shared by every worker; one atomic script call per request. Fails open if Redis is unreachable."""
+
+    def __init__(self, url: str, prefix: str = "verifylk:ratelimit:"):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the `redis` package") from exc
+        self._redis = Redis.from_url(url)
+        self._script = self._redis.register_script(_REDIS_TAKE)
+        self.prefix = prefix
+        self.evicted = 0
+
+    async def take(self, key: str, policy: RatePolicy) -> float:
+        try:
+            wait = await self._script(keys=[self.prefix + key], args=[policy.rate, policy.burst, time.time()])
+        except Exception:
+            logger.warning("Rate limit backend unavailable; allowing request", exc_info=True)
+            return 0.0
+        return float(wait)
+
+    def size(self) -> int:
+        return -1
+
+
+def default_rules(settings: Settings) -> list[RateRule]:
+    auth = RatePolicy("auth", settings.rate_limit_auth_per_minute, settings.rate_limit_auth_burst)
+    reports = RatePolicy("reports", settings.rate_limit_reports_per_minute, settings.rate_limit_reports_burst)
+    user = RatePolicy("user", settings.rate_limit_user_per_minute, settings.rate_limit_user_burst, per="user")
+    return [
+        RateRule("POST", "/api/v1/auth/login", auth),
+        RateRule("POST", "/api/v1/auth/register", auth),
+        RateRule("POST", "/api/v1/auth/refresh", auth),
+        RateRule("GET", "/api/v1/reports/", reports, prefix=True),
+        RateRule(None, "/api/", user, prefix=True),
+    ]
+
+
+def build_backend(settings: Settings) -> MemoryBuckets | RedisBuckets:
+    if settings.rate_limit_backend == "redis":
+        if not settings.rate_limit_redis_url:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires RATE_LIMIT_REDIS_URL")
+        return RedisBuckets(settings.rate_limit_redis_url)
+    return MemoryBuckets(max_keys=settings.rate_limit_max_keys)
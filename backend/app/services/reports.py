@@ -0,0 +1,87 @@
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..cache import TTLCache
+from ..config import get_settings
+from ..models import ClaimStatus, EvidenceFile, ExperienceClaim, VerificationRecord
+from ..repositories.claims import WITH_EVIDENCE, get_claim_async
+from ..schemas.models import ExperienceClaimOut
+
+settings = get_settings()
+
+# claim_id -> (updated_at, etag, rendered JSON body)
+report_cache = TTLCache(settings.report_cache_size, settings.report_cache_ttl_seconds)
+
+
+def _version_stmt(claim_id: str):
+    return select(ExperienceClaim.status, ExperienceClaim.updated_at).where(ExperienceClaim.id == claim_id)
+
+
+def _cached(claim_id: str, row) -> tuple[str, bytes] | None:
+    cached = report_cache.get(claim_id)
+    if cached is not None and cached[0] == row.updated_at:
+        return cached[1], cached[2]
+    return None
+
+
+def _store(claim: ExperienceClaim) -> tuple[str, bytes]:
+    body = ExperienceClaimOut.model_validate(claim).model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    report_cache.set(claim.id, (claim.updated_at, etag, body))
+    return etag, body
+
+
+def render_report(db: Session, claim_id: str) -> tuple[str, bytes] | None:
+    """Return (etag, body) for a verified claim's public report, or None if it is not reportable.
+
+    Cache entries are validated against the claim's `updated_at` (which evidence changes bump too)
+    with a single-row lookup, so changes made by other workers are picked up; in-process writes
+    also invalidate eagerly.
+    """
+    row = db.execute(_version_stmt(claim_id)).first()
+    if row is None or row.status != ClaimStatus.verified:
+        return None
+    return _cached(claim_id, row) or _store(db.get(ExperienceClaim, claim_id, options=WITH_EVIDENCE))
+
+
+async def render_report_async(db: AsyncSession, claim_id: str) -> tuple[str, bytes] | None:
+    row = (await db.execute(_version_stmt(claim_id))).first()
+    if row is None or row.status != ClaimStatus.verified:
+        return None
+    return _cached(claim_id, row) or _store(await get_claim_async(db, claim_id))
+
+
+def invalidate_report(claim_id: str) -> None:
+    report_cache.pop(claim_id)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@event.listens_for(ExperienceClaim, "after_update")
+@event.listens_for(ExperienceClaim, "after_delete")
+def _invalidate_claim(mapper, connection, target: ExperienceClaim) -> None:
+    invalidate_report(target.id)
+
+
+@event.listens_for(VerificationRecord, "after_insert")
+def _invalidate_child(mapper, connection, target) -> None:
+    invalidate_report(target.claim_id)
+
+
+@event.listens_for(EvidenceFile, "after_insert")
+@event.listens_for(EvidenceFile, "after_delete")
+def _touch_claim(mapper, connection, target: EvidenceFile) -> None:
+    # Evidence is part of the report, so it versions the claim for other workers' caches too
+    connection.execute(
+        update(ExperienceClaim.__table__).where(ExperienceClaim.id == target.claim_id).values(updated_at=datetime.utcnow())
+    )
+    invalidate_report(target.claim_id)
@@ -0,0 +1,101 @@
+import threading
+import time
+from datetime import date, datetime
+from logging import getLogger
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ..models import ClaimStatus, ExperienceClaim
+from ..repositories.verifications import verification_stats
+from ..schemas.models import RescoreReport
+from .profiles import apply_claim_changes, contribution
+from .scoring import breakdown_json, score_factors
+
+logger = getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+# Each chunk's ids are bound into one IN (...) when loading verification stats
+MAX_CHUNK_SIZE = 10_000
+
+# Held while a run started through the admin API is in progress (per process)
+rescore_lock = threading.Lock()
+
+_last_report: RescoreReport | None = None
+
+
+def _score_chunk(rows, stats: dict[str, tuple[int, bool]], today: date) -> tuple[list[dict], list]:
+    changes, profile_changes = [], []
+    for claim_id, candidate_id, org, status, start_date, end_date, visibility, old_score, old_breakdown in rows:
+        count, expired = stats.get(claim_id, (0, False))
+        score, factors = score_factors(status, start_date, end_date, visibility, count, expired, today)
+        breakdown = breakdown_json(factors)
+        if old_score is None or float(old_score) != score or old_breakdown != breakdown:
+            changes.append({"id": claim_id, "credibility_score": score, "credibility_breakdown": breakdown})
+            profile_changes.append(
+                (
+                    candidate_id,
+                    contribution(status, old_score, start_date, end_date, org),
+                    contribution(status, score, start_date, end_date, org),
+                )
+            )
+    return changes, profile_changes
+
+
+def rescore_verified_claims(db: Session, chunk_size: int = DEFAULT_CHUNK_SIZE, today: date | None = None) -> RescoreReport:
+    """Recompute scores for all verified claims, keyset-walking by id and writing back only changed rows."""
+    global _last_report
+    today = today or date.today()
+    started_at = datetime.utcnow()
+    start = time.perf_counter()
+    scanned = updated = 0
+    last_id = ""
+
+    while True:
+        rows = db.execute(
+            select(
+                ExperienceClaim.id,
+                ExperienceClaim.candidate_id,
+                ExperienceClaim.organization_name,
+                ExperienceClaim.status,
+                ExperienceClaim.start_date,
+                ExperienceClaim.end_date,
+                ExperienceClaim.evidence_visibility,
+                ExperienceClaim.credibility_score,
+                ExperienceClaim.credibility_breakdown,
+            )
+            .where(ExperienceClaim.status == ClaimStatus.verified, ExperienceClaim.id > last_id)
+            .order_by(ExperienceClaim.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+
+        stats = verification_stats(db, [row[0] for row in rows], today)
+        changes, profile_changes = _score_chunk(rows, stats, today)
+        if changes:
+            now = datetime.utcnow()
+            for change in changes:
+                change["updated_at"] = now
+            db.execute(update(ExperienceClaim), changes)
+            apply_claim_changes(db.connection(), profile_changes)
+            updated += len(changes)
+        db.commit()
+
+    elapsed = time.perf_counter() - start
+    report = RescoreReport(
+        scanned=scanned,
+        updated=updated,
+        elapsed_seconds=round(elapsed, 3),
+        claims_per_second=round(scanned / elapsed, 1) if elapsed > 0 else 0.0,
+        started_at=started_at,
+    )
+    logger.info("Rescore complete", extra=report.model_dump())
+    _last_report = report
+    return report
+
+
+def last_rescore_report() -> RescoreReport | None:
+    return _last_report
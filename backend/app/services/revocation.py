@@ -0,0 +1,64 @@
+"""Refresh-token revocation: the `revoked_tokens` table, pruned by expiry.
+
+Rotation has to record the old jti anyway, so `revoke` is also the check: the insert's primary-key
+conflict rejects a replayed token in one round trip, consistently across workers, and nothing is
+read from the table. Rows are deleted once their token has expired (checked at most once per
+`prune_seconds`), since expired tokens fail JWT validation anyway; the table therefore stays
+bounded by the tokens revoked within one refresh-token lifetime.
+"""
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models import RevokedToken
+
+settings = get_settings()
+
+
+class RevocationStore:
+    def __init__(self, prune_seconds: float):
+        self.prune_seconds = prune_seconds
+        self._lock = threading.Lock()
+        self._pruned_period = -1
+        self.prunes = 0
+        self.revoked = 0
+        self.reuse_rejected = 0
+
+    def _prune_due(self, now: float) -> bool:
+        """True once per `prune_seconds` period (per process)."""
+        current = int(now // self.prune_seconds)
+        with self._lock:
+            due = current > self._pruned_period
+            self._pruned_period = current
+        return due
+
+    async def revoke(self, db: AsyncSession, jti: str, user_id: str, exp: int) -> bool:
+        """Record the jti (expiring at epoch `exp`) as used; False if it already was. Commits."""
+        if self._prune_due(time.time()):
+            await db.execute(delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow()))
+            await db.commit()
+            with self._lock:
+                self.prunes += 1
+        db.add(RevokedToken(jti=jti, user_id=user_id, expires_at=datetime.utcfromtimestamp(exp)))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            with self._lock:
+                self.reuse_rejected += 1
+            return False
+        with self._lock:
+            self.revoked += 1
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"prunes": self.prunes, "revoked": self.revoked, "reuse_rejected": self.reuse_rejected}
+
+
+revocations = RevocationStore(settings.revocation_prune_hours * 3600)
@@ -1,29 +1,35 @@
 from datetime import date
 from typing import Iterable, Tuple
 
-from ..models import ClaimStatus, ExperienceClaim, VerificationRecord
+from ..metrics import scoring_calls
+from ..models import ClaimStatus, EvidenceVisibility, ExperienceClaim, VerificationRecord
 from ..schemas.models import ScoreBreakdown
 
 
-def _months_between(start: date, end: date) -> int:
+def months_between(start: date, end: date) -> int:
     return max(0, (end.year - start.year) * 12 + (end.month - start.month))
 
 
-def calculate_score(claim: ExperienceClaim, verifications: Iterable[VerificationRecord]) -> Tuple[float, list[ScoreBreakdown]]:
-    """Rule-based scoring. Returns (score, breakdown)."""
-    total = 0.0
-    breakdown: list[ScoreBreakdown] = []
-    today = date.today()
-
-    verifications = list(verifications)
-    verified_count = len(verifications)
-
+def score_factors(
+    status: ClaimStatus,
+    start_date: date,
+    end_date: date,
+    evidence_visibility: EvidenceVisibility,
+    verified_count: int,
+    expired: bool,
+    today: date,
+) -> Tuple[float, list[tuple[str, float, str]]]:
+    """Scoring rules over plain column values. Returns (score, [(factor, score, reason)])."""
+    scoring_calls.inc()
     # Base requirement: only consider verified claims
-    if claim.status != ClaimStatus.verified:
-        return 0, [ScoreBreakdown(factor="status", score=0, reason="Claim not verified")]
+    if status != ClaimStatus.verified:
+        return 0, [("status", 0, "Claim not verified")]
+
+    total = 0.0
+    factors: list[tuple[str, float, str]] = []
 
     # Recency factor
-    months_since_end = _months_between(claim.end_date, today)
+    months_since_end = months_between(end_date, today)
     if months_since_end <= 12:
         score = 15
         reason = "Completed within last 12 months"
@@ -34,23 +40,22 @@ def calculate_score(claim: ExperienceClaim, verifications: Iterable[Verification
         score = 5
         reason = "Completed more than 2 years ago"
     total += score
-    breakdown.append(ScoreBreakdown(factor="recency", score=score, reason=reason))
+    factors.append(("recency", score, reason))
 
     # Duration factor
-    duration_months = _months_between(claim.start_date, claim.end_date) or 1
+    duration_months = months_between(start_date, end_date) or 1
     dur_score = min(15, duration_months)  # cap at 15
-    breakdown.append(ScoreBreakdown(factor="duration", score=dur_score, reason=f"{duration_months} months recorded"))
+    factors.append(("duration", dur_score, f"{duration_months} months recorded"))
     total += dur_score
 
     # Evidence visibility factor
-    if claim.evidence_visibility.value == "public":
+    if evidence_visibility == EvidenceVisibility.public:
         ev_score = 10
-        breakdown.append(ScoreBreakdown(factor="evidence", score=ev_score, reason="Public evidence provided"))
-        total += ev_score
+        factors.append(("evidence", ev_score, "Public evidence provided"))
     else:
         ev_score = 5
-        breakdown.append(ScoreBreakdown(factor="evidence", score=ev_score, reason="Evidence available to verifiers"))
-        total += ev_score
+        factors.append(("evidence", ev_score, "Evidence available to verifiers"))
+    total += ev_score
 
     # Verification count factor
     if verified_count >= 2:
@@ -63,15 +68,38 @@ def calculate_score(claim: ExperienceClaim, verifications: Iterable[Verification
         v_score = 0
         reason = "No verifications recorded"
     total += v_score
-    breakdown.append(ScoreBreakdown(factor="verifications", score=v_score, reason=reason))
+    factors.append(("verifications", v_score, reason))
 
     # Validity windows
-    expired = any(v.valid_until and v.valid_until < today for v in verifications)
     if expired:
         penalty = -10
         total += penalty
-        breakdown.append(ScoreBreakdown(factor="expiry", score=penalty, reason="Verification validity expired"))
+        factors.append(("expiry", penalty, "Verification validity expired"))
 
     # Normalize: cap between 0 and 100
     total = max(0.0, min(100.0, total))
-    return total, breakdown
+    return total, factors
+
+
+def breakdown_json(factors: list[tuple[str, float, str]]) -> list[dict]:
+    """Factors in the stored `credibility_breakdown` shape (same as ScoreBreakdown.model_dump())."""
+    return [{"factor": f, "score": float(s), "reason": r} for f, s, r in factors]
+
+
+def calculate_score(
+    claim: ExperienceClaim, verifications: Iterable[VerificationRecord], today: date | None = None
+) -> Tuple[float, list[ScoreBreakdown]]:
+    """Rule-based scoring. Returns (score, breakdown)."""
+    today = today or date.today()
+    verifications = list(verifications)
+    expired = any(v.valid_until and v.valid_until < today for v in verifications)
+    total, factors = score_factors(
+        claim.status,
+        claim.start_date,
+        claim.end_date,
+        claim.evidence_visibility,
+        len(verifications),
+        expired,
+        today,
+    )
+    return total, [ScoreBreakdown(factor=f, score=s, reason=r) for f, s, r in factors]
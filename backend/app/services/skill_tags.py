@@ -0,0 +1,204 @@
+"""Normalized skill tags: a tag dictionary, claim-tag links and per-tag verified-claim counts.
+
+Free-text `skill_tags` are normalized (case, whitespace, Sinhala/Tamil/English aliases) into one
+`skill_tags` row per tag and linked to claims in `claim_skill_tags`. The claim repository writes
+links through `set_claim_tags` (create, update, bulk import). `verified_claims` follows claim status
+the way candidate profiles do: ORM flushes via the listeners `install_listener` registers at app
+setup, executemany decisions via `apply_status_changes`. A deleted claim's links are removed (and its counts released) before the
+claim row goes. `rebuild_skill_tags` recomputes everything (`python -m app.cli rebuild-skill-tags`).
+"""
+import unicodedata
+from collections import defaultdict
+from typing import Iterable, Sequence
+
+from sqlalchemy import bindparam, delete, event, exists, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from ..db import dialect_insert
+from ..models import ClaimSkillTag, ClaimStatus, ExperienceClaim, SkillTag
+
+MAX_TAG_LENGTH = 64
+DEFAULT_CHUNK_SIZE = 5000
+
+tags = SkillTag.__table__
+claim_tags = ClaimSkillTag.__table__
+
+# Canonical tag -> other spellings. Sinhala and Tamil names map onto the English tag so facets count
+# "පයිතන්", "பைதான்" and "Python" together.
+ALIASES: dict[str, tuple[str, ...]] = {
+    "python": ("py", "python3", "පයිතන්", "பைதான்"),
+    "javascript": ("js", "java script"),
+    "react": ("reactjs", "react.js", "react js"),
+    "excel": ("ms excel", "microsoft excel", "එක්සෙල්", "எக்செல்"),
+    "sinhala": ("sinhalese", "සිංහල", "சிங்களம்"),
+    "tamil": ("දෙමළ", "தமிழ்"),
+    "english": ("ඉංග්‍රීසි", "ஆங்கிலம்"),
+    "teaching": ("tutoring", "ඉගැන්වීම", "கற்பித்தல்"),
+    "accounting": ("bookkeeping", "ගිණුම්කරණය", "கணக்கியல்"),
+    "first aid": ("firstaid", "ප්‍රථමාධාර", "முதலுதவி"),
+    "customer service": ("customer care", "පාරිභෝගික සේවා", "வாடிக்கையாளர் சேவை"),
+    "fieldwork": ("field work", "களப்பணி"),
+    "coordination": ("co ordination", "සම්බන්ධීකරණය", "ஒருங்கிணைப்பு"),
+    "fundraising": ("fund raising", "நிதி திரட்டல்"),
+}
+
+
+def _clean(raw: str) -> str:
+    text = unicodedata.normalize("NFKC", raw).casefold().replace("_", " ").replace("-", " ")
+    return " ".join(text.split()).strip(".,;:").strip()
+
+
+def _alias_key(text: str) -> str:
+    # Sinhala conjuncts are typed with and without zero-width joiners; both spellings are one key
+    return "".join(ch for ch in text if unicodedata.category(ch) != "Cf")
+
+
+_CANONICAL = {_alias_key(_clean(alias)): tag for tag, aliases in ALIASES.items() for alias in (tag, *aliases)}
+
+
+def normalize_tag(raw: str) -> str | None:
+    """Canonical form of one tag, or None if nothing is left after cleaning."""
+    cleaned = _clean(raw)
+    if not cleaned:
+        return None
+    return _CANONICAL.get(_alias_key(cleaned), cleaned)[:MAX_TAG_LENGTH]
+
+
+def normalize_tags(raw_tags: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(tag for tag in map(normalize_tag, raw_tags) if tag))
+
+
+def _tag_ids(conn: Connection, names: set[str]) -> dict[str, int]:
+    """Ids for `names`, creating missing dictionary rows."""
+    if not names:
+        return {}
+    ids = dict(conn.execute(select(tags.c.name, tags.c.id).where(tags.c.name.in_(names))).all())
+    missing = sorted(names - ids.keys())
+    if missing:
+        insert = dialect_insert(conn)
+        conn.execute(
+            insert(tags).on_conflict_do_nothing(index_elements=[tags.c.name]),
+            [{"name": name, "verified_claims": 0} for name in missing],
+        )
+        ids.update(conn.execute(select(tags.c.name, tags.c.id).where(tags.c.name.in_(missing))).all())
+    return ids
+
+
+def _adjust_counts(conn: Connection, deltas: dict[int, int]) -> None:
+    rows = [{"tag": tag_id, "delta": delta} for tag_id, delta in deltas.items() if delta]
+    if rows:
+        conn.execute(
+            update(tags)
+            .where(tags.c.id == bindparam("tag"))
+            .values(verified_claims=tags.c.verified_claims + bindparam("delta")),
+            rows,
+        )
+
+
+def set_claim_tags(conn: Connection, claims: Iterable[tuple[str, Sequence[str] | None, bool]]) -> None:
+    """Replace the tag links of (claim_id, raw tags, claim is verified) in the caller's transaction."""
+    wanted: dict[str, list[str]] = {}
+    verified: dict[str, bool] = {}
+    for claim_id, raw_tags, is_verified in claims:
+        wanted[claim_id] = normalize_tags(raw_tags or [])
+        verified[claim_id] = is_verified
+    if not wanted:
+        return
+    ids = _tag_ids(conn, {name for names in wanted.values() for name in names})
+    current: dict[str, set[int]] = defaultdict(set)
+    for claim_id, tag_id in conn.execute(
+        select(claim_tags.c.claim_id, claim_tags.c.tag_id).where(claim_tags.c.claim_id.in_(list(wanted)))
+    ):
+        current[claim_id].add(tag_id)
+
+    added: list[dict] = []
+    removed: list[dict] = []
+    deltas: dict[int, int] = defaultdict(int)
+    for claim_id, names in wanted.items():
+        target = {ids[name] for name in names}
+        sign = 1 if verified[claim_id] else 0
+        for tag_id in target - current[claim_id]:
+            added.append({"claim_id": claim_id, "tag_id": tag_id})
+            deltas[tag_id] += sign
+        for tag_id in current[claim_id] - target:
+            removed.append({"claim": claim_id, "tag": tag_id})
+            deltas[tag_id] -= sign
+    if removed:
+        conn.execute(
+            delete(claim_tags).where(claim_tags.c.claim_id == bindparam("claim"), claim_tags.c.tag_id == bindparam("tag")),
+            removed,
+        )
+    if added:
+        conn.execute(claim_tags.insert(), added)
+    _adjust_counts(conn, deltas)
+
+
+def apply_status_changes(conn: Connection, changes: Iterable[tuple[str, bool, bool]]) -> None:
+    """Move (claim_id, was verified, is verified) claims into or out of their tags' counts."""
+    signs = {claim_id: 1 if now else -1 for claim_id, was, now in changes if was != now}
+    if not signs:
+        return
+    deltas: dict[int, int] = defaultdict(int)
+    for claim_id, tag_id in conn.execute(
+        select(claim_tags.c.claim_id, claim_tags.c.tag_id).where(claim_tags.c.claim_id.in_(list(signs)))
+    ):
+        deltas[tag_id] += signs[claim_id]
+    _adjust_counts(conn, deltas)
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    changes = []
+    for obj in session.dirty:
+        if isinstance(obj, ExperienceClaim):
+            history = inspect(obj).attrs.status.history
+            if history.deleted:
+                changes.append((obj.id, history.deleted[0] == ClaimStatus.verified, obj.status == ClaimStatus.verified))
+    if changes:
+        apply_status_changes(session.connection(), changes)
+
+
+def _persisted_status(claim: ExperienceClaim) -> ClaimStatus:
+    history = inspect(claim).attrs.status.history
+    return history.deleted[0] if history.deleted else claim.status
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    # Before the flush, so the links are gone before the claim row they reference
+    removed = [
+        (obj.id, [], _persisted_status(obj) == ClaimStatus.verified) for obj in session.deleted if isinstance(obj, ExperienceClaim)
+    ]
+    if removed:
+        set_claim_tags(session.connection(), removed)
+
+
+def install_listener() -> None:
+    """Apply ORM flushes of every `Session` (async sessions included) to the tag tables; idempotent."""
+    for name, listener in (("before_flush", _before_flush), ("after_flush", _after_flush)):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def rebuild_skill_tags(conn: Connection, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Re-link every claim from its `skill_tags` JSON and recount; returns claims scanned.
+
+    Tag ids are kept for tags still in use; tags no claim carries any more are dropped.
+    """
+    conn.execute(delete(claim_tags))
+    conn.execute(update(tags).values(verified_claims=0))
+    scanned = 0
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            select(ExperienceClaim.id, ExperienceClaim.skill_tags, ExperienceClaim.status)
+            .where(ExperienceClaim.id > last_id)
+            .order_by(ExperienceClaim.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+        set_claim_tags(conn, [(claim_id, raw, status == ClaimStatus.verified) for claim_id, raw, status in rows])
+    conn.execute(delete(tags).where(~exists().where(claim_tags.c.tag_id == tags.c.id)))
+    return scanned
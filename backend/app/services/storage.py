@@ -1,6 +1,86 @@
+import os
+from abc import ABC, abstractmethod
 from logging import getLogger
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from ..config import get_settings
 
 logger = getLogger(__name__)
+settings = get_settings()
+
+READ_CHUNK_BYTES = 1024 * 1024
+
+
+class StorageBackend(ABC):
+    """Evidence byte store addressed by opaque keys.
+
+    Uploads are staged under one key (appended to across requests, so they can resume) and promoted to
+    their final key once complete. An S3-compatible backend maps staging to a multipart upload and
+    `promote` to CompleteMultipartUpload + copy.
+    """
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """Bytes stored under `key`; 0 if absent."""
+
+    @abstractmethod
+    def open_append(self, key: str, offset: int) -> BinaryIO:
+        """Open `key` for writing at `offset`, discarding anything past it."""
+
+    @abstractmethod
+    def read(self, key: str, start: int = 0) -> Iterator[bytes]:
+        """Stream the bytes of `key` from `start`."""
+
+    @abstractmethod
+    def promote(self, staging_key: str, key: str) -> None:
+        """Move a completed staged upload to its final key."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove `key`; a no-op if absent."""
+
+
+class LocalStorage(StorageBackend):
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root).resolve()
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root not in path.parents:
+            raise ValueError(f"Storage key escapes root: {key!r}")
+        return path
+
+    def size(self, key: str) -> int:
+        try:
+            return self._path(key).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def open_append(self, key: str, offset: int) -> BinaryIO:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "r+b" if path.exists() else "wb")
+        handle.truncate(offset)
+        handle.seek(offset)
+        return handle
+
+    def read(self, key: str, start: int = 0) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as handle:
+            handle.seek(start)
+            while chunk := handle.read(READ_CHUNK_BYTES):
+                yield chunk
+
+    def promote(self, staging_key: str, key: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._path(staging_key), path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+storage = LocalStorage(settings.evidence_storage_dir)
 
 
 def get_presigned_upload_url(file_name: str, mime_type: str) -> dict:
@@ -0,0 +1,162 @@
+"""Requests/sec and latency of sync (threadpool + Session) vs async (AsyncSession) read endpoints.
+
+    python -m benchmarks.async_vs_sync --connections 500 --requests 20
+
+Seeds a temporary SQLite file, serves a small app exposing the same repository reads through
+both DB paths with uvicorn in a subprocess, and drives it with keep-alive connections.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import statistics
+import tempfile
+import time
+from datetime import date
+
+_CONTENT_LENGTH = re.compile(rb"content-length:\s*(\d+)", re.IGNORECASE)
+
+
+def _seed() -> None:
+    from app.db import Base, SessionLocal, engine
+    from app.models import ClaimStatus, EvidenceFile, ExperienceClaim
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    for i in range(20):
+        db.add(
+            ExperienceClaim(
+                id=f"claim-{i}",
+                candidate_id="candidate-1",
+                title="Field Officer",
+                claim_type="internship",
+                organization_name="Sarvodaya",
+                supervisor_name="S",
+                supervisor_contact="s@sarvodaya.lk",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 6, 1),
+                description="Benchmark claim",
+                status=ClaimStatus.verified,
+            )
+        )
+        db.add(EvidenceFile(claim_id=f"claim-{i}", file_name="letter.pdf", mime_type="application/pdf", storage_path="x"))
+    db.commit()
+    db.close()
+
+
+def _bench_app():
+    from fastapi import Depends, FastAPI
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+    from app.db import get_async_db, get_db
+    from app.repositories.claims import get_claims_for_candidate, get_claims_for_candidate_async
+    from app.schemas.models import ExperienceClaimOut
+
+    app = FastAPI()
+
+    @app.get("/sync/claims", response_model=list[ExperienceClaimOut])
+    def sync_claims(db: Session = Depends(get_db)):
+        return get_claims_for_candidate(db, "candidate-1")
+
+    @app.get("/async/claims", response_model=list[ExperienceClaimOut])
+    async def async_claims(db: AsyncSession = Depends(get_async_db)):
+        return await get_claims_for_candidate_async(db, "candidate-1")
+
+    return app
+
+
+def _serve(port: int) -> None:
+    import uvicorn
+
+    uvicorn.run(_bench_app(), host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+async def _connection(port: int, path: str, count: int, latencies: list[float], errors: list[int]) -> None:
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    reader = writer = None
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            await reader.readexactly(int(_CONTENT_LENGTH.search(head).group(1)))
+            status = int(head.split(b" ", 2)[1])
+        except (OSError, asyncio.IncompleteReadError):
+            # The server drops the connection after an unhandled error; reconnect for the next request
+            status = 0
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            errors.append(status)
+    if writer is not None:
+        writer.close()
+
+
+async def _drive(port: int, path: str, connections: int, requests: int) -> dict:
+    latencies: list[float] = []
+    errors: list[int] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_connection(port, path, requests, latencies, errors) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "path": path,
+        "connections": connections,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+    }
+
+
+async def _wait_for(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per connection")
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ.setdefault("DB_POOL_SIZE", "20")
+    os.environ.setdefault("DB_MAX_OVERFLOW", "40")
+    # Fail pool checkouts fast so saturation shows up as errors instead of 30s stalls
+    os.environ.setdefault("DB_POOL_TIMEOUT_SECONDS", "5")
+    _seed()
+
+    server = multiprocessing.Process(target=_serve, args=(args.port,), daemon=True)
+    server.start()
+    try:
+        asyncio.run(_wait_for(args.port))
+        for path in ("/sync/claims", "/async/claims"):
+            asyncio.run(_drive(args.port, path, 10, 5))  # warm up
+            print(json.dumps(asyncio.run(_drive(args.port, path, args.connections, args.requests))))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
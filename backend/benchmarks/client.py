@@ -0,0 +1,70 @@
+"""Minimal keep-alive HTTP/1.1 client for benchmarks (no third-party HTTP library needed)."""
+import asyncio
+import json
+import re
+import time
+
+_CONTENT_LENGTH = re.compile(rb"content-length:\s*(\d+)", re.IGNORECASE)
+
+
+class Connection:
+    """One persistent connection; reconnects after the server drops it. Responses must carry Content-Length."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(
+        self, method: str, path: str, headers: dict[str, str] | None = None, body: bytes = b"", json_body=None
+    ) -> tuple[int, bytes]:
+        """Returns (status, body); status 0 means the connection failed."""
+        headers = dict(headers or {})
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            headers["Content-Type"] = "application/json"
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n"
+        head += "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+        message = head.encode() + b"\r\n" + body
+        # A reused connection may have been closed by the server's keep-alive timeout; retry once on a fresh one
+        for attempt in range(2):
+            reused = self._writer is not None
+            try:
+                if self._writer is None:
+                    self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                self._writer.write(message)
+                await self._writer.drain()
+                response_head = await self._reader.readuntil(b"\r\n\r\n")
+            except (OSError, asyncio.IncompleteReadError):
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                return 0, b""
+            try:
+                status = int(response_head.split(b" ", 2)[1])
+                length = _CONTENT_LENGTH.search(response_head)
+                payload = await self._reader.readexactly(int(length.group(1))) if length else b""
+                return status, payload
+            except (OSError, asyncio.IncompleteReadError):
+                self.close()
+                return 0, b""
+        return 0, b""
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+async def wait_for(port: int, timeout: float = 15.0, host: str = "127.0.0.1") -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
@@ -0,0 +1,263 @@
+"""Deterministic synthetic VerifyLK dataset: organizations, users, claims, verifications, disputes.
+
+    python -m benchmarks.datagen --database-url sqlite:///bench.db --claims 100000 --seed 7
+
+The same seed and scale always produce the same rows (ids included), so runs are comparable across
+commits. Every user's password is `PASSWORD`; accounts follow `candidate{n}@bench.lk` and
+`verifier{n}@bench.lk`, where verifier n belongs to organization n.
+"""
+import argparse
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from app.db import Base
+from app.models import (
+    ClaimStatus,
+    Dispute,
+    DisputeStatus,
+    EvidenceVisibility,
+    ExperienceClaim,
+    Organization,
+    OrgStatus,
+    User,
+    UserRole,
+    VerificationOutcome,
+    VerificationRecord,
+)
+from app.migrations import migrate
+from app.security import get_password_hash
+from app.services.profiles import rebuild_profiles
+from app.services.skill_tags import rebuild_skill_tags
+
+PASSWORD = "bench-password"
+BATCH = 20_000
+
+PLACES = [
+    "Colombo", "Kandy", "Galle", "Jaffna", "Matara", "Batticaloa", "Trincomalee", "Kurunegala",
+    "Anuradhapura", "Ratnapura", "Badulla", "Negombo", "Nuwara Eliya", "Vavuniya", "Hambantota",
+]
+ORG_KINDS = [
+    "Youth Collective", "Tech Hub", "Community Trust", "Green Initiative", "Heritage Foundation",
+    "Women's Network", "Digital Labs", "Relief Fund", "Tea Estates", "Coastal Conservation",
+]
+FIRST_NAMES = [
+    "Nimal", "Kumari", "Tharindu", "Dilani", "Kasun", "Sanduni", "Arun", "Priya", "Karthik", "Nisha",
+    "Fathima", "Rizwan", "Chathura", "Ishara", "Gayan", "Malini", "Suresh", "Thilini", "Ramesh", "Anjali",
+]
+LAST_NAMES = [
+    "Perera", "Fernando", "Silva", "Jayasinghe", "Wickramasinghe", "Bandara", "Sivakumar", "Nadarajah",
+    "Kanagaratnam", "Mohamed", "Hameed", "Dissanayake", "Gunawardena", "Herath", "Ratnayake", "Rajendran",
+]
+TITLES = [
+    "Field Officer", "Software Intern", "Teaching Assistant", "Community Health Volunteer",
+    "Tea Estate Supervisor", "Data Entry Assistant", "Tour Guide", "Disaster Relief Volunteer",
+]
+CLAIM_TYPES = ["internship", "volunteering", "part_time"]
+SKILLS = [
+    "python", "excel", "sinhala", "tamil", "english", "customer service", "first aid", "teaching",
+    "accounting", "fieldwork", "react", "logistics",
+]
+STATUS_WEIGHTS = {
+    ClaimStatus.draft: 10,
+    ClaimStatus.pending: 35,
+    ClaimStatus.verified: 40,
+    ClaimStatus.rejected: 10,
+    ClaimStatus.disputed: 5,
+}
+EPOCH = datetime(2024, 1, 1)
+
+
+@dataclass
+class DatasetSummary:
+    seed: int
+    organizations: int
+    candidates: int
+    verifiers: int
+    claims: int
+    verifications: int
+    disputes: int
+    elapsed_seconds: float
+
+
+def org_name(n: int) -> str:
+    return f"{PLACES[n % len(PLACES)]} {ORG_KINDS[(n // len(PLACES)) % len(ORG_KINDS)]} {n // 150 + 1}"
+
+
+def candidate_email(n: int) -> str:
+    return f"candidate{n}@bench.lk"
+
+
+def verifier_email(n: int) -> str:
+    return f"verifier{n}@bench.lk"
+
+
+def scale(claims: int) -> tuple[int, int]:
+    """(organizations, candidates) for a given claim count."""
+    return max(5, claims // 2000), max(1, claims // 4)
+
+
+def _insert(engine: Engine, model, rows: list[dict]) -> None:
+    with engine.begin() as conn:
+        for start in range(0, len(rows), BATCH):
+            conn.execute(insert(model), rows[start : start + BATCH])
+
+
+def generate(engine: Engine, claims: int, seed: int = 7) -> DatasetSummary:
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    Base.metadata.create_all(bind=engine)
+    migrate(engine)
+    organizations, candidates = scale(claims)
+    # bcrypt once: every synthetic account shares the hash
+    password_hash = get_password_hash(PASSWORD)
+
+    _insert(
+        engine,
+        Organization,
+        [
+            {
+                "id": f"org-{n:05d}",
+                "name": org_name(n),
+                "verified_status": OrgStatus.verified if n % 4 else OrgStatus.pending,
+                "contact_email": f"contact@org{n}.bench.lk",
+                "created_at": EPOCH,
+                "updated_at": EPOCH,
+            }
+            for n in range(organizations)
+        ],
+    )
+
+    def person(rng: random.Random) -> str:
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+    users = [
+        {
+            "id": f"verifier-{n:05d}",
+            "email": verifier_email(n),
+            "password_hash": password_hash,
+            "full_name": person(rng),
+            "role": UserRole.verifier,
+            "org_id": f"org-{n:05d}",
+            "created_at": EPOCH,
+            "updated_at": EPOCH,
+        }
+        for n in range(organizations)
+    ]
+    users += [
+        {
+            "id": f"candidate-{n:07d}",
+            "email": candidate_email(n),
+            "password_hash": password_hash,
+            "full_name": person(rng),
+            "role": UserRole.candidate,
+            "org_id": None,
+            "created_at": EPOCH,
+            "updated_at": EPOCH,
+        }
+        for n in range(candidates)
+    ]
+    _insert(engine, User, users)
+    del users
+
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    verifications = disputes = 0
+    for start in range(0, claims, BATCH):
+        claim_rows, verification_rows, dispute_rows = [], [], []
+        for i in range(start, min(claims, start + BATCH)):
+            status = rng.choices(statuses, weights)[0]
+            org = rng.randrange(organizations)
+            begin = date(2019, 1, 1) + timedelta(days=rng.randrange(5 * 365))
+            end = begin + timedelta(days=rng.randrange(30, 720))
+            created = EPOCH + timedelta(seconds=i * 30)
+            claim_id = f"claim-{i:08d}"
+            claim_rows.append(
+                {
+                    "id": claim_id,
+                    "candidate_id": f"candidate-{i % candidates:07d}",
+                    "title": rng.choice(TITLES),
+                    "claim_type": rng.choice(CLAIM_TYPES),
+                    "organization_name": org_name(org),
+                    "supervisor_name": person(rng),
+                    "supervisor_contact": f"supervisor{org}@bench.lk",
+                    "start_date": begin,
+                    "end_date": end,
+                    "description": f"{rng.choice(TITLES)} work across {rng.choice(PLACES)} district.",
+                    "skill_tags": rng.sample(SKILLS, rng.randint(1, 4)),
+                    "status": status,
+                    "evidence_visibility": EvidenceVisibility.public if rng.random() < 0.5 else EvidenceVisibility.verifier_only,
+                    "credibility_score": rng.randint(40, 95) if status == ClaimStatus.verified else None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+            )
+            if status in (ClaimStatus.verified, ClaimStatus.rejected, ClaimStatus.disputed):
+                verification_rows.append(
+                    {
+                        "id": f"verification-{i:08d}",
+                        "claim_id": claim_id,
+                        "verifier_id": f"verifier-{org:05d}",
+                        "organization_id": f"org-{org:05d}",
+                        "outcome": VerificationOutcome.rejected if status == ClaimStatus.rejected else VerificationOutcome.approved,
+                        "notes": None,
+                        "role_type": None,
+                        "verified_start_date": begin,
+                        "verified_end_date": end,
+                        "valid_until": None,
+                        "created_at": created + timedelta(days=3),
+                    }
+                )
+            if status == ClaimStatus.disputed:
+                dispute_rows.append(
+                    {
+                        "id": f"dispute-{i:08d}",
+                        "claim_id": claim_id,
+                        "raised_by": f"candidate-{i % candidates:07d}",
+                        "status": DisputeStatus.open,
+                        "reason": "Dates recorded by the organization are wrong.",
+                        "resolution_notes": None,
+                        "created_at": created + timedelta(days=10),
+                        "updated_at": created + timedelta(days=10),
+                    }
+                )
+        _insert(engine, ExperienceClaim, claim_rows)
+        if verification_rows:
+            _insert(engine, VerificationRecord, verification_rows)
+        if dispute_rows:
+            _insert(engine, Dispute, dispute_rows)
+        verifications += len(verification_rows)
+        disputes += len(dispute_rows)
+
+    # Bulk inserts skip the ORM listener and repository code that maintain profiles and skill tags
+    with engine.begin() as conn:
+        rebuild_profiles(conn)
+        rebuild_skill_tags(conn)
+
+    return DatasetSummary(
+        seed=seed,
+        organizations=organizations,
+        candidates=candidates,
+        verifiers=organizations,
+        claims=claims,
+        verifications=verifications,
+        disputes=disputes,
+        elapsed_seconds=round(time.perf_counter() - started, 2),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--claims", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(asdict(generate(create_engine(args.database_url), args.claims, args.seed))))
+
+
+if __name__ == "__main__":
+    main()
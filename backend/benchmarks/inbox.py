@@ -0,0 +1,98 @@
+"""Verifier inbox latency vs. number of pending claims.
+
+    python -m benchmarks.inbox --sizes 1000 10000 100000 1000000
+
+Each size gets a fresh SQLite file; pages are fetched from random keyset positions
+and p50/p95 latencies are printed as JSON, one object per size.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import ClaimStatus, EvidenceVisibility, ExperienceClaim, Organization, OrgStatus, User, UserRole
+from app.repositories.verifications import inbox_for_verifier
+
+ORGS = ["Community Bridge", "TechWorks Jaffna", "GreenHands", "Sarvodaya Youth", "Galle Heritage Trust"]
+CLAIM_TYPES = ["internship", "volunteering", "part_time"]
+
+
+def _populate(db, size: int, batch: int = 20_000) -> None:
+    epoch = datetime(2024, 1, 1)
+    for offset in range(0, size, batch):
+        db.execute(
+            insert(ExperienceClaim),
+            [
+                {
+                    "id": f"claim-{i:08d}",
+                    "candidate_id": f"candidate-{i % 5000}",
+                    "title": "Field Assistant",
+                    "claim_type": CLAIM_TYPES[i % len(CLAIM_TYPES)],
+                    "organization_name": ORGS[i % len(ORGS)],
+                    "supervisor_name": "Supervisor",
+                    "supervisor_contact": "supervisor@example.lk",
+                    "start_date": date(2023, 1, 1),
+                    "end_date": date(2023, 6, 1),
+                    "description": "Synthetic benchmark claim",
+                    "skill_tags": [],
+                    "status": ClaimStatus.pending,
+                    "evidence_visibility": EvidenceVisibility.verifier_only,
+                    "created_at": epoch + timedelta(seconds=i),
+                    "updated_at": epoch + timedelta(seconds=i),
+                }
+                for i in range(offset, min(size, offset + batch))
+            ],
+        )
+    db.commit()
+
+
+def run(size: int, samples: int, page_size: int) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "inbox.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    org = Organization(id="org-bench", name=ORGS[0], verified_status=OrgStatus.verified)
+    verifier = User(id="verifier-bench", email="verifier@example.lk", password_hash="x", full_name="V", role=UserRole.verifier, org_id=org.id)
+    db.add_all([org, verifier])
+    db.commit()
+    _populate(db, size)
+
+    rng = random.Random(size)
+    epoch = datetime(2024, 1, 1)
+    latencies = []
+    for _ in range(samples):
+        i = rng.randrange(size)
+        after = (epoch + timedelta(seconds=i), f"claim-{i:08d}")
+        start = time.perf_counter()
+        inbox_for_verifier(db, verifier, limit=page_size, after=after, claim_type=rng.choice(CLAIM_TYPES))
+        latencies.append((time.perf_counter() - start) * 1000)
+        db.expunge_all()
+        db.add(verifier)
+    db.close()
+    engine.dispose()
+    os.remove(path)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {"pending_claims": size, "page_size": page_size, "p50_ms": round(quantiles[49], 3), "p95_ms": round(quantiles[94], 3)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+    for size in args.sizes:
+        print(json.dumps(run(size, args.samples, args.page_size)))
+
+
+if __name__ == "__main__":
+    main()
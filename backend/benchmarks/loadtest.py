@@ -0,0 +1,193 @@
+"""End-to-end load test of the hot API flows against a generated dataset.
+
+    python -m benchmarks.loadtest --claims 10000 --users 50 --iterations 10 --output results.json
+    python -m benchmarks.loadtest --database-url postgresql://... --claims 1000000 --reuse-data
+
+Generates a deterministic dataset (see benchmarks.datagen) into a temporary SQLite file or the given
+database, serves the real app with uvicorn in a subprocess, and runs `--users` concurrent virtual
+users. Each logs in as a candidate and as the verifier of one organization, then repeats: create
+claim, request verification, list claims, verifier inbox, decide, issue report link, view report.
+
+Prints (and optionally writes) one JSON document with requests/s and p50/p95/p99 per endpoint, plus
+the git commit and dataset parameters, so runs can be diffed across commits.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from sqlalchemy import create_engine
+
+from .client import Connection, wait_for
+from .datagen import PASSWORD, candidate_email, generate, org_name, scale, verifier_email
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, dict[int, int]] = {}
+
+    async def call(self, conn: Connection, name: str, method: str, path: str, expect: int = 200, **kwargs):
+        start = time.perf_counter()
+        status, body = await conn.request(method, path, **kwargs)
+        self.latencies.setdefault(name, []).append(time.perf_counter() - start)
+        if status != expect:
+            by_status = self.errors.setdefault(name, {})
+            by_status[status] = by_status.get(status, 0) + 1
+            return None
+        return json.loads(body) if body else {}
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for name, samples in self.latencies.items():
+            q = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+            endpoints[name] = {
+                "requests": len(samples),
+                "errors": sum(self.errors.get(name, {}).values()),
+                "error_statuses": self.errors.get(name, {}),
+                "requests_per_second": round(len(samples) / elapsed, 1),
+                "p50_ms": round(q[49] * 1000, 2),
+                "p95_ms": round(q[94] * 1000, 2),
+                "p99_ms": round(q[98] * 1000, 2),
+            }
+        total = sum(len(s) for s in self.latencies.values())
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "requests": total,
+            "errors": sum(sum(e.values()) for e in self.errors.values()),
+            "requests_per_second": round(total / elapsed, 1),
+            "endpoints": endpoints,
+        }
+
+
+async def _login(conn: Connection, rec: Recorder, email: str) -> dict[str, str] | None:
+    body = f"username={quote(email)}&password={quote(PASSWORD)}".encode()
+    token = await rec.call(
+        conn, "POST /auth/login", "POST", "/api/v1/auth/login", body=body,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    return {"Authorization": f"Bearer {token['access_token']}"} if token else None
+
+
+async def virtual_user(port: int, rec: Recorder, n: int, organizations: int, candidates: int, iterations: int) -> None:
+    org = n % organizations
+    candidate_conn, verifier_conn, public_conn = Connection(port), Connection(port), Connection(port)
+    try:
+        candidate = await _login(candidate_conn, rec, candidate_email(n % candidates))
+        verifier = await _login(verifier_conn, rec, verifier_email(org))
+        if not candidate or not verifier:
+            return
+        for i in range(iterations):
+            claim = await rec.call(
+                candidate_conn, "POST /claims", "POST", "/api/v1/claims", expect=201, headers=candidate,
+                json_body={
+                    "title": "Load Test Volunteer",
+                    "claim_type": "volunteering",
+                    "organization_name": org_name(org),
+                    "supervisor_name": "Load Supervisor",
+                    "supervisor_contact": f"supervisor{org}@bench.lk",
+                    "start_date": "2023-01-01",
+                    "end_date": "2023-12-31",
+                    "description": f"Virtual user {n} iteration {i}",
+                    "skill_tags": ["fieldwork", "sinhala"],
+                },
+            )
+            if claim is None:
+                continue
+            claim_path = f"/api/v1/claims/{claim['id']}"
+            await rec.call(candidate_conn, "POST /claims/{id}/request-verification", "POST", f"{claim_path}/request-verification", headers=candidate)
+            await rec.call(candidate_conn, "GET /claims", "GET", "/api/v1/claims", headers=candidate)
+            await rec.call(verifier_conn, "GET /verifications/inbox", "GET", "/api/v1/verifications/inbox?limit=20", headers=verifier)
+            # Decide the claim this user just created, so concurrent verifiers of one org never collide
+            await rec.call(
+                verifier_conn, "POST /verifications/{id}/decision", "POST", f"/api/v1/verifications/{claim['id']}/decision",
+                headers=verifier, json_body={"outcome": "approved", "notes": "load test"},
+            )
+            link = await rec.call(candidate_conn, "POST /claims/{id}/report-link", "POST", f"{claim_path}/report-link", headers=candidate)
+            if link is None:
+                continue
+            for _ in range(2):
+                await rec.call(public_conn, "GET /reports/{token}", "GET", f"/api/v1/reports/{link['token']}")
+    finally:
+        for conn in (candidate_conn, verifier_conn, public_conn):
+            conn.close()
+
+
+async def run_load(port: int, users: int, iterations: int, organizations: int, candidates: int) -> dict:
+    rec = Recorder()
+    start = time.perf_counter()
+    await asyncio.gather(*(virtual_user(port, rec, n, organizations, candidates, iterations) for n in range(users)))
+    return rec.summary(time.perf_counter() - start)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=BACKEND, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a fresh temporary SQLite file")
+    parser.add_argument("--claims", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--reuse-data", action="store_true", help="Skip generation; the database already holds this scale/seed")
+    parser.add_argument("--users", type=int, default=50, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=10, help="Flow repetitions per virtual user")
+    parser.add_argument("--port", type=int, default=8798)
+    parser.add_argument("--output", help="Also write the JSON result to this file")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'loadtest.db')}"
+    dataset = None
+    if not args.reuse_data:
+        engine = create_engine(database_url)
+        dataset = asdict(generate(engine, args.claims, args.seed))
+        engine.dispose()
+    organizations, candidates = scale(args.claims)
+
+    # Every virtual user logs in from 127.0.0.1; per-IP auth limits would turn the run into 429s
+    env = {**os.environ, "DATABASE_URL": database_url, "EVIDENCE_STORAGE_DIR": tempfile.mkdtemp(), "RATE_LIMIT_ENABLED": "false"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=BACKEND, env=env,
+    )
+    try:
+        asyncio.run(wait_for(args.port, timeout=60))
+        result = asyncio.run(run_load(args.port, args.users, args.iterations, organizations, candidates))
+    finally:
+        server.terminate()
+        server.wait()
+
+    document = {
+        "commit": _git_commit(),
+        "started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "database": database_url.split(":", 1)[0],
+        "claims": args.claims,
+        "seed": args.seed,
+        "users": args.users,
+        "iterations": args.iterations,
+        "dataset": dataset,
+        **result,
+    }
+    print(json.dumps(document, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""SQL statements issued to list and serialize claims.
+
+    python -m benchmarks.query_counts
+
+Seeds a 500-claim candidate and a 5,000-claim inbox (each claim with two evidence files),
+then counts the statements needed to load and serialize them through ExperienceClaimOut.
+"""
+import json
+from datetime import date
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import ClaimStatus, EvidenceFile, ExperienceClaim, User, UserRole
+from app.repositories.claims import get_claims_for_candidate
+from app.repositories.verifications import inbox_for_verifier
+from app.schemas.models import ExperienceClaimOut
+
+
+def _seed(db, prefix: str, count: int, candidate_id: str, status: ClaimStatus) -> None:
+    claims = [
+        {
+            "id": f"{prefix}-{i:05d}",
+            "candidate_id": candidate_id,
+            "title": "Community Health Volunteer",
+            "claim_type": "volunteering",
+            "organization_name": "Sarvodaya",
+            "supervisor_name": "S",
+            "supervisor_contact": "s@sarvodaya.lk",
+            "start_date": date(2024, 1, 1),
+            "end_date": date(2024, 6, 1),
+            "description": "Benchmark claim",
+            "status": status,
+        }
+        for i in range(count)
+    ]
+    db.execute(insert(ExperienceClaim), claims)
+    db.execute(
+        insert(EvidenceFile),
+        [
+            {"id": f"{claim['id']}-e{n}", "claim_id": claim["id"], "file_name": "letter.pdf", "mime_type": "application/pdf", "storage_path": "x"}
+            for claim in claims
+            for n in range(2)
+        ],
+    )
+
+
+def _count(engine, fn) -> int:
+    statements = []
+
+    def listener(*args):
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        [ExperienceClaimOut.model_validate(claim) for claim in fn()]
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return len(statements)
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    verifier = User(id="verifier", email="v@example.lk", password_hash="x", full_name="V", role=UserRole.verifier)
+    db.add(verifier)
+    _seed(db, "candidate", 500, "candidate-1", ClaimStatus.draft)
+    _seed(db, "inbox", 5000, "candidate-2", ClaimStatus.pending)
+    db.commit()
+
+    scenarios = {
+        "candidate_500_claims": lambda: get_claims_for_candidate(db, "candidate-1"),
+        "candidate_500_claims_lazy": lambda: get_claims_for_candidate(db, "candidate-1", options=()),
+        "inbox_5000_claims": lambda: inbox_for_verifier(db, verifier, limit=5000),
+        "inbox_5000_claims_lazy": lambda: inbox_for_verifier(db, verifier, limit=5000, options=()),
+    }
+    for name, fn in scenarios.items():
+        db.expire_all()
+        print(json.dumps({"scenario": name, "statements": _count(engine, fn)}))
+
+
+if __name__ == "__main__":
+    main()
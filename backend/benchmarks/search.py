@@ -0,0 +1,77 @@
+"""Claim search latency vs. number of claims.
+
+    python -m benchmarks.search --sizes 10000 100000 1000000
+
+Each size gets a fresh SQLite file filled by benchmarks.datagen. Queries mix whole words and
+short prefixes of titles, places and skills, with and without a score filter; the first page and a
+keyset follow-up page are timed, and p50/p95 latencies are printed as JSON, one object per size.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.repositories.search import search_claims
+
+from .datagen import PLACES, SKILLS, TITLES, generate
+
+WORDS = sorted({word.lower() for phrase in TITLES + PLACES + SKILLS for word in phrase.split()})
+
+
+def _query(rng: random.Random) -> str:
+    words = rng.sample(WORDS, rng.choice((1, 1, 2)))
+    return " ".join(word[: rng.randint(2, len(word))] if rng.random() < 0.4 else word for word in words)
+
+
+def run(size: int, samples: int, page_size: int, seed: int) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "search.db")
+    engine = create_engine(f"sqlite:///{path}")
+    generate(engine, size, seed)
+    db = sessionmaker(bind=engine)()
+
+    rng = random.Random(size)
+    first, following = [], []
+    for _ in range(samples):
+        q = _query(rng)
+        min_score = rng.choice((None, 60))
+        start = time.perf_counter()
+        page = search_claims(db, q, min_score=min_score, limit=page_size, options=())
+        first.append((time.perf_counter() - start) * 1000)
+        if len(page) == page_size:
+            last, rank = page[-1]
+            start = time.perf_counter()
+            search_claims(db, q, min_score=min_score, limit=page_size, after=(rank, last.id), options=())
+            following.append((time.perf_counter() - start) * 1000)
+        db.expunge_all()
+    db.close()
+    engine.dispose()
+    os.remove(path)
+
+    result = {"claims": size, "page_size": page_size}
+    for name, latencies in (("first_page", first), ("next_page", following)):
+        if len(latencies) >= 2:
+            quantiles = statistics.quantiles(latencies, n=100)
+            result[f"{name}_p50_ms"] = round(quantiles[49], 3)
+            result[f"{name}_p95_ms"] = round(quantiles[94], 3)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    for size in args.sizes:
+        print(json.dumps(run(size, args.samples, args.page_size, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
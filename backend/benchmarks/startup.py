@@ -0,0 +1,97 @@
+"""Cold-start cost of one API worker: `import app.main` and time to first response.
+
+    python -m benchmarks.startup --runs 5 --budget-ms 3000
+
+Bootstraps a temporary SQLite file once (as a deploy would), then for each run starts a fresh
+interpreter to time the import alone, and a fresh uvicorn process to time spawn -> lifespan ->
+first `GET /` answered. Prints one JSON document with the median/max of both; exits non-zero if
+the median time to first response exceeds `--budget-ms`, so CI can keep worker startup in check.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .client import Connection
+
+BACKEND = Path(__file__).resolve().parent.parent
+IMPORT_PROBE = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def _import_seconds(env: dict) -> float:
+    out = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=BACKEND, env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+async def _first_response(port: int, timeout: float) -> int:
+    deadline = time.monotonic() + timeout
+    while True:
+        conn = Connection(port)
+        status, _ = await conn.request("GET", "/")
+        conn.close()
+        if status:
+            return status
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"no response on port {port} after {timeout}s")
+        await asyncio.sleep(0.01)
+
+
+def _serve_seconds(env: dict, port: int, timeout: float) -> float:
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"], cwd=BACKEND, env=env
+    )
+    try:
+        status = asyncio.run(_first_response(port, timeout))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+    if status != 200:
+        raise RuntimeError(f"GET / returned {status}")
+    return elapsed
+
+
+def _summary(samples: list[float]) -> dict:
+    return {"median_ms": round(statistics.median(samples) * 1000, 1), "max_ms": round(max(samples) * 1000, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=3000, help="Fail if median time to first response exceeds this")
+    parser.add_argument("--port", type=int, default=8797)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+        "EVIDENCE_STORAGE_DIR": os.path.join(workdir, "storage"),
+    }
+    subprocess.run([sys.executable, "-m", "app.cli", "bootstrap", "--no-seed"], cwd=BACKEND, env=env, check=True, capture_output=True)
+
+    imports = [_import_seconds(env) for _ in range(args.runs)]
+    serves = [_serve_seconds(env, args.port, args.timeout) for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        "import": _summary(imports),
+        "first_response": _summary(serves),
+        "budget_ms": args.budget_ms,
+    }
+    result["within_budget"] = result["first_response"]["median_ms"] <= args.budget_ms
+    print(json.dumps(result, indent=2))
+    if not result["within_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
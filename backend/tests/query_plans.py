@@ -0,0 +1,57 @@
+"""EXPLAIN helpers for asserting that repository queries are served by indexes."""
+import json
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def captured_selects(engine: Engine):
+    """Collect (statement, parameters) for every SELECT issued on the engine inside the block."""
+    captured: list[tuple[str, object]] = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+def _sqlite_scans(conn, statement, parameters) -> list[str]:
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    # "SCAN <table>" without an index is a full table scan; "SEARCH" and "SCAN ... USING INDEX" are not.
+    return [row[-1] for row in rows if row[-1].startswith("SCAN ") and "USING" not in row[-1]]
+
+
+def _postgres_scans(conn, statement, parameters) -> list[str]:
+    conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    (plan,) = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).one()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    scans: list[str] = []
+
+    def walk(node):
+        if node.get("Node Type") == "Seq Scan":
+            scans.append(f"Seq Scan on {node.get('Relation Name')}")
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return scans
+
+
+def table_scans(engine: Engine, statements: list[tuple[str, object]]) -> dict[str, list[str]]:
+    """Map each statement that falls back to a table scan to the offending plan lines."""
+    explain = _postgres_scans if engine.dialect.name == "postgresql" else _sqlite_scans
+    offenders: dict[str, list[str]] = {}
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            scans = explain(conn, statement, parameters)
+            if scans:
+                offenders[statement] = scans
+        conn.rollback()
+    return offenders
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base, async_database_url
+from app.models import ClaimStatus, EvidenceFile, ExperienceClaim, Organization, User, UserRole
+from app.repositories.claims import get_claims_for_candidate_async
+from app.repositories.verifications import inbox_for_verifier_async
+from app.services.auth_cache import invalidate_user, load_user_async
+from app.services.reports import render_report, render_report_async
+
+
+def test_async_repositories_match_sync_results(tmp_path):
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            Organization(id="o1", name="Sarvodaya"),
+            User(id="v1", email="v@sarvodaya.lk", password_hash="x", full_name="V", role=UserRole.verifier, org_id="o1"),
+        ]
+    )
+    for claim_id, status in (("a1", ClaimStatus.pending), ("a2", ClaimStatus.verified)):
+        db.add(
+            ExperienceClaim(
+                id=claim_id,
+                candidate_id="u1",
+                title="Field Officer",
+                claim_type="internship",
+                organization_name="Sarvodaya",
+                supervisor_name="S",
+                supervisor_contact="s@sarvodaya.lk",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 6, 1),
+                description="Surveys",
+                status=status,
+            )
+        )
+        db.add(EvidenceFile(claim_id=claim_id, file_name="letter.pdf", mime_type="application/pdf", storage_path="x"))
+    db.commit()
+    sync_report = render_report(db, "a2")
+    db.close()
+    invalidate_user("v1")
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+            claims = await get_claims_for_candidate_async(session, "u1")
+            verifier = await load_user_async(session, "v1")
+            inbox = await inbox_for_verifier_async(session, verifier)
+            report = await render_report_async(session, "a2")
+        await async_engine.dispose()
+        return claims, inbox, report
+
+    claims, inbox, report = asyncio.run(scenario())
+    assert sorted(c.id for c in claims) == ["a1", "a2"]
+    assert all(len(c.evidence) == 1 for c in claims)
+    assert [c.id for c in inbox] == ["a1"]
+    assert report == sync_report
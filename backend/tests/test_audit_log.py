@@ -0,0 +1,89 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints import admin
+from app.db import Base
+from app.models import AuditLog, User, UserRole
+from app.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+ADMIN = User(id="a1", email="a@x.lk", password_hash="x", full_name="A", role=UserRole.admin)
+FILTERS = {"actor_id": None, "entity_type": None, "entity_id": None, "since": None, "until": None}
+
+
+def _seed(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    start = datetime(2025, 1, 1)
+    # Pairs share a timestamp, so pages must break ties on id
+    db.add_all(
+        AuditLog(
+            action="claim.updated",
+            actor_id="u1" if i % 3 else "u2",
+            entity_type="claim",
+            entity_id=f"c{i % 2}",
+            created_at=start + timedelta(minutes=i // 2),
+        )
+        for i in range(7)
+    )
+    db.commit()
+    return Session, db
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    at = datetime(2025, 1, 1, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(at, 42)) == (at, "42")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_audit_pages_are_newest_first_without_gaps(tmp_path):
+    Session, db = _seed(tmp_path)
+    seen, cursor = [], None
+    while True:
+        response = Response()
+        page = admin.list_audit(response, limit=3, cursor=cursor, filters=FILTERS, current_user=ADMIN, db=db)
+        seen += [(entry["created_at"], entry["id"]) for entry in page]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+    assert [log_id for _, log_id in seen] == [7, 6, 5, 4, 3, 2, 1]
+    assert seen == sorted(seen, reverse=True)
+
+    filtered = admin.list_audit(Response(), limit=50, cursor=None, filters={**FILTERS, "actor_id": "u2"}, current_user=ADMIN, db=db)
+    assert [entry["id"] for entry in filtered] == [7, 4, 1]
+    with pytest.raises(HTTPException) as exc:
+        admin.list_audit(Response(), limit=3, cursor="garbage", filters=FILTERS, current_user=ADMIN, db=db)
+    assert exc.value.status_code == 400
+    db.close()
+
+
+def test_export_streams_filtered_ndjson_oldest_first(tmp_path, monkeypatch):
+    Session, db = _seed(tmp_path)
+    db.close()
+    monkeypatch.setattr(admin, "SessionLocal", Session)
+    response = admin.export_audit(filters={**FILTERS, "entity_id": "c0"}, current_user=ADMIN)
+    assert response.media_type == "application/x-ndjson"
+
+    async def body() -> str:
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    lines = asyncio.run(body()).splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["id"] for row in rows] == [1, 3, 5, 7]
+    assert rows[0] == {
+        "id": 1,
+        "action": "claim.updated",
+        "actor_id": "u2",
+        "entity_type": "claim",
+        "entity_id": "c0",
+        "metadata": None,
+        "created_at": "2025-01-01 00:00:00",
+    }
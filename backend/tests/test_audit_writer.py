@@ -0,0 +1,29 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.pool import StaticPool
+
+from app.db import Base
+from app.models import AuditLog
+from app.services.audit import AuditWriter, audit_event
+
+
+def test_writer_batches_events_and_flushes_on_stop():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    writer = AuditWriter(engine, maxsize=100, batch_size=10, flush_interval=60, enqueue_timeout=0.01)
+    writer.start()
+
+    for i in range(25):
+        writer.emit(audit_event("verification.decision", "claim", f"c{i}", actor_id="v1", details={"outcome": "approved"}))
+    writer.stop()
+
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count(AuditLog.id))).scalar() == 25
+    assert writer.stats() == {"queued": 0, "written": 25, "dropped": 0, "failed": 0}
+
+
+def test_full_queue_drops_after_backpressure_timeout():
+    writer = AuditWriter(create_engine("sqlite://"), maxsize=1, batch_size=10, flush_interval=60, enqueue_timeout=0.01)
+    assert writer.try_emit(audit_event("http.request", "route", "/"))
+    assert not writer.try_emit(audit_event("http.request", "route", "/"))
+    writer.emit(audit_event("http.request", "route", "/"))
+    assert writer.dropped == 1
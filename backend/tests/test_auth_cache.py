@@ -0,0 +1,54 @@
+import base64
+import json
+
+import pytest
+from jose import JWTError
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import User, UserRole
+from app.security import create_access_token
+from app.services import auth_cache
+
+
+def test_cached_user_skips_query_and_is_invalidated_on_update():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cur, stmt, *args: statements.append(stmt))
+
+    db = Session()
+    db.add(User(id="u-cache", email="v@example.lk", password_hash="x", full_name="V", role=UserRole.verifier))
+    db.commit()
+    db.close()
+    auth_cache.invalidate_user("u-cache")
+
+    token = create_access_token("u-cache", "verifier")
+    assert auth_cache.decode_token(token)["sub"] == "u-cache"
+    assert auth_cache.decode_token(token)["sub"] == "u-cache"
+    # A cached signature must not vouch for a different payload
+    header, payload, signature = token.split(".")
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    forged = base64.urlsafe_b64encode(json.dumps({**claims, "role": "admin"}).encode()).rstrip(b"=").decode()
+    with pytest.raises(JWTError):
+        auth_cache.decode_token(f"{header}.{forged}.{signature}")
+
+    first = Session()
+    assert auth_cache.load_user(first, "u-cache").role == UserRole.verifier
+    first.close()
+
+    statements.clear()
+    second = Session()
+    user = auth_cache.load_user(second, "u-cache")
+    assert user.email == "v@example.lk"
+    assert statements == []
+
+    user.role = UserRole.admin
+    second.commit()
+    second.close()
+
+    third = Session()
+    assert auth_cache.load_user(third, "u-cache").role == UserRole.admin
+    third.close()
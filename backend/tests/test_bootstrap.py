@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.orm import Session
+
+from app.bootstrap import bootstrap, check_schema
+from app.migrations import MIGRATIONS, schema_migrations
+from app.models import Organization, User
+
+
+def test_startup_check_requires_bootstrap_which_is_idempotent():
+    engine = create_engine("sqlite://")
+    with pytest.raises(RuntimeError, match="not initialised"):
+        check_schema(engine)
+
+    assert bootstrap(engine, admin_email="root@verifylk.lk", admin_password="pw") == [v for v, _, _ in MIGRATIONS]
+    check_schema(engine)
+    assert bootstrap(engine, admin_email="root@verifylk.lk", admin_password="pw") == []
+    with Session(engine) as db:
+        assert db.scalar(select(func.count()).select_from(User)) == 1
+        assert db.scalar(select(func.count()).select_from(Organization)) == 3
+
+    with engine.begin() as conn:
+        conn.execute(delete(schema_migrations).where(schema_migrations.c.version == MIGRATIONS[-1][0]))
+    with pytest.raises(RuntimeError, match="pending migrations"):
+        check_schema(engine)
+
+
+def test_importing_the_app_does_not_touch_the_database(tmp_path):
+    db_file = tmp_path / "fresh.db"
+    subprocess.run(
+        [sys.executable, "-c", "import app.main"],
+        cwd=Path(__file__).resolve().parent.parent,
+        env={**os.environ, "DATABASE_URL": f"sqlite:///{db_file}"},
+        check=True,
+        capture_output=True,
+    )
+    assert not db_file.exists()
@@ -0,0 +1,97 @@
+from datetime import date
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import CandidateProfile, ClaimStatus, ExperienceClaim, User, UserRole, VerificationOutcome
+from app.repositories.verifications import create_verification, get_for_claim
+from app.schemas.models import BulkVerificationDecision, VerificationDecision
+from app.services.decisions import decide_bulk
+from app.services.profiles import install_listener, profiles, rebuild_profiles
+from app.services.rescoring import rescore_verified_claims
+from app.services.scoring import calculate_score
+
+
+def _claim(claim_id: str, candidate_id: str, org: str) -> ExperienceClaim:
+    return ExperienceClaim(
+        id=claim_id,
+        candidate_id=candidate_id,
+        title="Field Officer",
+        claim_type="internship",
+        organization_name=org,
+        supervisor_name="S",
+        supervisor_contact="s@org.lk",
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 7, 1),
+        description="Surveys",
+        status=ClaimStatus.pending,
+    )
+
+
+def _snapshot(db) -> list[tuple]:
+    # A profile with nothing verified reads the same as a missing one; only a rebuild leaves it out
+    rows = db.execute(select(profiles).where(profiles.c.verified_claims > 0).order_by(profiles.c.candidate_id)).all()
+    return [row[:-1] for row in rows]
+
+
+def test_profiles_follow_every_write_path_and_match_a_rebuild():
+    install_listener()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [
+            _claim("a", "u1", "Sarvodaya"),
+            _claim("b", "u1", "Sarvodaya"),
+            _claim("c", "u1", "Shilpa Sayura"),
+            _claim("d", "u2", "Sarvodaya"),
+            _claim("e", "u3", "Sarvodaya"),
+        ]
+    )
+    db.commit()
+
+    # Single decision path: status change commits, then the score is written in a second commit
+    claim = db.get(ExperienceClaim, "a")
+    create_verification(db, claim, "v1", VerificationDecision(outcome=VerificationOutcome.approved))
+    score, breakdown = calculate_score(claim, get_for_claim(db, "a"))
+    claim.credibility_score = score
+    claim.credibility_breakdown = [b.model_dump() for b in breakdown]
+    db.commit()
+    profile = db.get(CandidateProfile, "u1")
+    assert (profile.verified_claims, profile.score_total, profile.verified_months, profile.verifying_organizations) == (1, score, 6, 1)
+    assert profile.latest_verified_at is not None
+
+    decide_bulk(
+        db,
+        User(id="v1", role=UserRole.verifier),
+        [
+            BulkVerificationDecision(claim_id="b", outcome=VerificationOutcome.approved),
+            BulkVerificationDecision(claim_id="c", outcome=VerificationOutcome.approved),
+            BulkVerificationDecision(claim_id="d", outcome=VerificationOutcome.rejected),
+        ],
+    )
+    rescore_verified_claims(db, today=date(2027, 1, 1))
+    db.expire_all()
+    profile = db.get(CandidateProfile, "u1")
+    assert (profile.verified_claims, profile.verified_months, profile.verifying_organizations) == (3, 18, 2)
+
+    # Leaving the verified state removes the claim's contribution, including its approval time
+    db.get(ExperienceClaim, "c").status = ClaimStatus.disputed
+    db.commit()
+    assert db.get(CandidateProfile, "u1").verifying_organizations == 1
+    create_verification(db, db.get(ExperienceClaim, "e"), "v1", VerificationDecision(outcome=VerificationOutcome.approved))
+    db.commit()
+    assert db.get(CandidateProfile, "u3").latest_verified_at is not None
+    db.get(ExperienceClaim, "e").status = ClaimStatus.disputed
+    db.commit()
+    db.expire_all()
+    profile = db.get(CandidateProfile, "u3")
+    assert (profile.verified_claims, profile.latest_verified_at) == (0, None)
+
+    incremental = _snapshot(db)
+    with engine.begin() as conn:
+        assert rebuild_profiles(conn, chunk_size=1) == 2
+    db.expire_all()
+    assert _snapshot(db) == incremental
+    assert db.get(CandidateProfile, "u2") is None and db.get(CandidateProfile, "u3") is None
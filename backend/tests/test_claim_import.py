@@ -0,0 +1,77 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.claims import import_claim_file
+from app.db import Base
+from app.models import ClaimStatus, ExperienceClaim, User, UserRole
+from app.services.claim_import import import_claims, iter_csv_rows, iter_ndjson_rows
+
+HEADER = "candidate_email,title,claim_type,organization_name,supervisor_name,supervisor_contact,start_date,end_date,description,skill_tags\n"
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(id="cand-1", email="nimal@example.lk", password_hash="x", full_name="Nimal", role=UserRole.candidate))
+    db.commit()
+    return db
+
+
+def test_csv_import_inserts_valid_rows_and_reports_failures():
+    db = _session()
+    csv_data = HEADER + (
+        'nimal@example.lk,Intern,internship,Sarvodaya,Ruwan,ruwan@sarvodaya.lk,2024-01-01,2024-06-01,"Field work, surveys",survey;field\n'
+        "nimal@example.lk,Intern,internship,Sarvodaya,Ruwan,ruwan@sarvodaya.lk,not-a-date,2024-06-01,Bad date,\n"
+        "unknown@example.lk,Intern,internship,Sarvodaya,Ruwan,ruwan@sarvodaya.lk,2024-01-01,2024-06-01,Who,\n"
+    )
+    report = import_claims(db, iter_csv_rows(io.BytesIO(csv_data.encode())), chunk_size=1)
+
+    assert (report.imported, report.failed) == (1, 2)
+    assert [e.row for e in report.errors] == [3, 4]
+    claim = db.query(ExperienceClaim).one()
+    assert claim.candidate_id == "cand-1"
+    assert claim.status == ClaimStatus.draft
+    assert claim.skill_tags == ["survey", "field"]
+
+
+def test_ndjson_import_reports_malformed_lines():
+    db = _session()
+    lines = (
+        b'{"candidate_email": "nimal@EXAMPLE.lk", "title": "Tutor", "claim_type": "volunteering", "organization_name": "Room to Read",'
+        b' "supervisor_name": "S", "supervisor_contact": "s@rtr.lk", "start_date": "2024-01-01", "end_date": "2024-03-01", "description": "Tutoring"}\n'
+        b"{not json\n"
+        b'{"candidate_email": "not-an-address", "title": "Tutor"}\n'
+    )
+    report = import_claims(db, iter_ndjson_rows(io.BytesIO(lines)))
+    assert (report.imported, report.failed) == (1, 2)
+    assert [e.row for e in report.errors] == [2, 3]
+
+
+def test_unreadable_files_become_row_errors_and_verifiers_import_for_their_org():
+    db = _session()
+    # Rows longer than the decoder's 8 KiB reads: the bad bytes are decoded together with the end of
+    # the second row, after the first has been parsed
+    row = f"nimal@example.lk,Intern,internship,Someone Else,Ruwan,ruwan@x.lk,2024-01-01,2024-06-01,{'Field work ' * 1000},\n"
+    data = (HEADER + row + row).encode() + b"nimal@example.lk,\xff\xfe broken\n"
+    report = import_claims(db, iter_csv_rows(io.BytesIO(data)), chunk_size=1, organization_name="Sarvodaya")
+    assert (report.imported, report.failed) == (1, 1)
+    assert report.errors[0].row == 3 and "UnicodeDecodeError" in report.errors[0].error
+    assert db.query(ExperienceClaim).one().organization_name == "Sarvodaya"
+
+    oversized = HEADER + 'nimal@example.lk,"' + "x" * 200_000 + '"\n'
+    report = import_claims(db, iter_csv_rows(io.BytesIO(oversized.encode())))
+    assert report.failed == 1 and "field limit" in report.errors[0].error
+    report = import_claims(db, iter_ndjson_rows(io.BytesIO(b"\xff\n")))
+    assert report.failed == 1 and report.errors[0].row == 1
+
+    unaffiliated = User(id="v1", email="v@x.lk", password_hash="x", full_name="V", role=UserRole.verifier)
+    db.add(unaffiliated)
+    db.commit()
+    with pytest.raises(HTTPException) as exc:
+        import_claim_file(UploadFile(io.BytesIO(HEADER.encode()), filename="claims.csv"), current_user=unaffiliated, db=db)
+    assert exc.value.status_code == 403
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import exc, text
+
+from app.config import Settings
+from app.db import InstrumentedQueuePool, build_engine, pool_metrics, pool_stats
+
+
+def _settings(url: str, **overrides) -> Settings:
+    return Settings(database_url=url, **overrides)
+
+
+def test_file_sqlite_gets_pool_and_pragmas(tmp_path):
+    engine = build_engine(_settings(f"sqlite:///{tmp_path / 'pool.db'}", db_pool_size=2, db_max_overflow=1, sqlite_busy_timeout_ms=1234))
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        stats = pool_stats(engine)
+        assert (stats["size"], stats["max_overflow"], stats["checked_out"]) == (2, 1, 1)
+        assert stats["saturation"] == round(1 / 3, 4)
+    engine.dispose()
+
+    memory = build_engine(_settings("sqlite://"))
+    assert not isinstance(memory.pool, InstrumentedQueuePool)
+    with memory.connect() as conn:
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    assert "size" not in pool_stats(memory)
+
+
+def test_only_checkout_timeouts_count_as_timeouts(tmp_path):
+    engine = build_engine(
+        _settings(f"sqlite:///{tmp_path / 'busy.db'}", db_pool_size=1, db_max_overflow=0, db_pool_timeout_seconds=0.05)
+    )
+    before = pool_metrics.snapshot()
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    held.close()
+    assert pool_metrics.snapshot()["timeouts"] == before["timeouts"] + 1
+    assert pool_stats(engine)["checkout_timeouts"] == before["timeouts"] + 1
+    engine.dispose()
+
+    unreachable = build_engine(_settings(f"sqlite:///{tmp_path / 'missing' / 'x.db'}"))
+    with pytest.raises(exc.OperationalError):
+        unreachable.connect()
+    assert pool_metrics.snapshot()["timeouts"] == before["timeouts"] + 1
@@ -0,0 +1,87 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import (
+    ClaimStatus,
+    EvidenceVisibility,
+    ExperienceClaim,
+    Organization,
+    User,
+    UserRole,
+    VerificationOutcome,
+    VerificationRecord,
+)
+from app.schemas.models import BulkVerificationDecision
+from app.services.decisions import decide_bulk
+from app.services.scoring import calculate_score
+
+
+def test_bulk_decisions_score_like_single_decisions():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    org = Organization(id="o1", name="Jaffna Hindu College")
+    verifier = User(id="v1", email="v1@jhc.lk", password_hash="x", full_name="V", role=UserRole.verifier, org_id="o1")
+    db.add_all([org, verifier])
+    for claim_id, org_name, claim_status in (
+        ("c1", "Jaffna Hindu College", ClaimStatus.pending),
+        ("c2", "Jaffna Hindu College", ClaimStatus.pending),
+        ("c3", "Jaffna Hindu College", ClaimStatus.verified),
+        ("c4", "St. John's College", ClaimStatus.pending),
+    ):
+        db.add(
+            ExperienceClaim(
+                id=claim_id,
+                candidate_id="u1",
+                title="Teaching Assistant",
+                claim_type="part_time",
+                organization_name=org_name,
+                supervisor_name="S",
+                supervisor_contact="s@jhc.lk",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 9, 1),
+                description="Assisted classes",
+                status=claim_status,
+                evidence_visibility=EvidenceVisibility.public,
+            )
+        )
+    db.add(VerificationRecord(claim_id="c1", verifier_id="v0", outcome=VerificationOutcome.approved))
+    db.commit()
+
+    today = date(2025, 1, 1)
+    results = decide_bulk(
+        db,
+        verifier,
+        [
+            BulkVerificationDecision(claim_id="c1", outcome=VerificationOutcome.approved, valid_until=date(2024, 12, 1)),
+            BulkVerificationDecision(claim_id="c2", outcome=VerificationOutcome.rejected),
+            BulkVerificationDecision(claim_id="c1", outcome=VerificationOutcome.rejected),
+            BulkVerificationDecision(claim_id="missing", outcome=VerificationOutcome.approved),
+            BulkVerificationDecision(claim_id="c3", outcome=VerificationOutcome.rejected),
+            BulkVerificationDecision(claim_id="c4", outcome=VerificationOutcome.approved),
+        ],
+        today=today,
+    )
+
+    assert [(r.claim_id, r.ok, r.error) for r in results] == [
+        ("c1", True, None),
+        ("c2", True, None),
+        ("c1", False, "Duplicate claim in batch"),
+        ("missing", False, "Claim not found"),
+        ("c3", False, "Claim is not pending"),
+        ("c4", False, "Claim not found"),
+    ]
+    db.expire_all()
+    for claim_id in ("c1", "c2"):
+        claim = db.get(ExperienceClaim, claim_id)
+        score, breakdown = calculate_score(claim, claim.verifications, today=today)
+        assert float(claim.credibility_score) == score
+        assert claim.credibility_breakdown == [b.model_dump() for b in breakdown]
+    assert db.get(ExperienceClaim, "c1").status == ClaimStatus.verified
+    assert db.get(ExperienceClaim, "c2").status == ClaimStatus.rejected
+    assert db.get(ExperienceClaim, "c3").status == ClaimStatus.verified
+    assert db.get(ExperienceClaim, "c4").status == ClaimStatus.pending
+    assert {r.organization_id for r in db.get(ExperienceClaim, "c1").verifications} == {None, "o1"}
@@ -0,0 +1,116 @@
+from datetime import date
+
+from fastapi import Response
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.admin import list_duplicate_flags
+from app.api.v1.endpoints.claims import request_verification
+from app.db import Base
+from app.models import ClaimSignature, DuplicateFlag, User, UserRole
+from app.pagination import NEXT_CURSOR_HEADER
+from app.repositories.claims import bulk_create_claims, create_claim, update_claim
+from app.schemas.models import ExperienceClaimCreate, ExperienceClaimUpdate
+from app.services.duplicates import contact_key, index_corpus, minhash, shingles, similarity
+
+BOILERPLATE = (
+    "Supported the field office with beneficiary surveys, data entry and weekly reporting to the "
+    "district coordinator, and organised community awareness sessions across three villages."
+)
+
+
+def _payload(description: str, contact: str = "+94 77 123 4567", title: str = "Field Assistant") -> ExperienceClaimCreate:
+    return ExperienceClaimCreate(
+        title=title,
+        claim_type="internship",
+        organization_name="Sarvodaya",
+        supervisor_name="S",
+        supervisor_contact=contact,
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 6, 1),
+        description=description,
+    )
+
+
+def _signature(payload: ExperienceClaimCreate):
+    return minhash(shingles(payload.title, payload.description, payload.supervisor_contact))
+
+
+def test_signatures_estimate_similarity():
+    assert contact_key(" +94 77 123 4567") == contact_key("077-1234567") == "0771234567"
+    assert contact_key("Supervisor@Org.LK ") == "supervisor@org.lk"
+    assert contact_key("  ") is None
+
+    original = _signature(_payload(BOILERPLATE))
+    assert similarity(original, _signature(_payload(BOILERPLATE, contact="0771234567"))) == 1.0
+    assert similarity(original, _signature(_payload(BOILERPLATE.replace("three", "four")))) >= 0.6
+    unrelated = _payload("Taught grade 10 mathematics and ran the school chess club.", "teacher@school.lk", "Tutor")
+    assert similarity(original, _signature(unrelated)) < 0.3
+    assert minhash(shingles("", "", "")) is None
+
+
+def _flags(db) -> set[tuple]:
+    rows = db.execute(
+        select(DuplicateFlag.claim_id, DuplicateFlag.duplicate_of_claim_id, DuplicateFlag.shared_contact)
+    ).all()
+    return set(rows)
+
+
+def test_claims_are_flagged_on_create_and_submit_and_batch_mode_agrees():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    original = create_claim(db, "u1", _payload(BOILERPLATE))
+    own_copy = create_claim(db, "u1", _payload(BOILERPLATE))
+    unrelated = create_claim(db, "u2", _payload("Taught grade 10 mathematics.", "teacher@school.lk", "Tutor"))
+    copy_id, other_copy_id = bulk_create_claims(db, [("u3", _payload(BOILERPLATE)), ("u4", _payload(BOILERPLATE, "077-1234567"))])
+    db.commit()
+    # Same-candidate pairs are not flagged; a pair inside one bulk import is flagged once
+    assert _flags(db) == {
+        (copy_id, original.id, True),
+        (copy_id, own_copy.id, True),
+        (other_copy_id, original.id, True),
+        (other_copy_id, own_copy.id, True),
+        (other_copy_id, copy_id, True),
+    }
+
+    # A draft edited into a copy is caught when it is submitted
+    edit = ExperienceClaimUpdate(title="Field Assistant", description=BOILERPLATE, supervisor_contact="0771234567")
+    update_claim(db, unrelated, edit)
+    candidate = User(id="u2", email="c@x.lk", password_hash="x", full_name="C", role=UserRole.candidate)
+    request_verification(unrelated.id, current_user=candidate, db=db)
+    incremental = _flags(db)
+    assert {pair[:2] for pair in incremental if pair[0] == unrelated.id} == {
+        (unrelated.id, claim_id) for claim_id in (original.id, own_copy.id, copy_id, other_copy_id)
+    }
+
+    # Submitting an unedited draft neither re-indexes it nor adds flags
+    signature_id = db.scalar(select(ClaimSignature.id).where(ClaimSignature.claim_id == original.id))
+    owner = User(id="u1", email="o@x.lk", password_hash="x", full_name="O", role=UserRole.candidate)
+    request_verification(original.id, current_user=owner, db=db)
+    assert db.scalar(select(ClaimSignature.id).where(ClaimSignature.claim_id == original.id)) == signature_id
+    assert _flags(db) == incremental
+
+    with engine.begin() as conn:
+        report = index_corpus(conn, chunk_size=2)
+    assert (report.scanned, report.indexed) == (5, 5)
+    batch = _flags(db)
+    assert report.flagged == len(batch) == 9
+    # Batch mode flags the later claim of each pair; claims created in one request may tie on created_at
+    assert {frozenset(pair[:2]) for pair in batch} == {frozenset(pair[:2]) for pair in incremental}
+
+    admin = User(id="a1", email="a@x.lk", password_hash="x", full_name="A", role=UserRole.admin)
+    seen, cursor = [], None
+    while True:
+        response = Response()
+        page = list_duplicate_flags(
+            response, claim_id=original.id, candidate_id=None, min_similarity=0.9, limit=2, cursor=cursor,
+            current_user=admin, db=db,
+        )
+        seen += [(flag.claim_id, flag.duplicate_of_claim_id) for flag in page]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 3
+    assert all(original.id in pair for pair in seen)
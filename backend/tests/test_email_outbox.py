@@ -0,0 +1,129 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints.claims import request_verification
+from app.db import Base
+from app.models import ClaimStatus, EmailOutbox, EmailStatus, ExperienceClaim, User, UserRole
+from app.services.email import EmailDispatcher, SMTPTransport, enqueue_email
+from tests.smtp_sink import SMTPSink
+
+
+def _setup(sink: SMTPSink, batch_size: int = 10, max_attempts: int = 3):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    dispatcher = EmailDispatcher(
+        engine,
+        lambda: SMTPTransport("127.0.0.1", sink.port, None, None, starttls=False, timeout=5),
+        sender="no-reply@verifylk.test",
+        batch_size=batch_size,
+        poll_interval=60,
+        max_attempts=max_attempts,
+        backoff_base=30,
+        backoff_max=3600,
+        lease_seconds=300,
+    )
+    return engine, dispatcher
+
+
+def test_dispatcher_delivers_batches_over_one_connection():
+    with SMTPSink() as sink:
+        engine, dispatcher = _setup(sink, batch_size=10)
+        with Session(engine) as db:
+            for i in range(25):
+                enqueue_email(db, f"supervisor{i}@example.com", "Verify", f"body {i}")
+            db.commit()
+
+        assert [dispatcher.dispatch_once() for _ in range(4)] == [10, 10, 5, 0]
+        dispatcher._close_transport()
+
+    assert len(sink.messages) == 25
+    assert sink.connections == 1
+    with Session(engine) as db:
+        rows = db.scalars(select(EmailOutbox)).all()
+    assert {r.status for r in rows} == {EmailStatus.sent}
+    assert all(r.sent_at and r.lease_id is None for r in rows)
+
+
+def test_claims_are_disjoint_and_expired_leases_return():
+    with SMTPSink() as sink:
+        engine, dispatcher = _setup(sink, batch_size=3)
+        with Session(engine) as db:
+            for i in range(5):
+                enqueue_email(db, f"s{i}@example.com", "Verify", "body")
+            db.commit()
+
+        now = datetime.utcnow()
+        first, second = dispatcher.claim_batch(now), dispatcher.claim_batch(now)
+        assert len(first) == 3 and len(second) == 2
+        assert not {r.id for r in first} & {r.id for r in second}
+        assert dispatcher.claim_batch(now) == []
+        # A dispatcher that died mid-batch leaves rows in `sending`; they are reclaimed after the lease.
+        reclaimed = dispatcher.claim_batch(now + timedelta(seconds=301))
+        assert len(reclaimed) == 3
+        # The first holder settling late leaves the reclaimed rows to their new lease
+        dispatcher._settle(first[0].lease_id, [{"id": r.id, "status": EmailStatus.sent} for r in first])
+        with Session(engine) as db:
+            rows = db.scalars(select(EmailOutbox).where(EmailOutbox.id.in_([r.id for r in reclaimed]))).all()
+        assert {(r.status, r.lease_id) for r in rows} == {(EmailStatus.sending, reclaimed[0].lease_id)}
+
+
+def test_failures_back_off_then_fail_permanently():
+    rejects = {"busy@example.com": "451 mailbox busy", "gone@example.com": "550 no such user"}
+    with SMTPSink(reject=rejects) as sink:
+        engine, dispatcher = _setup(sink, max_attempts=2)
+        with Session(engine) as db:
+            for address in ("busy@example.com", "gone@example.com", "ok@example.com"):
+                enqueue_email(db, address, "Verify", "body")
+            db.commit()
+
+        now = datetime.utcnow()
+        assert dispatcher.dispatch_once(now) == 1
+        with Session(engine) as db:
+            rows = {r.to_email: r for r in db.scalars(select(EmailOutbox))}
+        assert rows["gone@example.com"].status == EmailStatus.failed
+        busy = rows["busy@example.com"]
+        assert busy.status == EmailStatus.pending and busy.attempts == 1
+        assert busy.next_attempt_at == now + timedelta(seconds=30)
+
+        assert dispatcher.dispatch_once(now) == 0
+        assert dispatcher.dispatch_once(now + timedelta(seconds=31)) == 0
+        dispatcher._close_transport()
+        with Session(engine) as db:
+            busy = db.scalars(select(EmailOutbox).where(EmailOutbox.to_email == "busy@example.com")).one()
+        assert busy.status == EmailStatus.failed and busy.attempts == 2
+        assert "451" in busy.last_error
+
+
+def test_supervisor_is_emailed_once_per_verification_request():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    candidate = User(id="u1", email="c@x.lk", password_hash="x", full_name="Nimal", role=UserRole.candidate)
+    with Session(engine) as db:
+        for claim_id, claim_status in (
+            ("draft", ClaimStatus.draft),
+            ("done", ClaimStatus.verified),
+            ("rejected", ClaimStatus.rejected),
+        ):
+            db.add(
+                ExperienceClaim(
+                    id=claim_id, candidate_id="u1", title="Intern", claim_type="internship", organization_name="Org",
+                    supervisor_name="S", supervisor_contact="s@org.lk", start_date=date(2024, 1, 1),
+                    end_date=date(2024, 6, 1), description="Work", status=claim_status,
+                )
+            )
+        db.commit()
+
+        assert request_verification("draft", current_user=candidate, db=db).status == ClaimStatus.pending
+        assert request_verification("draft", current_user=candidate, db=db).status == ClaimStatus.pending
+        with pytest.raises(HTTPException) as exc:
+            request_verification("done", current_user=candidate, db=db)
+        assert exc.value.status_code == 409
+        assert [row.to_email for row in db.scalars(select(EmailOutbox))] == ["s@org.lk"]
+        # A rejected claim can be submitted again, which asks the supervisor again
+        assert request_verification("rejected", current_user=candidate, db=db).status == ClaimStatus.pending
+        assert len(db.scalars(select(EmailOutbox)).all()) == 2
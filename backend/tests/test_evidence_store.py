@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base, async_database_url
+from app.models import EvidenceBlob, EvidenceFile, EvidenceUpload
+from app.repositories.evidence import delete_evidence
+from app.services.evidence_store import attach_existing, collect_garbage, settle_upload, storage_stats, store_upload
+from app.services.evidence_upload import receive_chunks, staging_key
+from app.services.storage import LocalStorage
+
+LETTER = b"%PDF-1.4\n" + b"offer letter " * 500
+DIGEST = hashlib.sha256(LETTER).hexdigest()
+
+
+async def _chunks(data: bytes):
+    yield data
+
+
+def test_duplicates_share_one_blob_and_gc_collects_unreferenced(tmp_path):
+    url = f"sqlite:///{tmp_path / 'evidence.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    storage = LocalStorage(tmp_path / "store")
+
+    def upload(upload_id: str, sha256: str | None = None, owner_id: str = "cand") -> EvidenceUpload:
+        return EvidenceUpload(
+            id=upload_id, claim_id=f"claim-{upload_id}", owner_id=owner_id, file_name="offer.pdf",
+            mime_type="application/pdf", size_bytes=len(LETTER), sha256=sha256,
+        )
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as db:
+            # A rolled-back upload leaves its bytes staged and writes no blob file.
+            up = upload("u0")
+            db.add(up)
+            _, digest = await receive_chunks(up, 0, _chunks(LETTER), backend=storage)
+            db.add(await store_upload(db, up, digest))
+            await db.rollback()
+            assert storage.size(staging_key("u0")) == len(LETTER)
+            assert not (tmp_path / "store" / "blobs").exists()
+            # Two full uploads of the same bytes: the second is deduplicated after transfer.
+            for upload_id in ("u1", "u2"):
+                up = upload(upload_id)
+                db.add(up)
+                _, digest = await receive_chunks(up, 0, _chunks(LETTER), backend=storage)
+                evidence = await store_upload(db, up, digest)
+                db.add(evidence)
+                await db.flush()
+                up.evidence_id = evidence.id
+                assert storage.size(staging_key(upload_id)) == len(LETTER)
+                await db.commit()
+                # u1's bytes become the blob; u2's duplicate bytes are dropped
+                settle_upload(up, evidence, storage)
+                assert storage.size(staging_key(upload_id)) == 0
+            # The owner announces the hash again and transfers nothing.
+            up = upload("u3", sha256=DIGEST)
+            db.add(up)
+            evidence = await attach_existing(db, up)
+            db.add(evidence)
+            await db.flush()
+            up.evidence_id = evidence.id
+            await db.commit()
+            assert await attach_existing(db, upload("u4", sha256="0" * 64)) is None
+            # Knowing the hash of someone else's document is not enough.
+            assert await attach_existing(db, upload("u5", sha256=DIGEST, owner_id="stranger")) is None
+        await async_engine.dispose()
+
+    asyncio.run(scenario())
+
+    db = sessionmaker(bind=engine)()
+    blob = db.scalars(select(EvidenceBlob)).one()
+    key = blob.storage_key
+    assert blob.ref_count == 3
+    assert {f.storage_path for f in db.scalars(select(EvidenceFile))} == {blob.storage_key}
+    assert b"".join(storage.read(blob.storage_key)) == LETTER
+    assert storage.size(staging_key("u2")) == 0
+    stats = storage_stats(db)
+    assert stats["stored_bytes"] == len(LETTER) and stats["bytes_saved"] == 2 * len(LETTER)
+
+    for evidence in db.scalars(select(EvidenceFile)).all():
+        delete_evidence(db, evidence)
+    db.add(EvidenceUpload(claim_id="c", owner_id="cand", file_name="x.pdf", mime_type="application/pdf", size_bytes=10,
+                          created_at=datetime.utcnow() - timedelta(days=3)))
+    db.commit()
+    db.refresh(blob)
+    assert blob.ref_count == 0
+    assert db.scalars(select(EvidenceUpload.evidence_id).where(EvidenceUpload.id == "u3")).one() is None
+
+    report = collect_garbage(db, grace=timedelta(hours=1), upload_ttl=timedelta(hours=48), backend=storage)
+    assert (report.blobs_deleted, report.uploads_expired) == (0, 1)
+    report = collect_garbage(db, grace=timedelta(hours=1), upload_ttl=timedelta(hours=48), backend=storage,
+                             now=datetime.utcnow() + timedelta(hours=2))
+    assert (report.blobs_deleted, report.bytes_freed) == (1, len(LETTER))
+    assert storage.size(key) == 0
@@ -0,0 +1,68 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from app.models import EvidenceUpload
+from app.services import evidence_upload
+from app.services.evidence_upload import UploadError, receive_chunks, staging_key
+from app.services.storage import LocalStorage, StorageBackend
+
+PDF = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+async def _stream(data: bytes, chunk: int = 1000, fail_after: int | None = None):
+    for i in range(0, len(data), chunk):
+        if fail_after is not None and i >= fail_after:
+            raise ConnectionResetError("link dropped")
+        yield data[i : i + chunk]
+
+
+def _upload(upload_id: str = "u1", mime_type: str = "application/pdf", size: int = len(PDF)) -> EvidenceUpload:
+    return EvidenceUpload(id=upload_id, claim_id="c1", owner_id="cand", file_name="letter.pdf", mime_type=mime_type, size_bytes=size)
+
+
+def test_resumed_upload_hashes_incrementally(tmp_path):
+    storage = LocalStorage(tmp_path)
+    upload = _upload()
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(receive_chunks(upload, 0, _stream(PDF, fail_after=4000), backend=storage))
+    assert storage.size(staging_key("u1")) == 4000
+
+    with pytest.raises(UploadError) as stale:
+        asyncio.run(receive_chunks(upload, 0, _stream(PDF), backend=storage))
+    assert stale.value.status_code == 409 and stale.value.offset == 4000
+
+    offset, digest = asyncio.run(receive_chunks(upload, 4000, _stream(PDF[4000:]), backend=storage))
+    assert offset == len(PDF)
+    assert digest == hashlib.sha256(PDF).hexdigest()
+    assert b"".join(storage.read(staging_key("u1"))) == PDF
+
+
+def test_hash_state_of_abandoned_uploads_is_bounded(tmp_path, monkeypatch):
+    storage = LocalStorage(tmp_path)
+    monkeypatch.setattr(evidence_upload, "_hashers", evidence_upload.TTLCache(2, 3600))
+    for upload_id in ("a", "b", "c"):
+        with pytest.raises(ConnectionResetError):
+            asyncio.run(receive_chunks(_upload(upload_id), 0, _stream(PDF, fail_after=2000), backend=storage))
+    assert evidence_upload._hashers.stats()["size"] == 2
+    # The evicted upload rebuilds its hash state from the staged bytes
+    offset, digest = asyncio.run(receive_chunks(_upload("a"), 2000, _stream(PDF[2000:]), backend=storage))
+    assert digest == hashlib.sha256(PDF).hexdigest()
+    with pytest.raises(TypeError):
+        StorageBackend()
+
+
+def test_size_and_content_type_are_enforced_while_streaming(tmp_path):
+    storage = LocalStorage(tmp_path)
+
+    with pytest.raises(UploadError) as too_big:
+        asyncio.run(receive_chunks(_upload(size=2500), 0, _stream(PDF), backend=storage))
+    assert too_big.value.status_code == 413
+    assert storage.size(staging_key("u1")) == 2000
+
+    with pytest.raises(UploadError) as wrong_type:
+        asyncio.run(receive_chunks(_upload("u2", mime_type="image/png"), 0, _stream(PDF), backend=storage))
+    assert wrong_type.value.status_code == 415
+    assert storage.size(staging_key("u2")) == 0
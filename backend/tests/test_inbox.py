@@ -0,0 +1,47 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import ClaimStatus, ExperienceClaim, Organization, User, UserRole
+from app.pagination import decode_cursor, encode_cursor
+from app.repositories.verifications import inbox_for_verifier
+
+
+def test_inbox_pages_by_keyset_and_scopes_to_verifier_org():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    org = Organization(id="o1", name="GreenHands")
+    verifier = User(id="v1", email="v@greenhands.lk", password_hash="x", full_name="V", role=UserRole.verifier, org_id="o1")
+    db.add_all([org, verifier])
+    epoch = datetime(2025, 1, 1)
+    for i in range(7):
+        db.add(
+            ExperienceClaim(
+                id=f"c{i}",
+                candidate_id="u1",
+                title="Tree planting",
+                claim_type="volunteering",
+                organization_name="GreenHands" if i % 2 == 0 else "Other Org",
+                supervisor_name="S",
+                supervisor_contact="s@example.lk",
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 3, 1),
+                description="Planted trees",
+                status=ClaimStatus.pending,
+                created_at=epoch + timedelta(minutes=i),
+            )
+        )
+    db.commit()
+
+    seen = []
+    after = None
+    while True:
+        page = inbox_for_verifier(db, verifier, limit=2, after=after)
+        if not page:
+            break
+        seen.extend(claim.id for claim in page)
+        after = decode_cursor(encode_cursor(page[-1].created_at, page[-1].id))
+    assert seen == ["c0", "c2", "c4", "c6"]
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, exc, text
+
+from app.api.metrics import metrics
+from app.db import _install_query_metrics
+from app.metrics import db_statements, http_requests, registry, request_db_statements
+from app.middleware.metrics import MetricsMiddleware
+
+
+async def _get(app, path: str) -> int:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "query_string": b"",
+             "headers": [], "scheme": "http", "server": ("test", 80), "client": ("127.0.0.1", 1), "root_path": "",
+             "http_version": "1.1", "asgi": {"version": "3.0"}}
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+
+def test_requests_are_labelled_by_route_template_with_sql_counts():
+    engine = create_engine("sqlite://")
+    _install_query_metrics(engine)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/things/{thing_id}")
+    def read_thing(thing_id: str):
+        # Sync endpoint: runs in the threadpool, in a copy of the request context
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"id": thing_id}
+
+    before = http_requests.count("/things/{thing_id}", "GET", 200)
+    assert asyncio.run(_get(app, "/things/a")) == 200
+    assert asyncio.run(_get(app, "/things/b")) == 200
+    assert asyncio.run(_get(app, "/nope")) == 404
+
+    assert http_requests.count("/things/{thing_id}", "GET", 200) == before + 2
+    assert http_requests.count("<unmatched>", "GET", 404) >= 1
+    series = request_db_statements._series[("/things/{thing_id}", "GET")]
+    # Both requests ran exactly two statements: they land in the le="2" bucket
+    assert series[request_db_statements.buckets.index(2)] >= 2
+
+    body = registry.render()
+    assert '# TYPE verifylk_http_request_duration_seconds histogram' in body
+    assert 'verifylk_http_request_duration_seconds_bucket{route="/things/{thing_id}",method="GET",status="200",le="+Inf"}' in body
+
+
+def test_failed_statements_are_not_timed_and_component_counters_are_totals():
+    engine = create_engine("sqlite://")
+    _install_query_metrics(engine)
+    before = db_statements.value()
+    with engine.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            conn.execute(text("SELECT * FROM missing"))
+        conn.execute(text("SELECT 1"))
+    assert db_statements.value() == before + 1
+
+    body = metrics().body.decode()
+    assert "# TYPE verifylk_auth_cache_total counter" in body
+    assert 'verifylk_auth_cache_total{cache="tokens",field="hits"}' in body
+    assert 'verifylk_auth_cache{cache="tokens",field="size"}' in body
+    assert "# TYPE verifylk_audit_writer gauge" in body and 'verifylk_audit_writer{field="queued"}' in body
+    assert "# TYPE verifylk_email_dispatcher_total counter" in body and "# TYPE verifylk_email_dispatcher gauge" not in body
@@ -0,0 +1,26 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.security import HashingPoolFull, PasswordHashingPool
+
+
+def test_pool_rejects_when_queue_is_full_and_records_latency():
+    pool = PasswordHashingPool(workers=1, queue_limit=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(pool.run(release.wait))
+        second = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HashingPoolFull):
+            await pool.run(release.wait)
+        release.set()
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(scenario()) == [True, True]
+    stats = pool.stats()
+    assert stats["calls"] == 2
+    assert stats["rejected"] == 1
+    assert stats["in_flight"] == 0
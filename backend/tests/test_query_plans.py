@@ -0,0 +1,102 @@
+import os
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import ClaimStatus, EvidenceFile, ExperienceClaim, Organization, User, UserRole
+from app.repositories.audit import iter_audit_rows, recent_audit_logs
+from app.repositories.claims import claim_text, get_claim, get_claims_for_candidate
+from app.repositories.duplicates import recent_duplicate_flags
+from app.repositories.search import claims_with_skill
+from app.repositories.verifications import get_for_claim, inbox_for_verifier
+from app.schemas.models import ExperienceClaimOut
+from app.services.duplicates import flag_near_duplicates
+from app.services.rescoring import rescore_verified_claims
+
+from .query_plans import captured_selects, table_scans
+
+DATABASE_URLS = ["sqlite://"]
+if os.environ.get("VERIFYLK_TEST_POSTGRES_URL"):
+    DATABASE_URLS.append(os.environ["VERIFYLK_TEST_POSTGRES_URL"])
+
+
+@pytest.mark.parametrize("url", DATABASE_URLS)
+def test_hot_repository_queries_use_indexes(url):
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    org = Organization(id="o1", name="TechWorks Jaffna")
+    verifier = User(id="v1", email="v@techworks.lk", password_hash="x", full_name="V", role=UserRole.verifier, org_id="o1")
+    unaffiliated = User(id="v2", email="v2@example.lk", password_hash="x", full_name="V2", role=UserRole.verifier)
+    claim = ExperienceClaim(
+        id="c1",
+        candidate_id="u1",
+        title="Intern",
+        claim_type="internship",
+        organization_name="TechWorks Jaffna",
+        supervisor_name="S",
+        supervisor_contact="s@techworks.lk",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 1),
+        description="Built things",
+        status=ClaimStatus.pending,
+    )
+    db.add_all([org, verifier, unaffiliated, claim])
+    db.commit()
+
+    with captured_selects(engine) as statements:
+        get_claims_for_candidate(db, "u1")
+        get_claim(db, "c1")
+        get_for_claim(db, "c1")
+        inbox_for_verifier(db, verifier, after=(datetime(2024, 1, 1), "c0"))
+        inbox_for_verifier(db, unaffiliated, claim_type="internship")
+        recent_audit_logs(db)
+        recent_audit_logs(db, before=(datetime(2025, 1, 1), 10), actor_id="v1")
+        recent_audit_logs(db, entity_type="claim", entity_id="c1", since=datetime(2024, 1, 1))
+        list(iter_audit_rows(db, actor_id="v1"))
+        rescore_verified_claims(db)
+        claims_with_skill(db, "coordination", after="c0")
+        flag_near_duplicates(db.connection(), [claim_text(claim)])
+        recent_duplicate_flags(db, claim_id="c1")
+        recent_duplicate_flags(db, before=(datetime(2025, 1, 1), 10), candidate_id="u1")
+
+    assert statements
+    assert table_scans(engine, statements) == {}
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_claim_lists_load_evidence_in_constant_queries():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    def statements_for(count: int) -> int:
+        for i in range(count):
+            claim_id = f"n{count}-{i}"
+            db.add(
+                ExperienceClaim(
+                    id=claim_id,
+                    candidate_id=f"cand-{count}",
+                    title="Tutor",
+                    claim_type="volunteering",
+                    organization_name="Room to Read",
+                    supervisor_name="S",
+                    supervisor_contact="s@example.lk",
+                    start_date=date(2024, 1, 1),
+                    end_date=date(2024, 2, 1),
+                    description="Tutored",
+                )
+            )
+            db.add(EvidenceFile(claim_id=claim_id, file_name="cert.pdf", mime_type="application/pdf", storage_path="x"))
+        db.commit()
+        db.expire_all()
+        with captured_selects(engine) as statements:
+            [ExperienceClaimOut.model_validate(c) for c in get_claims_for_candidate(db, f"cand-{count}")]
+        return len(statements)
+
+    assert statements_for(3) == statements_for(30) == 2
@@ -0,0 +1,78 @@
+import asyncio
+
+from fastapi import FastAPI
+
+from app.middleware.ratelimit import RateLimitMiddleware
+from app.security import create_access_token
+from app.services.ratelimit import MemoryBuckets, RatePolicy, RateRule
+
+
+def test_buckets_refill_and_least_recently_used_keys_are_evicted():
+    buckets = MemoryBuckets(shards=1, max_keys=2)
+    policy = RatePolicy("auth", per_minute=6, burst=3)
+    assert [buckets.take_now("auth:1.2.3.4", policy, 100.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert buckets.take_now("auth:1.2.3.4", policy, 100.0) == 10.0
+    assert buckets.take_now("auth:5.6.7.8", policy, 100.0) == 0.0
+    assert round(buckets.take_now("auth:1.2.3.4", policy, 101.0), 6) == 9.0
+    # At capacity the least recently used key goes, even though it has not refilled yet
+    assert buckets.take_now("auth:9.9.9.9", policy, 102.0) == 0.0
+    assert (buckets.size(), buckets.evicted) == (2, 1)
+    assert round(buckets.take_now("auth:1.2.3.4", policy, 102.0), 6) == 8.0
+    # Once refilled a bucket is indistinguishable from a new one, so it is dropped from the LRU end
+    buckets.take_now("auth:0.0.0.0", policy, 200.0)
+    assert (buckets.size(), buckets.evicted) == (1, 3)
+
+
+async def _call(app, method: str, path: str, ip: str, token: str | None = None) -> tuple[int, dict]:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    scope = {"type": "http", "method": method, "path": path, "raw_path": path.encode(), "query_string": b"",
+             "headers": headers, "scheme": "http", "server": ("test", 80), "client": (ip, 1), "root_path": "",
+             "http_version": "1.1", "asgi": {"version": "3.0"}}
+    await app(scope, receive, send)
+    return sent[0]["status"], dict(sent[0]["headers"])
+
+
+def test_middleware_limits_per_ip_and_per_user():
+    app = FastAPI()
+    auth = RatePolicy("auth", per_minute=6, burst=2)
+    user = RatePolicy("user", per_minute=60, burst=1, per="user")
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[RateRule("POST", "/api/v1/auth/login", auth), RateRule(None, "/api/", user, prefix=True)],
+        backend=MemoryBuckets(),
+    )
+
+    @app.post("/api/v1/auth/login")
+    def login():
+        return {}
+
+    @app.get("/api/v1/claims")
+    def claims():
+        return []
+
+    async def scenario():
+        statuses = [(await _call(app, "POST", "/api/v1/auth/login", "10.0.0.1"))[0] for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        status, headers = await _call(app, "POST", "/api/v1/auth/login", "10.0.0.1")
+        assert status == 429 and headers[b"retry-after"] == b"10"
+        assert (await _call(app, "POST", "/api/v1/auth/login", "10.0.0.2"))[0] == 200
+
+        token = create_access_token("u-limited", "candidate")
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.3", token))[0] == 200
+        # Same user from another address shares the bucket
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.4", token))[0] == 429
+        # Anonymous requests and garbage tokens share a per-IP bucket instead of bypassing the limit
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.4"))[0] == 200
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.4"))[0] == 429
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.4", "not-a-jwt"))[0] == 429
+        assert (await _call(app, "GET", "/api/v1/claims", "10.0.0.5", "not-a-jwt"))[0] == 200
+
+    asyncio.run(scenario())
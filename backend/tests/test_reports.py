@@ -0,0 +1,58 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.models import ClaimStatus, EvidenceFile, ExperienceClaim
+from app.security import create_access_token, create_report_token, decode_report_token
+from app.services.reports import etag_matches, render_report, report_cache
+
+
+def test_report_tokens_are_typed():
+    token, _ = create_report_token("c1")
+    assert decode_report_token(token) == "c1"
+    assert decode_report_token(create_access_token("c1", "candidate")) is None
+    assert decode_report_token("c1") is None
+
+
+def test_rendered_report_is_cached_until_claim_changes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    claim = ExperienceClaim(
+        id="report-1",
+        candidate_id="u1",
+        title="Librarian Assistant",
+        claim_type="part_time",
+        organization_name="Kandy Public Library",
+        supervisor_name="S",
+        supervisor_contact="s@library.lk",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 1),
+        description="Catalogued books",
+        status=ClaimStatus.verified,
+    )
+    db.add(claim)
+    db.commit()
+
+    etag, body = render_report(db, "report-1")
+    assert etag_matches(etag, etag)
+    assert render_report(db, "report-1") == (etag, body)
+
+    claim.title = "Senior Librarian Assistant"
+    db.commit()
+    new_etag, new_body = render_report(db, "report-1")
+    assert new_etag != etag
+    assert b"Senior Librarian Assistant" in new_body
+
+    # Evidence bumps the claim version, so a cache entry another worker kept is not served
+    stale = report_cache.get("report-1")
+    db.add(EvidenceFile(claim_id="report-1", file_name="letter.pdf", mime_type="application/pdf", storage_path="k", is_public=True))
+    db.commit()
+    report_cache.set("report-1", stale)
+    assert b"letter.pdf" in render_report(db, "report-1")[1]
+
+    claim.status = ClaimStatus.disputed
+    db.commit()
+    assert render_report(db, "report-1") is None
@@ -0,0 +1,79 @@
+from datetime import date
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.admin import trigger_rescore
+from app.db import Base
+from app.models import ClaimStatus, EvidenceVisibility, ExperienceClaim, User, UserRole, VerificationOutcome, VerificationRecord
+from app.services.rescoring import rescore_lock, rescore_verified_claims
+from app.services.scoring import calculate_score
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _claim(claim_id: str, status: ClaimStatus, end_date: date) -> ExperienceClaim:
+    return ExperienceClaim(
+        id=claim_id,
+        candidate_id="u1",
+        title="Volunteer Coordinator",
+        claim_type="volunteering",
+        organization_name="Community Bridge",
+        supervisor_name="Jane",
+        supervisor_contact="jane@org.lk",
+        start_date=date(2023, 1, 1),
+        end_date=end_date,
+        description="Coordinated volunteers",
+        skill_tags=["coordination"],
+        status=status,
+        evidence_visibility=EvidenceVisibility.public,
+    )
+
+
+def test_rescore_matches_calculate_score_and_skips_unchanged_rows():
+    db = _session()
+    db.add(User(id="u1", email="c@example.lk", password_hash="x", full_name="C", role=UserRole.candidate))
+    db.add_all([
+        _claim("c1", ClaimStatus.verified, date(2024, 6, 1)),
+        _claim("c2", ClaimStatus.verified, date(2021, 6, 1)),
+        _claim("c3", ClaimStatus.draft, date(2024, 6, 1)),
+    ])
+    db.add(VerificationRecord(claim_id="c1", verifier_id="v1", outcome=VerificationOutcome.approved, valid_until=date(2025, 1, 1)))
+    db.commit()
+
+    today = date(2025, 3, 1)
+    report = rescore_verified_claims(db, chunk_size=1, today=today)
+    assert report.scanned == 2
+    assert report.updated == 2
+
+    for claim_id in ("c1", "c2"):
+        claim = db.get(ExperienceClaim, claim_id)
+        db.refresh(claim)
+        score, breakdown = calculate_score(claim, claim.verifications, today=today)
+        assert float(claim.credibility_score) == score
+        assert claim.credibility_breakdown == [b.model_dump() for b in breakdown]
+    assert db.get(ExperienceClaim, "c3").credibility_score is None
+
+    again = rescore_verified_claims(db, today=today)
+    assert again.scanned == 2
+    assert again.updated == 0
+
+
+def test_rescore_trigger_is_rejected_while_a_run_is_in_progress():
+    admin = User(id="a1", role=UserRole.admin)
+    tasks = BackgroundTasks()
+    assert trigger_rescore(tasks, chunk_size=500, current_user=admin) == {"status": "accepted"}
+    try:
+        with pytest.raises(HTTPException) as exc:
+            trigger_rescore(BackgroundTasks(), chunk_size=500, current_user=admin)
+        assert exc.value.status_code == 409
+    finally:
+        # The queued task (not run here) would release the lock when done
+        rescore_lock.release()
+    assert len(tasks.tasks) == 1
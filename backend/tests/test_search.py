@@ -0,0 +1,147 @@
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.search import search_claims as search_endpoint
+from app.db import Base, async_database_url
+from app.models import ClaimStatus, ExperienceClaim, User, UserRole
+from app.pagination import NEXT_CURSOR_HEADER
+from app.repositories.search import rebuild_search_index, search_claims
+from app.schemas.models import ClaimSearchResultOut
+
+
+def _row(claim_id: str, title: str, description: str, status=ClaimStatus.verified, score=80, tags=None) -> dict:
+    return {
+        "id": claim_id,
+        "candidate_id": "u1",
+        "title": title,
+        "claim_type": "internship",
+        "organization_name": "Sarvodaya",
+        "supervisor_name": "S",
+        "supervisor_contact": "s@org.lk",
+        "start_date": date(2023, 1, 1),
+        "end_date": date(2023, 6, 1),
+        "description": description,
+        "skill_tags": tags or [],
+        "status": status,
+        "credibility_score": score,
+    }
+
+
+def _search_once(url: str, q: str, limit: int):
+    db = sessionmaker(bind=create_engine(url))()
+    try:
+        return search_claims(db, q, limit=limit, options=())
+    finally:
+        db.close()
+
+
+def _ids(rows) -> list[str]:
+    return [claim.id for claim, _ in rows]
+
+
+def test_index_follows_writes_and_ranks_title_matches_first(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    # executemany path, no ORM events
+    db.execute(
+        insert(ExperienceClaim),
+        [
+            _row("a", "Community volunteer", "Ran python workshops in Jaffna"),
+            _row("b", "Python developer intern", "Built internal tools", tags=["python", "react"]),
+            _row("c", "Python tutor", "Evening classes", status=ClaimStatus.pending),
+            _row("d", "Field Officer", "ශ්‍රී ලංකා ග්‍රාමීය සමීක්ෂණ", score=40),
+        ],
+    )
+    db.commit()
+
+    assert _ids(search_claims(db, "pyth")) == ["b", "a"]
+    assert _ids(search_claims(db, "python jaff")) == ["a"]
+    assert _ids(search_claims(db, "ලංකා")) == ["d"]
+    assert set(_ids(search_claims(db, "python", statuses=[ClaimStatus.verified, ClaimStatus.pending]))) == {"a", "b", "c"}
+    assert _ids(search_claims(db, "field ශ්‍රී", min_score=50)) == []
+    assert search_claims(db, "  ,. ") == []
+
+    claim = db.get(ExperienceClaim, "a")
+    claim.description = "Ran first aid workshops"
+    db.commit()
+    assert _ids(search_claims(db, "python")) == ["b"]
+    db.delete(db.get(ExperienceClaim, "b"))
+    db.commit()
+    assert search_claims(db, "python") == []
+
+    before = [_ids(search_claims(db, q)) for q in ("first", "officer", "ලංකා")]
+    with engine.begin() as conn:
+        rebuild_search_index(conn)
+    assert [_ids(search_claims(db, q)) for q in ("first", "officer", "ලංකා")] == before
+
+
+def test_endpoint_pages_by_rank_and_restricts_statuses(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pages.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        rows = [_row(f"c{i:02d}", "Tea estate supervisor" if i % 3 else "Supervisor", "Tea " * (i % 5 + 1)) for i in range(25)]
+        conn.execute(insert(ExperienceClaim), rows + [_row("draft", "Tea taster", "Tea", status=ClaimStatus.draft)])
+    employer = User(id="e1", email="e@x.lk", password_hash="x", full_name="E", role=UserRole.employer)
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        seen, cursor = [], None
+        async with Session() as db:
+            while True:
+                response = Response()
+                page = await search_endpoint(
+                    response, q="tea", claim_status=[ClaimStatus.verified], min_score=None, max_score=None,
+                    limit=7, cursor=cursor, current_user=employer, db=db,
+                )
+                seen += [claim.id for claim in page]
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if cursor is None:
+                    break
+            assert len(seen) == len(set(seen)) == 25
+            assert seen == _ids(_search_once(url, "tea", 25))
+
+            with pytest.raises(HTTPException) as forbidden:
+                await search_endpoint(
+                    Response(), q="tea", claim_status=[ClaimStatus.draft], min_score=None, max_score=None,
+                    limit=7, cursor=None, current_user=employer, db=db,
+                )
+            assert forbidden.value.status_code == 403
+            with pytest.raises(HTTPException) as bad_cursor:
+                await search_endpoint(
+                    Response(), q="tea", claim_status=[ClaimStatus.verified], min_score=None, max_score=None,
+                    limit=7, cursor="not-a-cursor", current_user=employer, db=db,
+                )
+            assert bad_cursor.value.status_code == 400
+        await async_engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_candidate_window_counts_only_eligible_claims():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    # The verified match is the oldest; newer drafts and low scores must not push it out of the window
+    db.execute(
+        insert(ExperienceClaim),
+        [_row("old", "Tea maker", "Tea")]
+        + [_row(f"draft{i}", "Tea maker", "Tea", status=ClaimStatus.draft) for i in range(3)]
+        + [_row(f"low{i}", "Tea maker", "Tea", score=10) for i in range(3)],
+    )
+    db.commit()
+    assert _ids(search_claims(db, "tea", min_score=50, max_candidates=2)) == ["old"]
+    assert len(search_claims(db, "tea", max_candidates=2)) == 2
+
+    claim, _ = search_claims(db, "tea", min_score=50)[0]
+    assert "evidence" not in claim.__dict__
+    out = ClaimSearchResultOut.model_validate(claim).model_dump()
+    assert out["id"] == "old" and "supervisor_contact" not in out and "evidence" not in out
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import date
+
+from fastapi import Response
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.endpoints.search import router as search_router, skill_claims, skill_facets
+from app.db import Base, async_database_url
+from app.models import ClaimSkillTag, ClaimStatus, ExperienceClaim, SkillTag, User, UserRole, VerificationOutcome
+from app.pagination import NEXT_CURSOR_HEADER
+from app.repositories.claims import bulk_create_claims, create_claim, update_claim
+from app.repositories.verifications import create_verification
+from app.schemas.models import (
+    BulkVerificationDecision,
+    ClaimSearchResultOut,
+    ExperienceClaimCreate,
+    ExperienceClaimUpdate,
+    VerificationDecision,
+)
+from app.services.decisions import decide_bulk
+from app.services.skill_tags import install_listener, normalize_tag, normalize_tags, rebuild_skill_tags
+
+
+def test_normalization_folds_case_whitespace_and_aliases():
+    assert normalize_tag("  Python ") == normalize_tag("PYTHON3") == "python"
+    assert normalize_tag("පයිතන්") == normalize_tag("பைதான்") == "python"
+    assert normalize_tag("First-Aid") == normalize_tag("ප්‍රථමාධාර") == normalize_tag("ප්රථමාධාර") == "first aid"
+    assert normalize_tag("Customer   Care") == "customer service"
+    assert normalize_tag("Ｄata  Entry;") == "data entry"
+    assert normalize_tag(" ,; ") is None
+    assert normalize_tags(["React.js", "reactjs", "தமிழ்", "Tamil", ""]) == ["react", "tamil"]
+
+
+def _payload(tags: list[str]) -> ExperienceClaimCreate:
+    return ExperienceClaimCreate(
+        title="Volunteer Coordinator",
+        claim_type="volunteering",
+        organization_name="Sarvodaya",
+        supervisor_name="S",
+        supervisor_contact="s@org.lk",
+        start_date=date(2023, 1, 1),
+        end_date=date(2023, 6, 1),
+        description="Coordinated volunteers",
+        skill_tags=tags,
+    )
+
+
+def _counts(db) -> dict[str, int]:
+    return dict(db.execute(select(SkillTag.name, SkillTag.verified_claims).order_by(SkillTag.name)).all())
+
+
+def test_counts_follow_writes_and_back_the_facet_endpoints(tmp_path):
+    install_listener()
+    url = f"sqlite:///{tmp_path / 'tags.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    a = create_claim(db, "u1", _payload(["Coordination", "Excel"]))
+    b = create_claim(db, "u2", _payload(["සම්බන්ධීකරණය", "first aid"]))
+    imported = bulk_create_claims(db, [("u3", _payload(["coordination"])), ("u4", _payload(["Python"]))])
+    db.commit()
+    assert _counts(db) == {"coordination": 0, "excel": 0, "first aid": 0, "python": 0}
+
+    create_verification(db, a, "v1", VerificationDecision(outcome=VerificationOutcome.approved))
+    for claim_id in (b.id, *imported):
+        db.get(ExperienceClaim, claim_id).status = ClaimStatus.pending
+    db.commit()
+    decide_bulk(
+        db,
+        User(id="v1", role=UserRole.verifier),
+        [
+            BulkVerificationDecision(claim_id=b.id, outcome=VerificationOutcome.approved),
+            BulkVerificationDecision(claim_id=imported[0], outcome=VerificationOutcome.approved),
+            BulkVerificationDecision(claim_id=imported[1], outcome=VerificationOutcome.rejected),
+        ],
+    )
+    db.expire_all()
+    assert _counts(db) == {"coordination": 3, "excel": 1, "first aid": 1, "python": 0}
+
+    # Retagging a verified claim moves its count; leaving verified removes it
+    update_claim(db, db.get(ExperienceClaim, a.id), ExperienceClaimUpdate(skill_tags=["ඉගැන්වීම", "coordination"]))
+    db.get(ExperienceClaim, b.id).status = ClaimStatus.disputed
+    db.commit()
+    expected = {"coordination": 2, "excel": 0, "first aid": 0, "python": 0, "teaching": 1}
+    assert _counts(db) == expected
+
+    with engine.begin() as conn:
+        assert rebuild_skill_tags(conn, chunk_size=1) == 4
+    db.expire_all()
+    assert _counts(db) == {tag: n for tag, n in expected.items() if tag != "excel"}
+
+    employer = User(id="e1", email="e@x.lk", password_hash="x", full_name="E", role=UserRole.employer)
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        async with Session() as session:
+            facets = await skill_facets(prefix=None, limit=10, current_user=employer, db=session)
+            assert [(f.tag, f.verified_claims) for f in facets] == [("coordination", 2), ("teaching", 1)]
+            assert [f.tag for f in await skill_facets(prefix="Co", limit=10, current_user=employer, db=session)] == ["coordination"]
+
+            seen, cursor = [], None
+            while True:
+                response = Response()
+                page = await skill_claims("සම්බන්ධීකරණය", response, limit=1, cursor=cursor, current_user=employer, db=session)
+                assert all("evidence" not in claim.__dict__ for claim in page)
+                seen += [claim.id for claim in page]
+                cursor = response.headers.get(NEXT_CURSOR_HEADER)
+                if cursor is None:
+                    break
+            assert sorted(seen) == sorted([a.id, imported[0]])
+        await async_engine.dispose()
+
+    asyncio.run(scenario())
+    route = next(route for route in search_router.routes if route.path == "/skills/{tag}/claims")
+    assert route.response_model == list[ClaimSearchResultOut]
+
+    # Deleting a verified claim releases its counts and links; deleting an unverified one changes no count
+    verified, draft = create_claim(db, "u5", _payload(["Python"])), create_claim(db, "u6", _payload(["Python"]))
+    verified.status = ClaimStatus.verified
+    db.commit()
+    assert _counts(db)["python"] == 1
+    db.delete(verified)
+    db.delete(draft)
+    db.commit()
+    assert _counts(db)["python"] == 0
+    assert not db.scalars(select(ClaimSkillTag).where(ClaimSkillTag.claim_id.in_([verified.id, draft.id]))).all()
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.endpoints.auth import logout, refresh
+from app.db import Base, async_database_url
+from app.dependencies import _token_subject
+from app.models import RevokedToken, User, UserRole
+from app.schemas.models import RefreshRequest
+from app.security import create_refresh_token, decode_refresh_token
+from app.services.revocation import RevocationStore, revocations
+
+
+def test_refresh_rotates_and_rejects_replays(tmp_path):
+    url = f"sqlite:///{tmp_path / 'refresh.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(id="u-refresh", email="r@x.lk", password_hash="x", full_name="R", role=UserRole.candidate))
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        statements = []
+        event.listen(async_engine.sync_engine, "before_cursor_execute", lambda conn, cur, stmt, *a: statements.append(stmt))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        first = create_refresh_token("u-refresh", "candidate")
+        async with Session() as db:
+            rotated = await refresh(RefreshRequest(refresh_token=first), db)
+        # Rotation only inserts the jti: revoked_tokens is written (and pruned) but never read
+        assert "INSERT" in {s.split()[0] for s in statements if "revoked_tokens" in s}
+        assert not any(s.startswith("SELECT") and "revoked_tokens" in s for s in statements)
+        assert rotated.role == "candidate" and rotated.refresh_token != first
+
+        rejected = revocations.stats()["reuse_rejected"]
+        async with Session() as db:
+            with pytest.raises(HTTPException) as replay:
+                await refresh(RefreshRequest(refresh_token=first), db)
+        assert replay.value.status_code == 401
+        assert revocations.stats()["reuse_rejected"] == rejected + 1
+
+        # Another worker, with no state of its own, is stopped by the table
+        payload = decode_refresh_token(first)
+        other_worker = RevocationStore(prune_seconds=3600)
+        async with Session() as db:
+            assert await other_worker.revoke(db, payload["jti"], "u-refresh", payload["exp"]) is False
+
+        async with Session() as db:
+            await logout(RefreshRequest(refresh_token=rotated.refresh_token), db)
+            with pytest.raises(HTTPException):
+                await refresh(RefreshRequest(refresh_token=rotated.refresh_token), db)
+        await async_engine.dispose()
+
+    asyncio.run(scenario())
+
+    with pytest.raises(HTTPException):
+        _token_subject(create_refresh_token("u-refresh", "candidate"))
+
+
+def test_expired_jtis_are_pruned_once_per_period(tmp_path):
+    url = f"sqlite:///{tmp_path / 'prune.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    now = int(time.time())
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(id="u-prune", email="p@x.lk", password_hash="x", full_name="P", role=UserRole.candidate))
+        conn.execute(RevokedToken.__table__.insert().values(jti="old", user_id="u-prune", expires_at=datetime.utcfromtimestamp(now - 60)))
+
+    async def scenario():
+        async_engine = create_async_engine(async_database_url(url))
+        Session = async_sessionmaker(async_engine, expire_on_commit=False)
+        store = RevocationStore(prune_seconds=3600)
+        async with Session() as db:
+            assert await store.revoke(db, "a", "u-prune", now + 60)
+            assert await store.revoke(db, "b", "u-prune", now + 60)
+            jtis = set(await db.scalars(select(RevokedToken.jti)))
+        await async_engine.dispose()
+        return jtis
+
+    assert asyncio.run(scenario()) == {"a", "b"}
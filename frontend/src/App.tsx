@@ -1,6 +1,7 @@
 import { useEffect, useMemo, useState } from 'react'
 import {
   createClaim,
+  createReportLink,
   decideVerification,
   fetchReport,
   getClaims,
@@ -10,7 +11,7 @@ import {
   requestVerification,
 } from './api'
 import { getAuditLogs, getDisputes, getOrgs, verifyOrg, decideDispute } from './adminApi'
-import type { Claim, Role, OrgRecord, Dispute, AuditEntry } from './types'
+import type { Claim, Role, OrgRecord, Dispute, AuditEntry, ReportLink } from './types'
 import './App.css'
 
 const defaultClaim = {
@@ -30,7 +31,8 @@ function App() {
   const [role, setRole] = useState<Role>(() => (localStorage.getItem('role') as Role) || 'candidate')
   const [claims, setClaims] = useState<Claim[]>([])
   const [inbox, setInbox] = useState<Claim[]>([])
-  const [reportId, setReportId] = useState('')
+  const [reportLinks, setReportLinks] = useState<Record<string, ReportLink>>({})
+  const [reportToken, setReportToken] = useState('')
   const [report, setReport] = useState<Claim | null>(null)
   const [message, setMessage] = useState('')
   const [loading, setLoading] = useState(false)
@@ -139,6 +141,17 @@ function App() {
     }
   }
 
+  const handleShareReport = async (id: string) => {
+    if (!token) return
+    try {
+      const link = await createReportLink(token, id)
+      setReportLinks((links) => ({ ...links, [id]: link }))
+      setMessage('Report token created')
+    } catch (err: any) {
+      setMessage(err.message || 'Share failed')
+    }
+  }
+
   const handleDecision = async (id: string, outcome: 'approved' | 'rejected') => {
     if (!token) return
     try {
@@ -179,7 +192,7 @@ function App() {
   const handleFetchReport = async () => {
     try {
       setLoading(true)
-      const data = await fetchReport(token, reportId)
+      const data = await fetchReport(reportToken.trim())
       setReport(data)
       setMessage('')
     } catch (err: any) {
@@ -197,6 +210,7 @@ function App() {
     setClaims([])
     setInbox([])
     setReport(null)
+    setReportLinks({})
     setShowAuthOverlay(true)
   }
 
@@ -398,10 +412,19 @@ function App() {
                   <div className="claim-meta">
                     <span className={`status ${claim.status}`}>{claim.status}</span>
                     {claim.credibility_score != null && <span className="score-chip">{claim.credibility_score}</span>}
-                    {claim.status === 'draft' && (
+                    {(claim.status === 'draft' || claim.status === 'rejected') && (
                       <button className="cta ghost tiny" onClick={() => handleRequestVerification(claim.id)}>Request verification</button>
                     )}
+                    {claim.status === 'verified' && (
+                      <button className="cta ghost tiny" onClick={() => handleShareReport(claim.id)}>Share report</button>
+                    )}
                   </div>
+                  {reportLinks[claim.id] && (
+                    <p className="muted">
+                      Report token (expires {new Date(reportLinks[claim.id].expires_at).toLocaleDateString()}):{' '}
+                      <code>{reportLinks[claim.id].token}</code>
+                    </p>
+                  )}
                 </div>
               ))}
               {claims.length === 0 && <p className="muted">No claims yet.</p>}
@@ -448,8 +471,8 @@ function App() {
             </div>
             <div className="form-grid">
               <label className="field">
-                <span>Report token (claim id for now)</span>
-                <input value={reportId} onChange={(e) => setReportId(e.target.value)} placeholder="claim id or token" />
+                <span>Report token</span>
+                <input value={reportToken} onChange={(e) => setReportToken(e.target.value)} placeholder="token shared by the candidate" />
               </label>
             </div>
             {report && (
@@ -1,4 +1,4 @@
-import type { Claim, VerificationDecision } from './types'
+import type { Claim, ReportLink, VerificationDecision } from './types'
 
 const API_BASE = import.meta.env.VITE_API_BASE || 'http://127.0.0.1:8000/api/v1'
 
@@ -87,10 +87,17 @@ export async function decideVerification(token: string, claimId: string, decisio
   return res.json()
 }
 
-export async function fetchReport(token: string | null, reportToken: string) {
-  const res = await fetch(`${API_BASE}/reports/${reportToken}`, {
-    headers: authHeaders(token || undefined),
+export async function createReportLink(token: string, claimId: string) {
+  const res = await fetch(`${API_BASE}/claims/${claimId}/report-link`, {
+    method: 'POST',
+    headers: authHeaders(token),
   })
   if (!res.ok) throw new Error(await res.text())
+  return res.json() as Promise<ReportLink>
+}
+
+export async function fetchReport(reportToken: string) {
+  const res = await fetch(`${API_BASE}/reports/${encodeURIComponent(reportToken)}`)
+  if (!res.ok) throw new Error(await res.text())
   return res.json() as Promise<Claim>
 }
@@ -20,6 +20,11 @@ export type Claim = {
   updated_at: string
 }
 
+export type ReportLink = {
+  token: string
+  expires_at: string
+}
+
 export type VerificationDecision = {
   outcome: 'approved' | 'rejected'
   notes?: string
@@ -28,6 +28,11 @@ if (-not $SkipInstall) {
     Pop-Location
 }
 
+Write-Host "Bootstrapping database..." -ForegroundColor Yellow
+Push-Location $backend
+& $venvPython -m app.cli bootstrap
+Pop-Location
+
 $backendCmd = "cd `"$backend`"; & `"$venvPython`" -m uvicorn app.main:app --reload"
 $frontendCmd = "cd `"$frontend`"; npm run dev"
 
@@ -20,6 +20,9 @@ if [ "$1" != "--skip-install" ]; then
   (cd "$FRONTEND" && npm install)
 fi
 
+echo "Bootstrapping database..."
+(cd "$BACKEND" && "$VENV/bin/python" -m app.cli bootstrap)
+
 echo "Launching backend..."
 (cd "$BACKEND" && "$VENV/bin/python" -m uvicorn app.main:app --reload) &
 BACK_PID=$!